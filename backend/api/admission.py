@@ -0,0 +1,123 @@
+# backend/api/admission.py
+"""무거운 엔드포인트 승인 제어 (동시 실행 수 + 토큰 버킷)
+
+/admin/init, /admin/backfill, /admin/discover, /feeds/import-opml 처럼 수 분씩
+워커를 점유하는 요청이 재시도/중복 클릭으로 쌓이지 않도록 엔드포인트별로
+- 동시 실행 수 상한
+- 토큰 버킷 요청 빈도 상한
+을 적용하고, 초과 시 429 + Retry-After로 즉시 거절합니다.
+
+읽기 엔드포인트(/stats, /feeds 등)는 이 경로를 거치지 않습니다. 무거운 작업 전체의
+동시 실행 수를 ADMISSION_HEAVY_MAX_CONCURRENT로 묶어 스레드풀(API_THREADPOOL_SIZE)의
+나머지를 항상 읽기 요청용으로 남겨 둡니다 (priority lane).
+
+Note: 상태는 프로세스 단위입니다. uvicorn 워커가 여러 개면 워커별로 적용됩니다.
+"""
+import math
+import time
+from typing import Dict, Optional
+
+from fastapi import HTTPException, status
+
+from backend.core.config import (
+    ADMISSION_ENABLED, ADMISSION_LIMITS, ADMISSION_HEAVY_MAX_CONCURRENT, ADMISSION_BUSY_RETRY_AFTER
+)
+from backend.core.metrics import ADMISSION_REJECTED, HEAVY_IN_FLIGHT
+
+
+class TokenBucket:
+    """분당 rate_per_min 개씩 채워지는 최대 burst 개 토큰"""
+
+    def __init__(self, rate_per_min: float, burst: int):
+        self.rate = rate_per_min / 60.0
+        self.capacity = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self) -> float:
+        """토큰 1개를 쓸 수 있을 때까지 남은 시간(초), 지금 가능하면 0"""
+        self._refill()
+        if self.tokens >= 1:
+            return 0.0
+        if self.rate <= 0:
+            return float(ADMISSION_BUSY_RETRY_AFTER)
+        return (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+class AdmissionController:
+    """엔드포인트별 승인 상태 (이벤트 루프에서만 접근 — await 없이 검사/증가하므로 락 불필요)"""
+
+    def __init__(self, limits: Dict[str, Dict[str, float]], heavy_max: int):
+        self.limits = limits
+        self.heavy_max = heavy_max
+        self.buckets = {
+            name: TokenBucket(cfg["rate_per_min"], int(cfg["burst"])) for name, cfg in limits.items()
+        }
+        self.running: Dict[str, int] = {name: 0 for name in limits}
+        self.heavy_running = 0
+
+    def _reject(self, name: str, reason: str, retry_after: float) -> HTTPException:
+        ADMISSION_REJECTED.inc(endpoint=name, reason=reason)
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"요청이 많습니다 ({name}: {reason}). 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+    def acquire(self, name: str) -> None:
+        """승인 — 실패 시 429 HTTPException"""
+        cfg = self.limits[name]
+        if self.running[name] >= cfg["concurrency"]:
+            raise self._reject(name, "concurrency", ADMISSION_BUSY_RETRY_AFTER)
+        if self.heavy_running >= self.heavy_max:
+            raise self._reject(name, "heavy_total", ADMISSION_BUSY_RETRY_AFTER)
+        wait = self.buckets[name].wait_time()
+        if wait > 0:
+            raise self._reject(name, "rate", wait)
+        self.buckets[name].take()
+        self.running[name] += 1
+        self.heavy_running += 1
+        HEAVY_IN_FLIGHT.inc(endpoint=name)
+
+    def release(self, name: str) -> None:
+        self.running[name] -= 1
+        self.heavy_running -= 1
+        HEAVY_IN_FLIGHT.dec(endpoint=name)
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_controller() -> AdmissionController:
+    """프로세스 전역 AdmissionController"""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController(ADMISSION_LIMITS, ADMISSION_HEAVY_MAX_CONCURRENT)
+    return _controller
+
+
+def admission(name: str):
+    """라우트 의존성 생성 — @router.post(..., dependencies=[Depends(admission("init"))])"""
+    if name not in ADMISSION_LIMITS:
+        raise ValueError(f"ADMISSION_LIMITS에 없는 엔드포인트: {name}")
+
+    async def _admit():
+        if not ADMISSION_ENABLED:
+            yield
+            return
+        controller = get_controller()
+        controller.acquire(name)
+        try:
+            yield
+        finally:
+            controller.release(name)
+
+    return _admit
@@ -4,10 +4,17 @@
 FastAPI의 Depends를 위한 래퍼 함수들.
 실제 객체 생성은 backend.core.container.Container에서 담당합니다.
 """
+from fastapi import Depends
+
 from backend.core.container import Container
-from backend.repositories import FeedRepository, EntryRepository
+from backend.repositories import FeedRepository, EntryRepository, CrawlRunRepository
 from backend.services.crawler_service import CrawlerService
 from backend.services.feed_service import FeedService
+from backend.services.digest_service import DigestService
+from backend.services.query_service import QueryService
+from backend.services.retention_service import RetentionService
+from backend.services.index_service import IndexService
+from backend.services.reader_maintenance_service import ReaderMaintenanceService
 
 
 def get_feed_repository() -> FeedRepository:
@@ -20,15 +27,45 @@ def get_entry_repository() -> EntryRepository:
     return Container.get_entry_repository()
 
 
+def get_run_repository() -> CrawlRunRepository:
+    """CrawlRunRepository 인스턴스 반환 (FastAPI Depends용)"""
+    return Container.get_run_repository()
+
+
 def get_crawler_service(
-    feed_repo: FeedRepository | None = None,
-    entry_repo: EntryRepository | None = None,
+    feed_repo: FeedRepository = Depends(get_feed_repository),
+    entry_repo: EntryRepository = Depends(get_entry_repository),
+    run_repo: CrawlRunRepository = Depends(get_run_repository),
 ) -> CrawlerService:
     """CrawlerService 인스턴스 반환 (FastAPI Depends용)"""
-    return Container.get_crawler_service(feed_repo=feed_repo, entry_repo=entry_repo)
+    return Container.get_crawler_service(feed_repo=feed_repo, entry_repo=entry_repo, run_repo=run_repo)
 
 
-def get_feed_service(feed_repo: FeedRepository | None = None) -> FeedService:
+def get_feed_service(feed_repo: FeedRepository = Depends(get_feed_repository)) -> FeedService:
     """FeedService 인스턴스 반환 (FastAPI Depends용)"""
     return Container.get_feed_service(feed_repo=feed_repo)
 
+
+def get_digest_service() -> DigestService:
+    """DigestService 인스턴스 반환 (FastAPI Depends용)"""
+    return Container.get_digest_service()
+
+
+def get_query_service() -> QueryService:
+    """QueryService(async 읽기 경로) 인스턴스 반환 (FastAPI Depends용)"""
+    return Container.get_query_service()
+
+
+def get_retention_service() -> RetentionService:
+    """RetentionService 인스턴스 반환 (FastAPI Depends용)"""
+    return Container.get_retention_service()
+
+
+def get_index_service() -> IndexService:
+    """IndexService 인스턴스 반환 (FastAPI Depends용)"""
+    return Container.get_index_service()
+
+
+def get_reader_maintenance_service() -> ReaderMaintenanceService:
+    """ReaderMaintenanceService 인스턴스 반환 (FastAPI Depends용)"""
+    return Container.get_reader_maintenance_service()
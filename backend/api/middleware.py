@@ -0,0 +1,55 @@
+# backend/api/middleware.py
+"""ASGI 미들웨어"""
+import time
+from typing import Tuple
+
+from backend.core.metrics import HTTP_REQUEST_DURATION
+
+
+class MetricsMiddleware:
+    """라우트별 요청 지연시간 기록 (순수 ASGI — BaseHTTPMiddleware의 태스크/스트림 오버헤드 없음)
+
+    라벨은 실제 경로가 아닌 라우트 템플릿(/api/v1/feeds/{url:path})을 사용해
+    카디널리티를 고정합니다. 매칭되지 않은 요청은 "<unmatched>"로 묶습니다.
+    FastAPI 버전에 따라 include_router 라우트의 path에 prefix가 빠져 있으므로
+    prefixes로 보정합니다 (레거시 /feeds와 /api/v1/feeds 구분).
+    """
+
+    def __init__(self, app, prefixes: Tuple[str, ...] = ()):
+        self.app = app
+        self.prefixes = prefixes
+
+    def _route_label(self, scope) -> str:
+        route = scope.get("route")
+        path = getattr(route, "path", None)
+        if path is None:
+            return "<unmatched>"
+        for prefix in self.prefixes:
+            if scope["path"].startswith(prefix) and not path.startswith(prefix):
+                return prefix + path
+        return path
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # 라우터가 매칭 후 scope에 route를 채워 넣음
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=self._route_label(scope),
+                status=str(status_code),
+            )
@@ -0,0 +1,165 @@
+# backend/api/responses.py
+"""대용량 응답용 직렬화/압축 헬퍼
+
+- FastJSONResponse: response_model 검증을 거치지 않고 orjson으로 바로 직렬화
+  (서비스 계층이 이미 스키마 형태의 dict를 만드는 경로에서만 사용)
+- compressed_response: Accept-Encoding에 따라 br > gzip 순으로 압축
+- cached_file_response: 디스크에 캐시된 파일을 ETag(304)와 함께 청크 스트리밍
+orjson/brotli는 선택 의존성이며, 없으면 표준 json/gzip으로 동작합니다.
+"""
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, Optional
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+from backend.core.config import COMPRESS_MIN_BYTES
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 선택 의존성
+    brotli = None
+
+
+def _default(o: Any):
+    if isinstance(o, (datetime, date)):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """dict/list → JSON bytes (orjson 우선)"""
+    if orjson is not None:
+        return orjson.dumps(content, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def _pick_encoding(request: Optional[Request]) -> Optional[str]:
+    if request is None:
+        return None
+    accept = request.headers.get("accept-encoding", "").lower()
+    if brotli is not None and "br" in accept:
+        return "br"
+    if "gzip" in accept:
+        return "gzip"
+    return None
+
+
+def compressed_response(
+    request: Optional[Request],
+    body: bytes,
+    media_type: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """COMPRESS_MIN_BYTES 이상이면 클라이언트가 지원하는 방식으로 압축한 Response 반환"""
+    headers = dict(headers or {})
+    encoding = _pick_encoding(request) if len(body) >= COMPRESS_MIN_BYTES else None
+    if encoding == "br":
+        body = brotli.compress(body, quality=5)
+    elif encoding == "gzip":
+        body = gzip.compress(body, compresslevel=6)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+        headers["Vary"] = "Accept-Encoding"
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+class FastJSONResponse(Response):
+    """검증 없이 orjson으로 직렬화하는 JSON 응답"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json(request: Optional[Request], content: Any) -> Response:
+    """fast path JSON 응답 (직렬화 + 필요 시 압축)"""
+    return compressed_response(request, dumps(content), FastJSONResponse.media_type)
+
+
+# 캐시 파일 스트리밍 시 한 번에 보내는 크기
+FILE_CHUNK_SIZE = 64 * 1024
+
+
+def _file_chunks(f: BinaryIO) -> Iterator[bytes]:
+    with f:
+        yield from iter(lambda: f.read(FILE_CHUNK_SIZE), b"")
+
+
+def _compressed_copy(src: BinaryIO, path: Path, encoding: str) -> BinaryIO:
+    """압축본(path.gz / path.br)을 파일 옆에 한 번만 만들어 재사용 — 열린 핸들 반환
+
+    동시 렌더링끼리 겹치지 않도록 임시 파일은 mkstemp로 만들고,
+    교체 직후 다른 요청의 정리(unlink)에 지워져도 읽을 수 있게 열린 핸들을 넘깁니다.
+    """
+    target = path.with_name(f"{path.name}.{'br' if encoding == 'br' else 'gz'}")
+    try:
+        return open(target, "rb")
+    except FileNotFoundError:
+        pass
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    dst = os.fdopen(fd, "w+b")
+    try:
+        if encoding == "br":
+            c = brotli.Compressor(quality=5)
+            for chunk in iter(lambda: src.read(FILE_CHUNK_SIZE), b""):
+                dst.write(c.process(chunk))
+            dst.write(c.finish())
+        else:
+            with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6, mtime=0) as gz:
+                shutil.copyfileobj(src, gz, FILE_CHUNK_SIZE)
+        dst.flush()
+        os.replace(tmp, target)
+    except BaseException:
+        dst.close()
+        Path(tmp).unlink(missing_ok=True)
+        raise
+    dst.seek(0)
+    return dst
+
+
+def _etag_matches(request: Optional[Request], etag: str) -> bool:
+    if request is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    # 약한 비교 (W/ 접두사 무시)
+    tags = {t.strip().removeprefix("W/") for t in header.split(",")}
+    return "*" in tags or f'"{etag}"' in tags
+
+
+def cached_file_response(
+    request: Optional[Request],
+    path: Path,
+    media_type: str,
+    etag: str,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """캐시 파일을 chunked로 스트리밍 (If-None-Match가 맞으면 본문 없이 304)"""
+    headers = {**(headers or {}), "ETag": f'W/"{etag}"', "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    # 응답을 돌려주기 전에 열어 둠 — 스트리밍 중 이전 지문 정리로 파일이 지워져도 끝까지 전송
+    f = open(path, "rb")
+    try:
+        encoding = _pick_encoding(request) if os.fstat(f.fileno()).st_size >= COMPRESS_MIN_BYTES else None
+        if encoding:
+            with f:
+                f = _compressed_copy(f, path, encoding)
+            headers["Content-Encoding"] = encoding
+    except BaseException:
+        f.close()
+        raise
+    return StreamingResponse(_file_chunks(f), media_type=media_type, headers=headers)
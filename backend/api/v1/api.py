@@ -2,7 +2,7 @@
 """API v1 라우터 통합"""
 from fastapi import APIRouter
 
-from backend.api.v1.endpoints import feeds, sync, admin, blacklist
+from backend.api.v1.endpoints import feeds, sync, admin, blacklist, digest, entries
 
 api_router = APIRouter()
 
@@ -10,4 +10,6 @@ api_router.include_router(feeds.router)
 api_router.include_router(sync.router)
 api_router.include_router(admin.router)
 api_router.include_router(blacklist.router)
+api_router.include_router(digest.router)
+api_router.include_router(entries.router)
 
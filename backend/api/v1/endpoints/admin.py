@@ -1,14 +1,28 @@
 # backend/api/v1/endpoints/admin.py
 """관리자 API 엔드포인트 (초기화, 업데이트, 통계 등)"""
 from datetime import datetime, timezone
-from fastapi import APIRouter, Query, BackgroundTasks, status, Depends
+from fastapi import APIRouter, Query, BackgroundTasks, status, Depends, Request, HTTPException
+from fastapi.responses import FileResponse
 from typing import Optional
 
 from backend.services.crawler_service import CrawlerService
 from backend.services.feed_service import FeedService
-from backend.api.deps import get_crawler_service, get_feed_service
+from backend.services.query_service import QueryService
+from backend.services.retention_service import RetentionService
+from backend.services.index_service import IndexService
+from backend.services.reader_maintenance_service import ReaderMaintenanceService
+from backend.api.admission import admission
+from backend.api.deps import (
+    get_crawler_service, get_feed_service, get_query_service, get_retention_service, get_index_service,
+    get_reader_maintenance_service,
+)
+from backend.api.responses import fast_json
+from backend.core.config import FAST_JSON_DEFAULT, FEED_VALIDATION_ENABLED, STATS_MAX_DAYS
+from backend.core.metrics import tracked_job
+from backend.utils.profiling import new_run_id
 from backend.schemas.common import (
-    HealthResponse, InitResponse, UpdateResponse, DiscoverRequest, DiscoverResponse
+    HealthResponse, InitResponse, UpdateResponse, DiscoverRequest, DiscoverResponse,
+    CrawlRunResponse, CrawlRunListResponse
 )
 from backend.schemas.entry import StatsResponse
 
@@ -21,7 +35,7 @@ def health():
     return {"ok": True}
 
 
-@router.post("/init", response_model=InitResponse, summary="초기화")
+@router.post("/init", response_model=InitResponse, summary="초기화", dependencies=[Depends(admission("init"))])
 def init(service: CrawlerService = Depends(get_crawler_service)):
     """MongoDB에서 활성화된 피드를 Reader에 등록하고 업데이트"""
     return service.init_feeds()
@@ -30,6 +44,8 @@ def init(service: CrawlerService = Depends(get_crawler_service)):
 @router.post("/update", status_code=status.HTTP_202_ACCEPTED, response_model=UpdateResponse, summary="피드 업데이트")
 async def update(
     days: int = Query(1, ge=0),
+    profile: Optional[str] = Query(None, pattern="^(cpu|mem)$", description="단계별 프로파일링 (cpu|mem)"),
+    trigger: str = Query("api", pattern="^(api|dag)$", description="실행 이력(crawl_runs)의 트리거 구분"),
     background_tasks: BackgroundTasks = BackgroundTasks(),
     service: CrawlerService = Depends(get_crawler_service)
 ):
@@ -39,35 +55,145 @@ async def update(
     - days=0 이면 전체 미러링(=backfill)과 동일하게 동작
     - 기본 1일만 증분 미러링
     - 즉시 202 Accepted 응답 반환, 백그라운드에서 수집 수행
+    - profile=cpu|mem 이면 완료 후 /admin/profiles/{run_id}에서 아티팩트 다운로드
     """
     days_param = None if days == 0 else days
-    background_tasks.add_task(service.update_all, days=days_param)
+    run_id = new_run_id()
+    background_tasks.add_task(tracked_job(
+        "update_all", service.update_all, days=days_param, profile=profile, run_id=run_id, trigger=trigger
+    ))
     return {
         "status": "accepted",
         "message": f"피드 업데이트가 백그라운드에서 시작되었습니다 (days={days_param or 'all'})",
-        "days": days_param
+        "days": days_param,
+        "run_id": run_id,
+        "profile": profile,
     }
 
 
-@router.post("/discover", response_model=DiscoverResponse, summary="피드 발견")
+@router.get("/runs", response_model=CrawlRunListResponse, summary="실행 이력 조회")
+def list_runs(
+    trigger: Optional[str] = Query(None, pattern="^(api|cli|dag)$"),
+    status: Optional[str] = Query(None, pattern="^(running|success|failed)$"),
+    since: Optional[datetime] = Query(None, description="started_at 이상 (ISO 8601)"),
+    until: Optional[datetime] = Query(None, description="started_at 미만 (ISO 8601)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    service: CrawlerService = Depends(get_crawler_service)
+):
+    """update_all 실행 이력 (트리거/상태/기간 필터, 최신순) — 단계별 시간과 처리량 비교용"""
+    runs = service.list_runs(trigger=trigger, status=status, since=since, until=until, skip=skip, limit=limit)
+    return {"runs": runs}
+
+
+@router.get("/runs/{run_id}", response_model=CrawlRunResponse, summary="실행 이력 단건 조회")
+def get_run(
+    run_id: str,
+    service: CrawlerService = Depends(get_crawler_service)
+):
+    """실행 이력 단건 (프로파일 아티팩트 포함)"""
+    run = service.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail=f"실행 이력 없음: {run_id}")
+    return run
+
+
+@router.get("/profiles/{run_id}", summary="프로파일 아티팩트 목록")
+def list_profile_artifacts(
+    run_id: str,
+    service: CrawlerService = Depends(get_crawler_service)
+):
+    """실행(run_id)의 단계별 프로파일 아티팩트 목록"""
+    try:
+        artifacts = service.get_profile_artifacts(run_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not artifacts:
+        raise HTTPException(status_code=404, detail=f"프로파일 없음: {run_id}")
+    return {"run_id": run_id, "artifacts": artifacts}
+
+
+@router.get("/profiles/{run_id}/{name}", summary="프로파일 아티팩트 다운로드")
+def download_profile_artifact(
+    run_id: str,
+    name: str,
+    service: CrawlerService = Depends(get_crawler_service)
+):
+    """프로파일 아티팩트 다운로드 (.prof: pstats, .snapshot: tracemalloc, .txt: 요약)"""
+    try:
+        path = service.get_profile_artifact_path(run_id, name)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if path is None:
+        raise HTTPException(status_code=404, detail=f"아티팩트 없음: {run_id}/{name}")
+    media_type = "text/plain; charset=utf-8" if name.endswith(".txt") else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=name)
+
+
+@router.post(
+    "/discover", response_model=DiscoverResponse, summary="피드 발견", dependencies=[Depends(admission("discover"))]
+)
 def discover(
     body: DiscoverRequest,
     service: FeedService = Depends(get_feed_service)
 ):
     """URL에서 RSS 피드 발견 및 추가"""
-    return service.discover_feeds(body.url, top_k=body.top_k)
+    return service.discover_feeds(
+        body.url, top_k=body.top_k, refresh=body.refresh, validate=FEED_VALIDATION_ENABLED and not body.skip_validation
+    )
 
 
 @router.get("/stats", response_model=StatsResponse, summary="통계 조회")
-def get_stats(
-    days: int = Query(7, ge=1, le=90),
-    service: CrawlerService = Depends(get_crawler_service)
+async def get_stats(
+    request: Request,
+    days: int = Query(7, ge=1, le=STATS_MAX_DAYS),
+    fast: bool = Query(FAST_JSON_DEFAULT, description="검증 생략 + orjson 직렬화 fast path"),
+    service: QueryService = Depends(get_query_service)
 ):
     """통계 조회"""
-    return service.get_stats(days=days)
+    result = await service.get_stats(days=days)
+    if fast:
+        return fast_json(request, result)
+    return result
+
+
+@router.post("/archive", summary="오래된 엔트리 아카이브", dependencies=[Depends(admission("archive"))])
+def archive(
+    days: Optional[int] = Query(None, ge=1, description="보관 기간(일), 기본 ENTRY_RETENTION_DAYS"),
+    service: RetentionService = Depends(get_retention_service)
+):
+    """published가 보관 기간보다 오래된 엔트리를 entries_archive로 이동하고 롤업 갱신"""
+    return service.archive_entries(days=days)
+
+
+@router.post(
+    "/reader/maintenance", summary="Reader DB 정리", dependencies=[Depends(admission("reader_maintenance"))]
+)
+def reader_maintenance(
+    days: Optional[int] = Query(None, ge=1, description="이 기간(일)보다 오래된 엔트리 정리, 기본 READER_PRUNE_DAYS"),
+    dry_run: bool = Query(False, description="측정과 삭제 대상 집계만 (DB 변경 없음)"),
+    service: ReaderMaintenanceService = Depends(get_reader_maintenance_service)
+):
+    """MongoDB에 미러링된 오래된 Reader 엔트리 삭제 + incremental vacuum/ANALYZE, 전후 파일 크기/조회 시간 보고"""
+    return service.maintain(days=days, dry_run=dry_run)
+
+
+@router.get("/indexes", summary="인덱스 점검")
+def index_report(
+    explain: bool = Query(True, description="주요 조회 explain (queryPlanner, 조회는 실행하지 않음)"),
+    service: IndexService = Depends(get_index_service)
+):
+    """선언 인덱스와 실제 인덱스 비교(missing/changed/extra) + 주요 조회의 사용 인덱스, COLLSCAN 표시"""
+    return service.report(explain=explain)
+
+
+@router.post("/indexes/reconcile", summary="인덱스 조정", dependencies=[Depends(admission("indexes"))])
+def reconcile_indexes(service: IndexService = Depends(get_index_service)):
+    """없는 인덱스 생성, 키/옵션이 달라진 인덱스 재생성 (선언에 없는 인덱스는 그대로 둠)"""
+    return {"collections": service.reconcile()}
 
 
-@router.post("/backfill", summary="전체 백필")
+@router.post("/backfill", summary="전체 백필", dependencies=[Depends(admission("backfill"))])
 def backfill(
     days: Optional[int] = Query(None),
     service: CrawlerService = Depends(get_crawler_service)
@@ -76,7 +202,7 @@ def backfill(
     return service.mirror_entries_to_mongo(days=days)
 
 
-@router.post("/backfill_range", summary="기간별 백필")
+@router.post("/backfill_range", summary="기간별 백필", dependencies=[Depends(admission("backfill"))])
 def backfill_range(
     start: str = Query(..., description="YYYY-MM-DD"),
     end: Optional[str] = Query(None, description="YYYY-MM-DD"),
@@ -1,27 +1,47 @@
 # backend/api/v1/endpoints/blacklist.py
-"""블랙리스트 관리 API 엔드포인트"""
-from fastapi import APIRouter, Body
-from backend.core.config import BLACKLIST_FEEDS, BLACKLIST_DOMAINS
+"""블랙리스트 관리 API 엔드포인트
+
+변경 사항은 BLACKLIST_PATH 파일에 저장되고, 다른 프로세스(CLI/Airflow)도 파일 mtime 변경으로 다시 읽습니다.
+차단은 다음 sync_feeds_to_reader(Reader에서 제거)와 미러링(엔트리 저장 제외)부터 적용됩니다.
+"""
+from fastapi import APIRouter, Body, HTTPException, Query
+from backend.utils.blacklist import BlacklistMatcher, get_blacklist, get_store
 
 router = APIRouter(prefix="/blacklist", tags=["blacklist"])
 
 
+def _view(bl: BlacklistMatcher) -> dict:
+    return {"feeds": sorted(bl.urls), "domains": list(bl.domains)}
+
+
 @router.get("", summary="블랙리스트 조회")
 def list_blacklist():
     """블랙리스트 조회"""
-    return {"feeds": sorted(BLACKLIST_FEEDS), "domains": sorted(BLACKLIST_DOMAINS)}
+    return _view(get_blacklist())
 
 
 @router.post("/feeds", summary="피드 블랙리스트 추가")
-def add_blacklist_feed(url: str = Body(..., embed=True)):
-    """피드 블랙리스트 추가"""
-    BLACKLIST_FEEDS.add(url)
-    return {"ok": True, "feeds": sorted(BLACKLIST_FEEDS)}
+def add_blacklist_feed(url: str = Body(..., embed=True), reason: str | None = Body(None, embed=True)):
+    """피드 블랙리스트 추가 (정규화 URL 정확 일치)"""
+    return {"ok": True, **_view(get_store().add_url(url, reason=reason))}
+
+
+@router.delete("/feeds", summary="피드 블랙리스트 해제")
+def remove_blacklist_feed(url: str = Query(...)):
+    """피드 블랙리스트 해제"""
+    return {"ok": True, **_view(get_store().remove_url(url))}
 
 
 @router.post("/domains", summary="도메인 블랙리스트 추가")
 def add_blacklist_domain(domain: str = Body(..., embed=True)):
-    """도메인 블랙리스트 추가"""
-    BLACKLIST_DOMAINS.add(domain)
-    return {"ok": True, "domains": sorted(BLACKLIST_DOMAINS)}
+    """도메인 블랙리스트 추가 (하위 도메인 포함)"""
+    try:
+        return {"ok": True, **_view(get_store().add_domain(domain))}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
+@router.delete("/domains", summary="도메인 블랙리스트 해제")
+def remove_blacklist_domain(domain: str = Query(...)):
+    """도메인 블랙리스트 해제"""
+    return {"ok": True, **_view(get_store().remove_domain(domain))}
@@ -0,0 +1,34 @@
+# backend/api/v1/endpoints/digest.py
+"""요약(Digest) 입력 배치 API 엔드포인트"""
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Query, Depends, HTTPException
+
+from backend.services.digest_service import DigestService
+from backend.api.deps import get_digest_service
+
+router = APIRouter(prefix="/digest", tags=["digest"])
+
+
+@router.get("/inputs", summary="요약 입력 배치 조회")
+def get_digest_inputs(
+    unit: str = Query("day", description="day|week|month"),
+    start: date = Query(..., description="YYYY-MM-DD (기간 내 임의 날짜, 단위 시작으로 보정)"),
+    scope: str = Query("global", description="global|feed|domain"),
+    value: Optional[str] = Query(None, description="scope=feed면 feed_url, scope=domain이면 domain"),
+    max_entries: Optional[int] = Query(None, ge=1, le=5000),
+    token_budget: Optional[int] = Query(None, ge=100),
+    refresh: bool = Query(False, description="캐시 무시하고 재생성"),
+    service: DigestService = Depends(get_digest_service)
+):
+    """스코프/기간별 토큰 예산 내 요약 입력 배치 (도메인 다양성 우선, 캐시 사용)"""
+    try:
+        sc = service.make_scope(scope, value)
+        opts = {}
+        if max_entries is not None:
+            opts["max_entries"] = max_entries
+        if token_budget is not None:
+            opts["token_budget"] = token_budget
+        return service.build_input(sc, unit, start, use_cache=not refresh, **opts)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
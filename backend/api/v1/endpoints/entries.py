@@ -0,0 +1,52 @@
+# backend/api/v1/endpoints/entries.py
+"""엔트리 조회 API 엔드포인트 (async 읽기 경로)"""
+from datetime import date, datetime, time, timezone
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Depends, Request
+
+from backend.services.query_service import QueryService
+from backend.api.deps import get_query_service
+from backend.api.responses import fast_json
+from backend.core.config import FAST_JSON_DEFAULT
+from backend.schemas.entry import EntryDetailResponse, EntryListResponse
+
+router = APIRouter(prefix="/entries", tags=["entries"])
+
+
+def _utc_midnight(d: Optional[date]) -> Optional[datetime]:
+    return datetime.combine(d, time.min, tzinfo=timezone.utc) if d else None
+
+
+@router.get("", response_model=EntryListResponse, summary="엔트리 목록 조회")
+async def list_entries(
+    request: Request,
+    feed_url: Optional[str] = Query(None, description="피드 URL 필터"),
+    domain: Optional[str] = Query(None, description="도메인 필터"),
+    start: Optional[date] = Query(None, description="YYYY-MM-DD (포함, UTC)"),
+    end: Optional[date] = Query(None, description="YYYY-MM-DD (미포함, UTC)"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=500),
+    fast: bool = Query(FAST_JSON_DEFAULT, description="검증 생략 + orjson 직렬화 fast path"),
+    service: QueryService = Depends(get_query_service)
+):
+    """엔트리 목록 조회 (최신순)"""
+    result = await service.list_entries(
+        feed_url=feed_url, domain=domain,
+        start=_utc_midnight(start), end=_utc_midnight(end),
+        skip=skip, limit=limit,
+    )
+    if fast:
+        return fast_json(request, result)
+    return result
+
+
+@router.get("/detail", response_model=EntryDetailResponse, summary="엔트리 상세 조회 (본문 포함)")
+async def get_entry(
+    id: str = Query(..., description="엔트리 ID"),
+    service: QueryService = Depends(get_query_service)
+):
+    """엔트리 상세 조회 — compact 모드에서 entry_bodies로 분리된 summary/authors도 함께 로드"""
+    entry = await service.get_entry(id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"엔트리를 찾을 수 없습니다: {id}")
+    return entry
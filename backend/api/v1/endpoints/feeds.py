@@ -1,47 +1,92 @@
 # backend/api/v1/endpoints/feeds.py
 """피드 관리 API 엔드포인트"""
 from __future__ import annotations
-import tempfile
-from pathlib import Path
-from fastapi import APIRouter, UploadFile, File, Body, Query, Depends, HTTPException
+from typing import BinaryIO
+from fastapi import APIRouter, UploadFile, File, Body, Query, Depends, HTTPException, Request
 from fastapi.responses import Response
-import xml.etree.ElementTree as ET
+from starlette.concurrency import run_in_threadpool
 
 from backend.services.feed_service import FeedService
-from backend.api.deps import get_feed_service
+from backend.services.query_service import QueryService
+from backend.api.admission import admission
+from backend.api.deps import get_feed_service, get_query_service
+from backend.api.responses import cached_file_response, fast_json
 from backend.schemas.feed import (
-    FeedResponse, FeedListResponse, FeedCreate, FeedOperationResponse
+    FeedListResponse, FeedCreate, FeedOperationResponse
 )
 from backend.schemas.common import MigrateResponse
-from backend.utils.url_norm import sanitize_opml_bytes
-from backend.core.exceptions import FeedNotFoundException, FeedAlreadyExistsException
+from backend.utils.opml_parser import iter_chunks
+from backend.core.config import FAST_JSON_DEFAULT, FEED_VALIDATION_ENABLED
+from backend.core.exceptions import (
+    FeedNotFoundException, FeedAlreadyExistsException, InvalidFeedException, InvalidOPMLError
+)
 
 router = APIRouter(prefix="/feeds", tags=["feeds"])
 
 
-@router.get("", response_model=FeedListResponse, summary="피드 목록 조회")
-def list_feeds(
+@router.get(
+    "", response_model=FeedListResponse, response_model_exclude_unset=True, summary="피드 목록 조회"
+)
+async def list_feeds(
+    request: Request,
     enabled: bool | None = Query(None, description="활성화 여부 필터 (None=전체)"),
-    service: FeedService = Depends(get_feed_service)
+    limit: int = Query(0, ge=0, le=1000, description="페이지 크기 (0=전체)"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor"),
+    sort: str = Query("url", description="url|title|last_published|enabled"),
+    order: str = Query("asc", description="asc|desc"),
+    fields: str | None = Query(None, description="쉼표 구분 응답 필드 (url,title,site_url,enabled,last_published)"),
+    fast: bool = Query(FAST_JSON_DEFAULT, description="검증 생략 + orjson 직렬화 fast path"),
+    service: QueryService = Depends(get_query_service)
 ):
-    """피드 목록 조회"""
-    feeds = service.get_all_feeds(enabled=enabled)
-    return {
-        "feeds": [FeedResponse(**f) for f in feeds],
-        "total": len(feeds)
-    }
+    """피드 목록 조회 (커서 페이지네이션/필드 선택/정렬)"""
+    try:
+        body = await service.get_feeds_page(
+            enabled=enabled,
+            fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None,
+            sort=sort, order=order, cursor=cursor, limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if fast:
+        return fast_json(request, body)
+    # response_model이 한 번만 검증하도록 dict 그대로 반환
+    return body
 
 
 @router.post("", response_model=FeedOperationResponse, summary="피드 추가")
 def add_feed(
     feed: FeedCreate,
+    validate: bool = Query(FEED_VALIDATION_ENABLED, description="등록 전 피드 검증 (RSS/Atom 응답 확인)"),
     service: FeedService = Depends(get_feed_service)
 ):
-    """피드 추가"""
+    """피드 추가 (검증 실패 시 422, 결과는 /feeds/quarantine)"""
     try:
-        return service.add_feed(feed.url, title=feed.title, enabled=feed.enabled)
+        return service.add_feed(feed.url, title=feed.title, enabled=feed.enabled, validate=validate)
     except FeedAlreadyExistsException as e:
         raise HTTPException(status_code=400, detail=str(e))
+    except InvalidFeedException as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+
+@router.get("/quarantine", summary="검증 실패로 격리된 피드 목록")
+def list_quarantine(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=1000),
+    service: FeedService = Depends(get_feed_service)
+):
+    """등록 전 검증에 실패한 URL (사유, HTTP 상태, Content-Type, 최종 URL, 엔트리 수)"""
+    return service.list_quarantined(skip=skip, limit=limit)
+
+
+@router.post(
+    "/revalidate", summary="검증 보류 피드 재검증", dependencies=[Depends(admission("import_opml"))]
+)
+def revalidate_deferred(
+    limit: int = Query(160, ge=1, le=1000, description="한 번에 재검증할 보류 URL 수"),
+    service: FeedService = Depends(get_feed_service)
+):
+    """시간 예산 초과로 확인하지 못한 채 등록된 URL 재검증 (실패는 격리 + Reader에서 제거)"""
+    return service.revalidate_deferred(limit=limit)
 
 
 @router.delete("/{url:path}", response_model=FeedOperationResponse, summary="피드 삭제")
@@ -77,74 +122,87 @@ def migrate_feeds(service: FeedService = Depends(get_feed_service)):
 
 @router.get("/reader", summary="현재 Reader에 등록된 피드 열람")
 def list_reader_feeds(service: FeedService = Depends(get_feed_service)):
-    """Reader에 등록된 피드 목록"""
+    """Reader에 등록된 피드 목록 (read-only Reader 풀 사용)"""
     from backend.services.reader_service import ReaderService
-    r = ReaderService.get_reader()
-    return [{"url": f.url, "title": getattr(f, "title", None)} for f in r.get_feeds()]
+    with ReaderService.read_reader() as r:
+        return [{"url": f.url, "title": getattr(f, "title", None)} for f in r.get_feeds()]
 
 
-@router.post("/import-opml", summary="OPML 업로드 등록")
+@router.post("/import-opml", summary="OPML 업로드 등록", dependencies=[Depends(admission("import_opml"))])
 async def import_opml_api(
     file: UploadFile = File(...),
     mirror: bool = True,
+    validate: bool = Query(FEED_VALIDATION_ENABLED, description="등록 전 피드 동시 검증"),
     service: FeedService = Depends(get_feed_service)
 ):
-    """OPML 업로드 등록(블랙리스트/정규화/자동교정)"""
-    raw = await file.read()
-    # 깨진 '&' 자동 교정
-    raw = sanitize_opml_bytes(raw)
+    """OPML 업로드 등록(블랙리스트/정규화/자동교정/검증)
+
+    업로드는 Starlette가 임시 파일로 스풀링한 것을 청크 단위로 읽어 한 번에 파싱하고,
+    파싱/등록/미러링은 동기 작업이므로 스레드풀에서 실행해 이벤트 루프(읽기 요청)를 막지 않습니다.
+    """
+    return await run_in_threadpool(_import_opml_sync, file.file, mirror, validate, service)
+
+
+def _import_opml_sync(fileobj: BinaryIO, mirror: bool, validate: bool, service: FeedService):
+    try:
+        res = service.import_opml_stream(iter_chunks(fileobj), validate=validate)
+    except InvalidOPMLError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _ingest_new_feeds(res, mirror)
+
+
+def _ingest_new_feeds(res: dict, mirror: bool) -> dict:
+    """새로 등록된 피드만 업데이트하고 (mirror면) 그 엔트리/피드만 MongoDB로 미러링"""
+    new_feeds = res.pop("new_feeds", [])
     try:
-        ET.fromstring(raw)  # 유효성 간단 검증
+        from backend.core.container import Container
+        crawler = Container.get_crawler_service()
+        res["ingest"] = crawler.ingest_feeds(new_feeds, mirror=mirror)
     except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid OPML: {e}")
-
-    with tempfile.NamedTemporaryFile(suffix=".opml", delete=True) as tmp:
-        tmp.write(raw)
-        tmp.flush()
-        res = service.import_opml(Path(tmp.name), blacklist=service.load_blacklist_urls())
-
-    if mirror:
-        try:
-            from backend.core.container import Container
-            crawler = Container.get_crawler_service()
-            res["mongo"] = crawler.mirror_feeds_to_mongo()
-        except Exception as e:
-            res["mongo_error"] = str(e)
+        res["ingest_error"] = str(e)
     return res
 
 
 @router.get("/export-opml", summary="현재 Reader 피드를 OPML로 내보내기", response_class=Response)
 def export_opml_api(
+    request: Request,
     download: bool = False,
     service: FeedService = Depends(get_feed_service)
 ):
-    """현재 Reader 피드를 OPML로 내보내기"""
-    xml = service.export_opml()
+    """현재 Reader 피드를 OPML로 내보내기
+
+    피드 집합(URL + 제목) 지문별로 렌더링한 파일을 청크 스트리밍합니다. 카탈로그가 그대로면
+    다시 만들지 않고, If-None-Match가 ETag와 같으면 304를 반환합니다.
+    """
+    etag, path = service.export_opml_file()
     headers = {}
     if download:
         headers["Content-Disposition"] = 'attachment; filename="feeds_export.opml"'
-    return Response(content=xml, media_type="application/xml", headers=headers)
+    return cached_file_response(request, path, "application/xml", etag, headers)
 
 
 @router.post("/sync", summary="feeds.yaml ↔ Reader 동기화")
 def sync_yaml_api(
     delete_missing: bool = Body(False, embed=True),
+    mirror: bool = Body(True, embed=True),
+    force: bool = Body(False, embed=True),
     service: FeedService = Depends(get_feed_service)
 ):
-    """feeds.yaml ↔ Reader 동기화(블랙리스트 적용)"""
-    return service.sync_from_yaml(delete_missing=delete_missing)
+    """feeds.yaml ↔ Reader 동기화(블랙리스트 적용, 새 피드만 업데이트/미러링, 입력/대상이 그대로면 생략)"""
+    return _ingest_new_feeds(service.sync_from_yaml(delete_missing=delete_missing, force=force), mirror)
 
 
 @router.get("/sources", summary="feeds.yaml / blacklist.yaml 내용 확인")
 def sources_view(service: FeedService = Depends(get_feed_service)):
     """feeds.yaml / blacklist.yaml 내용 확인"""
     feeds, urls = service.load_feeds_yaml()
-    bl = sorted(service.load_blacklist_urls())
+    bl = service.load_blacklist()
     return {
         "feeds_yaml_count": len(feeds),
         "feeds_yaml_urls": urls,
         "blacklist_count": len(bl),
-        "blacklist_urls": bl
+        "blacklist_urls": sorted(bl.urls),
+        "blacklist_domains": list(bl.domains),
     }
 
 
@@ -12,8 +12,9 @@ router = APIRouter(prefix="/sync", tags=["sync"])
 @router.post("/feeds", summary="SOT(feeds.yaml + my_feeds.opml) ↔ MongoDB(redfin.feeds) 동기화")
 def sync_feeds(
     delete_missing: bool = Body(False, embed=True),
+    force: bool = Body(False, embed=True),
     service: FeedService = Depends(get_feed_service)
 ) -> Dict[str, Any]:
-    """SOT(feeds.yaml + my_feeds.opml) ↔ MongoDB(redfin.feeds) 동기화"""
-    return service.sync_feeds_to_mongo(delete_missing=delete_missing)
+    """SOT(feeds.yaml + my_feeds.opml) ↔ MongoDB(redfin.feeds) 동기화 (입력/대상이 그대로면 unchanged=True로 생략)"""
+    return service.sync_feeds_to_mongo(delete_missing=delete_missing, force=force)
 
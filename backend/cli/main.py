@@ -18,12 +18,10 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from backend.core.config import DISCOVER_TARGETS, PROJECT_ROOT
-from backend.core.container import Container
-from backend.core.database import MongoManager
-from backend.repositories import EntryRepository, FeedRepository
+from backend.core.config import DISCOVER_TARGETS, FEED_VALIDATION_ENABLED, PROJECT_ROOT
 
 # Note: CLI는 Container를 통해 서비스를 생성하므로 API 계층을 의존하지 않습니다.
+# Airflow에서 명령 단위로 호출되므로 서비스/저장소는 각 명령 안에서 필요한 것만 import 합니다.
 
 app = typer.Typer(help="RedFin RSS Management CLI")
 console = Console()
@@ -37,25 +35,26 @@ def callback():
 
 @app.command("init-db")
 def init_db():
-    """MongoDB 인덱스 생성 및 초기화"""
+    """MongoDB 인덱스 생성 및 초기화 (각 저장소 INDEXES 선언에 맞춤)"""
     console.print("[bold blue]MongoDB 인덱스 초기화 시작...[/bold blue]")
+    from backend.core.container import Container
+    from backend.core.database import MongoManager
     
     try:
         # MongoDB 연결 확인
         MongoManager.get_client().admin.command('ping')
         console.print("[green]✓[/green] MongoDB 연결 성공")
         
-        # EntryRepository 인덱스 생성
-        console.print("[yellow]entries 컬렉션 인덱스 생성 중...[/yellow]")
-        entry_repo = EntryRepository()
-        entry_repo.create_indexes()
-        console.print("[green]✓[/green] entries 컬렉션 인덱스 생성 완료")
-        
-        # FeedRepository 인덱스 생성
-        console.print("[yellow]feeds 컬렉션 인덱스 생성 중...[/yellow]")
-        feed_repo = FeedRepository()
-        feed_repo.create_indexes()
-        console.print("[green]✓[/green] feeds 컬렉션 인덱스 생성 완료")
+        service = Container.get_index_service()
+        for repo in service.repositories:
+            console.print(f"[yellow]{repo.collection_name} 컬렉션 인덱스 생성 중...[/yellow]")
+            r = service.reconcile_collection(repo)
+            console.print(
+                f"[green]✓[/green] {repo.collection_name} 컬렉션 인덱스 생성 완료 "
+                f"(생성 {len(r['created'])}, 재생성 {len(r['rebuilt'])}, 유지 {len(r['ok'])})"
+            )
+            if r["extra"]:
+                console.print(f"[cyan]⊘[/cyan] 선언에 없는 인덱스 (유지): {', '.join(r['extra'])}")
         
         console.print("[bold green]✓ 모든 인덱스 초기화 완료[/bold green]")
         
@@ -64,12 +63,50 @@ def init_db():
         raise typer.Exit(code=1)
 
 
+@app.command("check-indexes")
+def check_indexes():
+    """선언 인덱스 누락/변경과 주요 조회의 COLLSCAN 점검 (문제가 있으면 종료 코드 1)"""
+    from backend.core.container import Container
+    
+    try:
+        report = Container.get_index_service().report()
+    except Exception as e:
+        console.print(f"[bold red]✗ 인덱스 점검 실패: {str(e)}[/bold red]")
+        raise typer.Exit(code=1)
+    
+    for name, c in report["collections"].items():
+        if c.get("error"):
+            console.print(f"[red]✗[/red] {name}: {c['error']}")
+        elif c["missing"] or c["changed"]:
+            console.print(f"[red]✗[/red] {name}: 누락 {c['missing']}, 변경 {c['changed']}")
+    
+    table = Table(title="주요 조회 실행 계획")
+    table.add_column("조회", style="cyan")
+    table.add_column("인덱스", style="green")
+    table.add_column("단계")
+    for q in report["queries"]:
+        if q.get("error"):
+            table.add_row(q["name"], "-", f"[red]{q['error']}[/red]")
+            continue
+        stages = " > ".join(q["stages"])
+        if q["collscan"] and not q["full_scan"]:
+            stages = f"[red]{stages}[/red]"
+        table.add_row(q["name"], ", ".join(q["indexes"]) or "-", stages)
+    console.print(table)
+    
+    if not report["ok"]:
+        console.print("[bold red]✗ 인덱스 점검 실패 — init-db로 인덱스를 맞추세요[/bold red]")
+        raise typer.Exit(code=1)
+    console.print("[bold green]✓ 인덱스 점검 통과[/bold green]")
+
+
 @app.command("init")
 def init_feeds():
     """MongoDB에서 활성화된 피드를 Reader에 등록하고 업데이트"""
     console.print("[bold blue]피드 초기화 시작...[/bold blue]")
     
     try:
+        from backend.core.container import Container
         crawler = Container.get_crawler_service()
         result = crawler.init_feeds()
         
@@ -84,20 +121,32 @@ def init_feeds():
 
 
 @app.command("update-feeds")
-def update_feeds(days: int = typer.Option(1, "--days", "-d", help="업데이트할 일수 (0=전체)")):
+def update_feeds(
+    days: int = typer.Option(1, "--days", "-d", help="업데이트할 일수 (0=전체)"),
+    profile: Optional[str] = typer.Option(None, "--profile", help="단계별 프로파일링 (cpu|mem)"),
+    trigger: str = typer.Option("cli", "--trigger", help="실행 이력 트리거 구분 (cli|dag)")
+):
     """RSS 피드 수집 및 업데이트"""
     console.print(f"[bold blue]피드 업데이트 시작 (days={days})...[/bold blue]")
+    if profile not in (None, "cpu", "mem"):
+        console.print(f"[bold red]✗ --profile은 cpu 또는 mem만 가능합니다: {profile}[/bold red]")
+        raise typer.Exit(code=1)
     
     try:
+        from backend.core.container import Container
         crawler = Container.get_crawler_service()
         days_param = None if days == 0 else days
-        result = crawler.update_all(days=days_param)
+        result = crawler.update_all(days=days_param, profile=profile, trigger=trigger)
         
         console.print(f"[green]✓[/green] 업데이트 완료")
-        console.print(f"[cyan]⏱[/cyan] 소요 시간: {result['update_sec']}초")
+        console.print(f"[cyan]⏱[/cyan] 소요 시간: {result['update_sec']}초 {result.get('phases', {})}")
+        console.print(f"[cyan]🆔[/cyan] run_id: {result['run_id']}")
         if 'mongo_entries' in result:
             entries = result['mongo_entries'].get('entries_processed', 0)
             console.print(f"[green]✓[/green] 처리된 엔트리: {entries}개")
+        if 'profile' in result:
+            from backend.core.config import PROFILE_DIR
+            console.print(f"[cyan]📈[/cyan] 프로파일({profile}): {Path(PROFILE_DIR) / result['run_id']}")
         
     except Exception as e:
         console.print(f"[bold red]✗ 피드 업데이트 실패: {str(e)}[/bold red]")
@@ -107,24 +156,32 @@ def update_feeds(days: int = typer.Option(1, "--days", "-d", help="업데이트
 @app.command("discover")
 def discover(
     url: Optional[str] = typer.Option(None, "--url", "-u", help="탐색할 URL"),
-    top_k: int = typer.Option(3, "--top-k", "-k", help="최대 후보 수")
+    top_k: int = typer.Option(3, "--top-k", "-k", help="최대 후보 수"),
+    refresh: bool = typer.Option(False, "--refresh", help="발견 캐시 무시"),
+    validate: bool = typer.Option(FEED_VALIDATION_ENABLED, "--validate/--no-validate", help="등록 전 피드 검증")
 ):
-    """URL에서 RSS 피드 발견 및 추가"""
+    """URL에서 RSS 피드 발견 및 추가 (기본 타깃은 동시 탐색)"""
+    from backend.core.container import Container
     feed_service = Container.get_feed_service()
     
     if url:
         console.print(f"[bold blue]피드 발견 중: {url}...[/bold blue]")
-        result = feed_service.discover_feeds(url, top_k=top_k)
+        result = feed_service.discover_feeds(url, top_k=top_k, refresh=refresh, validate=validate)
     else:
-        console.print(f"[bold blue]기본 타깃 URL에서 피드 발견 중...[/bold blue]")
-        results = []
-        for target_url in DISCOVER_TARGETS:
-            result = feed_service.discover_feeds(target_url, top_k=top_k)
-            results.append(result)
-        result = {"results": results}
+        console.print(f"[bold blue]기본 타깃 URL {len(DISCOVER_TARGETS)}개에서 피드 발견 중...[/bold blue]")
+        result = feed_service.discover_many(DISCOVER_TARGETS, top_k=top_k, refresh=refresh, validate=validate)
+        for res in result["results"]:
+            console.print(
+                f"  [dim]{res['status']:<7}[/dim] {res['source_url']} "
+                f"(추가 {res['added']}, 기존 {res['known']}, 검증 실패 {res['invalid']}, 건너뜀 {res['skipped']})"
+            )
+            if res.get("error"):
+                console.print(f"          [red]{res['error']}[/red]")
     
     console.print(f"[green]✓[/green] 발견: {result.get('added', 0)}개")
-    console.print(f"[yellow]⊘[/yellow] 건너뜀: {result.get('skipped', 0)}개")
+    console.print(f"[yellow]⊘[/yellow] 건너뜀: {result.get('skipped', 0)}개 (기존 피드 {result.get('known', 0)}개)")
+    if result.get('invalid'):
+        console.print(f"[red]✗[/red] 검증 실패(격리): {result['invalid']}개")
     if 'candidates' in result:
         console.print(f"[cyan]후보:[/cyan] {', '.join(result['candidates'])}")
 
@@ -138,6 +195,7 @@ def stats(
     console.print(f"[bold blue]통계 조회 중 (최근 {days}일)...[/bold blue]")
     
     try:
+        from backend.core.container import Container
         crawler = Container.get_crawler_service()
         result = crawler.get_stats(days=days)
         
@@ -169,15 +227,20 @@ def stats(
 
 @app.command("sync-feeds")
 def sync_feeds(
-    delete_missing: bool = typer.Option(False, "--delete-missing", help="소스에 없는 피드 제거")
+    delete_missing: bool = typer.Option(False, "--delete-missing", help="소스에 없는 피드 제거"),
+    force: bool = typer.Option(False, "--force", help="입력 파일이 그대로여도 다시 비교")
 ):
     """feeds.yaml 및 OPML 파일과 DB 동기화"""
     console.print("[bold blue]피드 동기화 시작...[/bold blue]")
     
     try:
+        from backend.core.container import Container
         feed_service = Container.get_feed_service()
-        result = feed_service.sync_feeds_to_mongo(delete_missing=delete_missing)
+        result = feed_service.sync_feeds_to_mongo(delete_missing=delete_missing, force=force)
         
+        if result.get("unchanged"):
+            console.print("[cyan]⊘[/cyan] 입력과 DB가 직전 동기화 이후 그대로 — 생략 (--force로 다시 비교)")
+            return
         console.print(f"[green]✓[/green] 추가: {result['added']}개")
         console.print(f"[yellow]⊘[/yellow] 수정: {result['modified']}개")
         if delete_missing:
@@ -193,33 +256,62 @@ def sync_feeds(
 @app.command("import-opml")
 def import_opml(
     file: str = typer.Argument(..., help="OPML 파일 경로"),
-    mirror: bool = typer.Option(True, "--mirror/--no-mirror", help="MongoDB로 미러링")
+    mirror: bool = typer.Option(True, "--mirror/--no-mirror", help="MongoDB로 미러링"),
+    validate: bool = typer.Option(FEED_VALIDATION_ENABLED, "--validate/--no-validate", help="등록 전 피드 동시 검증")
 ):
     """OPML 파일에서 피드 가져오기"""
     console.print(f"[bold blue]OPML 가져오기: {file}...[/bold blue]")
     
     try:
+        from backend.core.container import Container
         feed_service = Container.get_feed_service()
         file_path = Path(file)
         if not file_path.is_absolute():
             file_path = PROJECT_ROOT / file_path
         
-        blacklist = feed_service.load_blacklist_urls()
-        result = feed_service.import_opml(file_path, blacklist=blacklist)
+        result = feed_service.import_opml(file_path, validate=validate)
         
         console.print(f"[green]✓[/green] 추가: {result['added']}개")
         console.print(f"[yellow]⊘[/yellow] 건너뜀: {result['skipped']}개")
+        if result.get('invalid'):
+            console.print(f"[red]✗[/red] 검증 실패(격리): {result['invalid']}개")
+            for item in result['rejected'][:10]:
+                console.print(f"  [dim]{item['reason']}[/dim] {item['url']}")
+        if result.get('deferred'):
+            console.print(
+                f"[yellow]⊘[/yellow] 검증 보류(시간 예산 초과, 등록됨): {result['deferred']}개 — revalidate-feeds로 재검증"
+            )
         
-        if mirror:
-            crawler = Container.get_crawler_service()
-            mongo_result = crawler.mirror_feeds_to_mongo()
-            console.print(f"[green]✓[/green] MongoDB 미러링 완료")
+        _ingest_new_feeds(result["new_feeds"], mirror)
         
     except Exception as e:
         console.print(f"[bold red]✗ OPML 가져오기 실패: {str(e)}[/bold red]")
         raise typer.Exit(code=1)
 
 
+@app.command("revalidate-feeds")
+def revalidate_feeds(
+    limit: int = typer.Option(160, "--limit", help="한 번에 재검증할 보류 URL 수")
+):
+    """검증 보류(시간 예산 초과) 상태로 등록된 피드 재검증 (실패는 격리 + Reader에서 제거)"""
+    console.print("[bold blue]보류 피드 재검증 중...[/bold blue]")
+    
+    try:
+        from backend.core.container import Container
+        result = Container.get_feed_service().revalidate_deferred(limit=limit)
+        console.print(f"[green]✓[/green] 통과: {result['ok']}개 / 검사 {result['checked']}개")
+        if result['quarantined']:
+            console.print(f"[red]✗[/red] 검증 실패(격리, Reader에서 제거): {result['quarantined']}개")
+            for item in result['rejected'][:10]:
+                console.print(f"  [dim]{item['reason']}[/dim] {item['url']}")
+        if result['deferred']:
+            console.print(f"[yellow]⊘[/yellow] 여전히 보류: {result['deferred']}개")
+        
+    except Exception as e:
+        console.print(f"[bold red]✗ 재검증 실패: {str(e)}[/bold red]")
+        raise typer.Exit(code=1)
+
+
 @app.command("export-opml")
 def export_opml(
     output: Optional[str] = typer.Option(None, "--output", "-o", help="출력 파일 경로")
@@ -228,18 +320,20 @@ def export_opml(
     console.print("[bold blue]OPML 내보내기...[/bold blue]")
     
     try:
+        from backend.core.container import Container
         feed_service = Container.get_feed_service()
-        xml = feed_service.export_opml()
+        _, cached = feed_service.export_opml_file()
         
         if output:
+            import shutil
             output_path = Path(output)
             if not output_path.is_absolute():
                 output_path = PROJECT_ROOT / output_path
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(xml, encoding="utf-8")
+            shutil.copyfile(cached, output_path)
             console.print(f"[green]✓[/green] OPML 저장: {output_path}")
         else:
-            console.print(xml)
+            console.print(cached.read_text(encoding="utf-8"))
             
     except Exception as e:
         console.print(f"[bold red]✗ OPML 내보내기 실패: {str(e)}[/bold red]")
@@ -248,19 +342,26 @@ def export_opml(
 
 @app.command("sync-yaml")
 def sync_yaml(
-    delete_missing: bool = typer.Option(False, "--delete-missing", help="소스에 없는 피드 제거")
+    delete_missing: bool = typer.Option(False, "--delete-missing", help="소스에 없는 피드 제거"),
+    mirror: bool = typer.Option(True, "--mirror/--no-mirror", help="새 피드 엔트리를 MongoDB로 미러링"),
+    force: bool = typer.Option(False, "--force", help="입력 파일이 그대로여도 다시 비교")
 ):
     """feeds.yaml ↔ Reader 동기화"""
     console.print("[bold blue]YAML 동기화 시작...[/bold blue]")
     
     try:
+        from backend.core.container import Container
         feed_service = Container.get_feed_service()
-        result = feed_service.sync_from_yaml(delete_missing=delete_missing)
+        result = feed_service.sync_from_yaml(delete_missing=delete_missing, force=force)
         
+        if result.get("unchanged"):
+            console.print("[cyan]⊘[/cyan] feeds.yaml과 Reader가 직전 동기화 이후 그대로 — 생략 (--force로 다시 비교)")
+            return
         console.print(f"[green]✓[/green] 추가: {result['added']}개")
         if delete_missing:
             console.print(f"[red]✗[/red] 제거: {result['removed']}개")
         console.print(f"[cyan]⊘[/cyan] 유지: {result['kept']}개")
+        _ingest_new_feeds(result["new_feeds"], mirror)
         console.print(f"[bold green]✓ YAML 동기화 완료[/bold green]")
         
     except Exception as e:
@@ -268,6 +369,100 @@ def sync_yaml(
         raise typer.Exit(code=1)
 
 
+@app.command("compact-entries")
+def compact_entries(
+    batch_size: int = typer.Option(1000, "--batch-size", help="한 번에 변환할 문서 수")
+):
+    """기존 entries 문서를 compact 형식으로 변환 (큰 summary/authors → entry_bodies 압축 저장)"""
+    from backend.core.config import ENTRY_STORAGE_MODE
+    from backend.repositories import EntryRepository
+    
+    console.print("[bold blue]엔트리 compact 변환 시작...[/bold blue]")
+    if ENTRY_STORAGE_MODE != "compact":
+        console.print("[yellow]⚠ ENTRY_STORAGE_MODE=compact가 아니면 이후 미러링은 다시 inline으로 저장됩니다[/yellow]")
+    
+    try:
+        result = EntryRepository().compact_existing(batch_size=batch_size)
+        console.print(f"[green]✓[/green] 변환: {result['converted']}개 (본문 분리 {result['bodies']}개)")
+        if result["failed"]:
+            console.print(f"[yellow]⚠ 쓰기 실패 {result['failed']}개 — 다시 실행하면 남은 문서만 변환합니다[/yellow]")
+        console.print("[bold green]✓ compact 변환 완료[/bold green]")
+        
+    except Exception as e:
+        console.print(f"[bold red]✗ compact 변환 실패: {str(e)}[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@app.command("archive-entries")
+def archive_entries(
+    days: Optional[int] = typer.Option(None, "--days", help="보관 기간(일), 기본 ENTRY_RETENTION_DAYS"),
+    batch_size: int = typer.Option(1000, "--batch-size", help="한 번에 이동할 문서 수")
+):
+    """보관 기간이 지난 엔트리를 entries_archive로 이동 (통계 롤업 유지)"""
+    console.print("[bold blue]엔트리 아카이브 시작...[/bold blue]")
+    
+    try:
+        from backend.core.container import Container
+        result = Container.get_retention_service().archive_entries(days=days, batch_size=batch_size)
+        console.print(f"[green]✓[/green] 이동: {result['moved']}개 (기준 {result['cutoff'][:10]} 이전 발행)")
+        console.print(f"[cyan]⊘[/cyan] hot: {result['hot_total']}개 / 아카이브: {result['archived_total']}개")
+        console.print(f"[bold green]✓ 아카이브 완료 ({result['elapsed_sec']}초)[/bold green]")
+        
+    except Exception as e:
+        console.print(f"[bold red]✗ 아카이브 실패: {str(e)}[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@app.command("maintain-reader")
+def maintain_reader(
+    days: Optional[int] = typer.Option(None, "--days", help="이 기간(일)보다 오래된 엔트리 정리, 기본 READER_PRUNE_DAYS"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="측정과 삭제 대상 집계만 (DB 변경 없음)")
+):
+    """MongoDB에 미러링된 오래된 Reader 엔트리 정리 + vacuum/analyze (전후 크기/조회 시간 출력)"""
+    console.print("[bold blue]Reader DB 정리 시작...[/bold blue]")
+    
+    try:
+        from backend.core.container import Container
+        result = Container.get_reader_maintenance_service().maintain(days=days, dry_run=dry_run)
+        before, after = result["before"], result["after"]
+        console.print(
+            f"[green]✓[/green] 삭제 대상: {result['candidates']}개 / 검사 {result['scanned']}개 "
+            f"(기준 {result['cutoff'][:10]} 이전, 미러링 안 됨 {result['not_mirrored']}개 제외)"
+        )
+        if dry_run:
+            console.print(f"[cyan]⊘[/cyan] dry-run: DB 크기 {before['total_bytes'] / 1048576:.1f}MB, 변경 없음")
+            return
+        console.print(f"[green]✓[/green] 삭제: {result['pruned']}개, vacuum: {result['vacuum']['mode']} "
+                      f"(반환 페이지 {result['vacuum']['freed_pages']}개)")
+        console.print(
+            f"[green]✓[/green] 파일 크기: {before['total_bytes'] / 1048576:.1f}MB → "
+            f"{after['total_bytes'] / 1048576:.1f}MB"
+        )
+        for name, ms in before["query_ms"].items():
+            console.print(f"  {name}: {ms}ms → {after['query_ms'].get(name)}ms")
+        console.print(f"[bold green]✓ Reader DB 정리 완료 ({result['elapsed_sec']}초)[/bold green]")
+        
+    except Exception as e:
+        console.print(f"[bold red]✗ Reader DB 정리 실패: {str(e)}[/bold red]")
+        raise typer.Exit(code=1)
+
+
+def _ingest_new_feeds(feeds: list, mirror: bool) -> None:
+    """새로 추가된 피드만 업데이트 (+ 해당 엔트리 MongoDB 미러링)"""
+    if not feeds:
+        return
+    from backend.core.container import Container
+    console.print(f"[yellow]새 피드 {len(feeds)}개 업데이트 중...[/yellow]")
+    res = Container.get_crawler_service().ingest_feeds(feeds, mirror=mirror)
+    fetch = res["fetch"]
+    console.print(
+        f"[green]✓[/green] 새 피드 업데이트: 엔트리 {fetch['entries_new']}개, "
+        f"실패 {fetch['feeds_failed']}개 ({res['update_sec']}초)"
+    )
+    if mirror:
+        console.print(f"[green]✓[/green] MongoDB 미러링 완료: {res['mongo_entries']['entries_processed']}개 엔트리")
+
+
 if __name__ == "__main__":
     app()
 
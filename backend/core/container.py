@@ -7,9 +7,18 @@ API와 CLI 모두 이 컨테이너를 통해 서비스를 생성합니다.
 """
 from typing import Optional
 
-from backend.repositories import FeedRepository, EntryRepository
+from backend.repositories import (
+    FeedRepository, EntryRepository, DigestInputRepository, CrawlRunRepository, DiscoveryCacheRepository,
+    FeedValidationRepository, SyncStateRepository, EntryArchiveRepository,
+    AsyncFeedRepository, AsyncEntryRepository, AsyncEntryArchiveRepository,
+)
 from backend.services.crawler_service import CrawlerService
 from backend.services.feed_service import FeedService
+from backend.services.digest_service import DigestService
+from backend.services.query_service import QueryService
+from backend.services.retention_service import RetentionService
+from backend.services.index_service import IndexService
+from backend.services.reader_maintenance_service import ReaderMaintenanceService
 
 
 class Container:
@@ -25,22 +34,133 @@ class Container:
         """EntryRepository 인스턴스 반환"""
         return EntryRepository()
     
+    @staticmethod
+    def get_digest_repository() -> DigestInputRepository:
+        """DigestInputRepository 인스턴스 반환"""
+        return DigestInputRepository()
+    
+    @staticmethod
+    def get_run_repository() -> CrawlRunRepository:
+        """CrawlRunRepository 인스턴스 반환"""
+        return CrawlRunRepository()
+    
+    @staticmethod
+    def get_archive_repository() -> EntryArchiveRepository:
+        """EntryArchiveRepository 인스턴스 반환"""
+        return EntryArchiveRepository()
+    
     @staticmethod
     def get_crawler_service(
         feed_repo: Optional[FeedRepository] = None,
         entry_repo: Optional[EntryRepository] = None,
+        run_repo: Optional[CrawlRunRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+        state_repo: Optional[SyncStateRepository] = None,
     ) -> CrawlerService:
         """CrawlerService 인스턴스 반환"""
         if feed_repo is None:
             feed_repo = Container.get_feed_repository()
         if entry_repo is None:
             entry_repo = Container.get_entry_repository()
-        return CrawlerService(feed_repo=feed_repo, entry_repo=entry_repo)
+        if run_repo is None:
+            run_repo = Container.get_run_repository()
+        if archive_repo is None:
+            archive_repo = Container.get_archive_repository()
+        if state_repo is None:
+            state_repo = Container.get_sync_state_repository()
+        return CrawlerService(
+            feed_repo=feed_repo, entry_repo=entry_repo, run_repo=run_repo, archive_repo=archive_repo,
+            state_repo=state_repo,
+        )
     
     @staticmethod
-    def get_feed_service(feed_repo: Optional[FeedRepository] = None) -> FeedService:
+    def get_retention_service(
+        entry_repo: Optional[EntryRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+    ) -> RetentionService:
+        """RetentionService 인스턴스 반환"""
+        if entry_repo is None:
+            entry_repo = Container.get_entry_repository()
+        if archive_repo is None:
+            archive_repo = Container.get_archive_repository()
+        return RetentionService(entry_repo=entry_repo, archive_repo=archive_repo)
+    
+    @staticmethod
+    def get_reader_maintenance_service(
+        entry_repo: Optional[EntryRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+    ) -> ReaderMaintenanceService:
+        """ReaderMaintenanceService 인스턴스 반환"""
+        if entry_repo is None:
+            entry_repo = Container.get_entry_repository()
+        if archive_repo is None:
+            archive_repo = Container.get_archive_repository()
+        return ReaderMaintenanceService(entry_repo=entry_repo, archive_repo=archive_repo)
+    
+    @staticmethod
+    def get_index_service() -> IndexService:
+        """IndexService 인스턴스 반환 (전체 저장소 대상)"""
+        return IndexService()
+    
+    @staticmethod
+    def get_discovery_cache_repository() -> DiscoveryCacheRepository:
+        """DiscoveryCacheRepository 인스턴스 반환"""
+        return DiscoveryCacheRepository()
+    
+    @staticmethod
+    def get_validation_repository() -> FeedValidationRepository:
+        """FeedValidationRepository 인스턴스 반환"""
+        return FeedValidationRepository()
+    
+    @staticmethod
+    def get_sync_state_repository() -> SyncStateRepository:
+        """SyncStateRepository 인스턴스 반환"""
+        return SyncStateRepository()
+    
+    @staticmethod
+    def get_feed_service(
+        feed_repo: Optional[FeedRepository] = None,
+        cache_repo: Optional[DiscoveryCacheRepository] = None,
+        validation_repo: Optional[FeedValidationRepository] = None,
+        state_repo: Optional[SyncStateRepository] = None,
+    ) -> FeedService:
         """FeedService 인스턴스 반환"""
         if feed_repo is None:
             feed_repo = Container.get_feed_repository()
-        return FeedService(feed_repo=feed_repo)
-
+        if cache_repo is None:
+            cache_repo = Container.get_discovery_cache_repository()
+        if validation_repo is None:
+            validation_repo = Container.get_validation_repository()
+        if state_repo is None:
+            state_repo = Container.get_sync_state_repository()
+        return FeedService(
+            feed_repo=feed_repo, cache_repo=cache_repo, validation_repo=validation_repo, state_repo=state_repo
+        )
+    
+    @staticmethod
+    def get_digest_service(
+        entry_repo: Optional[EntryRepository] = None,
+        digest_repo: Optional[DigestInputRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+    ) -> DigestService:
+        """DigestService 인스턴스 반환"""
+        if entry_repo is None:
+            entry_repo = Container.get_entry_repository()
+        if digest_repo is None:
+            digest_repo = Container.get_digest_repository()
+        if archive_repo is None:
+            archive_repo = Container.get_archive_repository()
+        return DigestService(entry_repo=entry_repo, digest_repo=digest_repo, archive_repo=archive_repo)
+    
+    @staticmethod
+    def get_query_service(
+        feed_repo: Optional[AsyncFeedRepository] = None,
+        entry_repo: Optional[AsyncEntryRepository] = None,
+        archive_repo: Optional[AsyncEntryArchiveRepository] = None,
+    ) -> QueryService:
+        """QueryService(async 읽기 경로) 인스턴스 반환"""
+        return QueryService(
+            feed_repo=feed_repo or AsyncFeedRepository(),
+            entry_repo=entry_repo or AsyncEntryRepository(),
+            archive_repo=archive_repo or AsyncEntryArchiveRepository(),
+        )
@@ -1,7 +1,22 @@
 # backend/core/database.py
-from pymongo import MongoClient
+from pymongo import AsyncMongoClient, MongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
-from backend.core.config import MONGO_URI, MONGO_DB
+from backend.core.config import MONGO_URI, MONGO_DB, MONGO_COMPRESSORS, MONGO_ZLIB_LEVEL
+
+
+def client_options() -> dict:
+    """MongoClient 공통 옵션 (MONGO_COMPRESSORS가 있으면 와이어 압축 협상)
+
+    서버와 클라이언트가 모두 지원하는 첫 번째 방식이 쓰이며, 설치되지 않은 방식은 pymongo가 경고 후 제외합니다.
+    """
+    opts: dict = {}
+    compressors = [c.strip() for c in MONGO_COMPRESSORS.split(",") if c.strip()]
+    if compressors:
+        opts["compressors"] = compressors
+        if "zlib" in compressors:
+            opts["zlibCompressionLevel"] = MONGO_ZLIB_LEVEL
+    return opts
 
 
 class MongoManager:
@@ -12,7 +27,7 @@ class MongoManager:
     def get_client(cls) -> MongoClient:
         if cls._client is None:
             # connect=False는 포크(fork) 안전성을 위해 설정 (웹 서버 환경 고려)
-            cls._client = MongoClient(MONGO_URI, connect=False)
+            cls._client = MongoClient(MONGO_URI, connect=False, **client_options())
         return cls._client
 
     @classmethod
@@ -28,3 +43,29 @@ class MongoManager:
             cls._client = None
             cls._db = None
 
+
+
+class AsyncMongoManager:
+    """FastAPI 읽기 경로용 asyncio 클라이언트 (CLI/크롤러는 MongoManager 사용)"""
+    _client: AsyncMongoClient | None = None
+    _db: AsyncDatabase | None = None
+
+    @classmethod
+    def get_client(cls) -> AsyncMongoClient:
+        if cls._client is None:
+            # 첫 사용 시점의 이벤트 루프에 바인딩됨 (uvicorn 워커 루프)
+            cls._client = AsyncMongoClient(MONGO_URI, connect=False, **client_options())
+        return cls._client
+
+    @classmethod
+    def get_db(cls) -> AsyncDatabase:
+        if cls._db is None:
+            cls._db = cls.get_client()[MONGO_DB]
+        return cls._db
+
+    @classmethod
+    async def close(cls):
+        if cls._client:
+            await cls._client.close()
+            cls._client = None
+            cls._db = None
@@ -21,3 +21,8 @@ class InvalidOPMLError(RSSException):
     """잘못된 OPML 형식"""
     pass
 
+
+
+class InvalidFeedException(RSSException):
+    """피드 검증 실패 (RSS/Atom이 아니거나 응답 오류)"""
+    pass
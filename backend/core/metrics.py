@@ -0,0 +1,215 @@
+# backend/core/metrics.py
+"""프로세스 내 메트릭 레지스트리 (Prometheus 텍스트 형식)
+
+외부 의존성 없이 Counter/Gauge/Histogram을 제공합니다. 기록은 라벨 튜플 조회 +
+bisect 한 번 + 락 한 번이라 요청/DB 호출 경로에 넣어도 부담이 작습니다.
+GET /metrics 가 render() 결과를 그대로 반환합니다.
+
+Note: 값은 프로세스 단위입니다. uvicorn 워커를 여러 개 띄우면 워커별로 수집됩니다.
+"""
+import bisect
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+# 지연시간(초) 버킷: 수 ms 단위 API 조회부터 수 분 단위 피드 업데이트까지
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+JOB_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0)
+# 건수 버킷: 배치 크기, 실행당 엔트리 수
+SIZE_BUCKETS = (1, 10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 50000)
+# 처리량(작업/초) 버킷: bulk_write 배치
+THROUGHPUT_BUCKETS = (100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000)
+
+_registry: List["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(v: float) -> str:
+    if v == float("inf"):
+        return "+Inf"
+    return repr(float(v)) if isinstance(v, float) else str(v)
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, doc: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.doc = doc
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+        _registry.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels[n]) for n in self.label_names)
+
+    @abstractmethod
+    def _samples(self) -> Iterator[str]:
+        """Prometheus 샘플 줄 (HELP/TYPE 제외)"""
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.doc}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = list(self._values.items())
+        for key, v in items:
+            yield f"{self.name}{_format_labels(self.label_names, key)} {_format_value(v)}"
+
+
+class Gauge(Counter):
+    """증감 가능한 현재 값"""
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램 (버킷별 개수는 렌더링 시 누적)"""
+    kind = "histogram"
+
+    def __init__(self, name: str, doc: str, labels: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, doc, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [버킷별 개수(+Inf 포함), 합계]
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][idx] += 1
+            state[1] += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """with 블록 소요 시간(초) 기록 (예외가 나도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def _samples(self) -> Iterator[str]:
+        with self._lock:
+            items = [(k, list(s[0]), s[1]) for k, s in self._values.items()]
+        bounds = list(self.buckets) + [float("inf")]
+        for key, counts, total in items:
+            acc = 0
+            for bound, c in zip(bounds, counts):
+                acc += c
+                le = f'le="{_format_value(float(bound))}"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, key, le)} {acc}"
+            yield f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_value(total)}"
+            yield f"{self.name}_count{_format_labels(self.label_names, key)} {acc}"
+
+
+def render() -> str:
+    """등록된 모든 메트릭을 Prometheus 텍스트 노출 형식으로 반환"""
+    return "\n".join(m.render() for m in _registry) + "\n"
+
+
+def tracked_job(job: str, fn: Callable, *args, **kwargs) -> Callable[[], object]:
+    """백그라운드 작업 큐 깊이 추적 — 등록 시 +1, 작업 종료 시 -1"""
+    JOB_QUEUE_DEPTH.inc(job=job)
+
+    def run():
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            JOB_QUEUE_DEPTH.dec(job=job)
+
+    return run
+
+
+# --- 메트릭 정의 ---
+
+HTTP_REQUEST_DURATION = Histogram(
+    "redfin_http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (라우트 템플릿 기준)",
+    ("method", "route", "status"),
+)
+MONGO_OP_DURATION = Histogram(
+    "redfin_mongo_op_duration_seconds",
+    "MongoDB 작업 소요 시간",
+    ("collection", "op"),
+)
+MONGO_BULK_BATCH_SIZE = Histogram(
+    "redfin_mongo_bulk_batch_size",
+    "bulk_write 1회당 작업 수",
+    ("collection",),
+    buckets=SIZE_BUCKETS,
+)
+MONGO_BULK_THROUGHPUT = Histogram(
+    "redfin_mongo_bulk_ops_per_second",
+    "bulk_write 배치별 처리량 (작업/초)",
+    ("collection",),
+    buckets=THROUGHPUT_BUCKETS,
+)
+MONGO_BULK_FAILED_OPS = Counter(
+    "redfin_mongo_bulk_failed_ops_total",
+    "bulk_write에서 실패한 작업 수 (retried: 재시도함, dropped: 포기함)",
+    ("collection", "outcome"),
+)
+READER_UPDATE_DURATION = Histogram(
+    "redfin_reader_update_duration_seconds",
+    "Reader update_feeds 소요 시간",
+    buckets=JOB_BUCKETS,
+)
+MIRROR_ENTRIES_PER_RUN = Histogram(
+    "redfin_mirror_entries_per_run",
+    "미러링 1회당 MongoDB로 저장한 엔트리 수",
+    buckets=SIZE_BUCKETS,
+)
+ENTRIES_MIRRORED = Counter(
+    "redfin_entries_mirrored_total",
+    "MongoDB로 미러링한 엔트리 누적 수",
+)
+JOB_QUEUE_DEPTH = Gauge(
+    "redfin_background_jobs",
+    "대기 또는 실행 중인 백그라운드 작업 수",
+    ("job",),
+)
+ADMISSION_REJECTED = Counter(
+    "redfin_admission_rejected_total",
+    "승인 제어로 거절(429)한 요청 수",
+    ("endpoint", "reason"),
+)
+HEAVY_IN_FLIGHT = Gauge(
+    "redfin_heavy_requests_in_flight",
+    "실행 중인 무거운 엔드포인트 요청 수",
+    ("endpoint",),
+)
@@ -1,12 +1,39 @@
 # backend/main.py
 """FastAPI 애플리케이션 진입점"""
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import BackgroundTasks, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
-from backend.core.config import PROJECT_NAME, VERSION, API_V1_PREFIX, CORS_ORIGINS
+from backend.core.config import (
+    PROJECT_NAME, VERSION, API_V1_PREFIX, CORS_ORIGINS, METRICS_ENABLED, API_THREADPOOL_SIZE,
+    INDEX_RECONCILE_ON_STARTUP,
+)
+from backend.core.database import AsyncMongoManager
+from backend.api.admission import admission
+from backend.api.middleware import MetricsMiddleware
 from backend.api.v1.api import api_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # sync 엔드포인트 스레드풀 크기 — 무거운 작업은 ADMISSION_HEAVY_MAX_CONCURRENT개까지만 점유
+    import anyio.to_thread
+    anyio.to_thread.current_default_thread_limiter().total_tokens = API_THREADPOOL_SIZE
+    # 선언 인덱스 조정 — 시작을 막지 않도록 백그라운드 (결과는 로그, 현황은 /admin/indexes)
+    if INDEX_RECONCILE_ON_STARTUP:
+        from backend.core.container import Container
+        Container.get_index_service().reconcile_in_background()
+    yield
+    # async 읽기 경로 클라이언트 정리
+    await AsyncMongoManager.close()
+    from backend.services.reader_service import ReaderService
+    ReaderService.close()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title=PROJECT_NAME,
     description="AI RSS News API Scrap Service",
     version=VERSION,
@@ -23,6 +50,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 요청 지연시간 (/metrics)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, prefixes=(API_V1_PREFIX,))
+
 # API 라우터 등록
 app.include_router(api_router, prefix=API_V1_PREFIX)
 
@@ -36,44 +67,74 @@ def root():
 def health():
     return {"ok": True}
 
-@app.post("/init")
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    """Prometheus 스크레이프용 메트릭 (text exposition format 0.0.4)"""
+    from fastapi import HTTPException
+    from backend.core import metrics as m
+    if not METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="metrics disabled")
+    return PlainTextResponse(m.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.post("/init", dependencies=[Depends(admission("init"))])
 def init():
     from backend.core.container import Container
     service = Container.get_crawler_service()
     return service.init_feeds()
 
 @app.post("/update")
-async def update(days: int = 1):
-    from fastapi import BackgroundTasks, status
+async def update(background_tasks: BackgroundTasks, days: int = 1, trigger: str = "api"):
+    from fastapi import HTTPException
     from backend.core.container import Container
-    background_tasks = BackgroundTasks()
+    from backend.core.metrics import tracked_job
+    from backend.utils.profiling import new_run_id
+    if trigger not in ("api", "dag"):
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 trigger: {trigger}")
     service = Container.get_crawler_service()
     days_param = None if days == 0 else days
-    background_tasks.add_task(service.update_all, days=days_param)
+    run_id = new_run_id()
+    background_tasks.add_task(tracked_job(
+        "update_all", service.update_all, days=days_param, run_id=run_id, trigger=trigger
+    ))
     return {
         "status": "accepted",
         "message": f"피드 업데이트가 백그라운드에서 시작되었습니다 (days={days_param or 'all'})",
-        "days": days_param
+        "days": days_param,
+        "run_id": run_id,
     }
 
 @app.get("/stats")
-def get_stats(days: int = 7):
+async def get_stats(days: int = 7):
     from backend.core.container import Container
-    service = Container.get_crawler_service()
-    return service.get_stats(days=days)
+    service = Container.get_query_service()
+    return await service.get_stats(days=days)
 
-@app.post("/discover")
+@app.post("/discover", dependencies=[Depends(admission("discover"))])
 def discover(url: str, top_k: int = 3):
     from backend.core.container import Container
     service = Container.get_feed_service()
     return service.discover_feeds(url, top_k=top_k)
 
 @app.get("/feeds")
-def list_feeds(enabled: bool | None = None):
+async def list_feeds(
+    enabled: bool | None = None,
+    limit: int = 0,
+    cursor: str | None = None,
+    sort: str = "url",
+    order: str = "asc",
+    fields: str | None = None,
+):
+    from fastapi import HTTPException
     from backend.core.container import Container
-    service = Container.get_feed_service()
-    feeds = service.get_all_feeds(enabled=enabled)
-    return {"feeds": feeds, "total": len(feeds)}
+    service = Container.get_query_service()
+    try:
+        return await service.get_feeds_page(
+            enabled=enabled,
+            fields=[f.strip() for f in fields.split(",") if f.strip()] if fields else None,
+            sort=sort, order=order, cursor=cursor, limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 @app.post("/feeds")
 def add_feed(url: str, title: str | None = None, enabled: bool = True):
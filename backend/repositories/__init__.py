@@ -1,11 +1,27 @@
 # backend/repositories package
-from .base import BaseRepository
-from .feed_repo import FeedRepository
-from .entry_repo import EntryRepository
+from .base import AsyncBaseRepository, BaseRepository
+from .feed_repo import AsyncFeedRepository, FeedRepository
+from .entry_repo import AsyncEntryRepository, EntryRepository
+from .digest_repo import DigestInputRepository
+from .run_repo import CrawlRunRepository
+from .discover_cache_repo import DiscoveryCacheRepository
+from .validation_repo import FeedValidationRepository
+from .sync_state_repo import SyncStateRepository
+from .archive_repo import AsyncEntryArchiveRepository, EntryArchiveRepository
 
 __all__ = [
     "BaseRepository",
     "FeedRepository",
     "EntryRepository",
+    "DigestInputRepository",
+    "CrawlRunRepository",
+    "DiscoveryCacheRepository",
+    "FeedValidationRepository",
+    "SyncStateRepository",
+    "EntryArchiveRepository",
+    "AsyncBaseRepository",
+    "AsyncFeedRepository",
+    "AsyncEntryRepository",
+    "AsyncEntryArchiveRepository",
 ]
 
@@ -0,0 +1,116 @@
+# backend/repositories/archive_repo.py
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Tuple
+from pymongo import ReplaceOne
+from pymongo.errors import CollectionInvalid
+from backend.core.config import ENTRY_ARCHIVE_COMPRESSOR
+from backend.utils.agg_queries import DATED, pipeline_by_feed, pipeline_weekday_dist
+from .base import AsyncBaseRepository, BaseRepository
+from .bulk import AdaptiveBulkWriter, doc_size
+from .entry_repo import AsyncEntryRepository, EntryRepository
+
+ARCHIVE_COLLECTION = "entries_archive"
+ROLLUP_COLLECTION = "entry_rollups"
+# entry_rollups의 아카이브 누적 문서 _id
+_ROLLUP_ID = "archive"
+
+
+def _aware(dt: Optional[datetime]) -> Optional[datetime]:
+    """Mongo가 돌려준 naive UTC → aware UTC"""
+    if dt is not None and dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+class EntryArchiveRepository(EntryRepository):
+    """보관 기간이 지난 엔트리 (entries와 같은 문서 형태, 조회 메서드 공용)
+
+    entry_rollups의 'archive' 문서에 아카이브 전체의 피드별/요일별 건수, 최초 발행 시각,
+    경계(archived_before)를 저장합니다. 통계는 이 롤업만 읽고, 엔트리 조회는 요청 기간이
+    archived_before 이전을 포함할 때만 이 컬렉션을 읽습니다.
+    compact 모드의 본문(entry_bodies)은 옮기지 않고 그대로 공유합니다.
+    """
+
+    def __init__(self):
+        BaseRepository.__init__(self, ARCHIVE_COLLECTION)
+        self.last_bulk: Optional[Dict[str, Any]] = None
+
+    @property
+    def rollups(self):
+        return self.db[ROLLUP_COLLECTION]
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> int:
+        """entries 문서를 형태 그대로 저장 (이미 있으면 교체 — 이동 중 중단 후 재실행해도 안전)"""
+        if not items:
+            return 0
+        ops = [ReplaceOne({"_id": d["_id"]}, d, upsert=True) for d in items]
+        self.last_bulk = AdaptiveBulkWriter(self.collection, self.collection_name).write(
+            ops, [doc_size(d) for d in items]
+        )
+        return self.last_bulk["upserted"] + self.last_bulk["modified"]
+
+    def get_rollup(self) -> Optional[Dict[str, Any]]:
+        """아카이브 누적 롤업 (아카이브한 적이 없으면 None)"""
+        return self.rollups.find_one({"_id": _ROLLUP_ID})
+
+    def archived_before(self) -> Optional[datetime]:
+        """이 시각 이전 발행 엔트리는 아카이브에 있음 (아카이브한 적이 없으면 None)"""
+        doc = self.rollups.find_one({"_id": _ROLLUP_ID}, {"archived_before": 1})
+        return _aware(doc.get("archived_before")) if doc else None
+
+    def advance_boundary(self, cutoff: datetime) -> None:
+        """옮길 엔트리가 없었을 때 경계만 앞으로 이동"""
+        self.rollups.update_one({"_id": _ROLLUP_ID}, {"$max": {"archived_before": cutoff}})
+
+    def refresh_rollup(self, cutoff: datetime) -> Dict[str, Any]:
+        """아카이브 전체를 다시 집계해 롤업 저장 (증분 대신 재집계 — 이동 중 중단돼도 중복 집계 없음)"""
+        pipe_total, _ = pipeline_by_feed(0)
+        first = self.collection.find_one(DATED, {"published": 1}, sort=[("published", 1)])
+        with self._timed("aggregate"):
+            by_feed = list(self.collection.aggregate(pipe_total))
+            weekday = list(self.collection.aggregate(pipeline_weekday_dist()))
+        prev = self.archived_before()
+        doc = {
+            "total": self.collection.count_documents({}),
+            "by_feed": [{"_id": d["_id"], "total": d["total"], "feed_title": d.get("feed_title", d["_id"])}
+                        for d in by_feed],
+            "weekday": weekday,
+            "first_published": first["published"] if first else None,
+            "archived_before": max(prev, cutoff) if prev else cutoff,
+            "updated_at": datetime.now(timezone.utc),
+        }
+        self.rollups.update_one({"_id": _ROLLUP_ID}, {"$set": doc}, upsert=True)
+        return doc
+
+    def ensure_collection(self):
+        """블록 압축 컬렉션 생성 (인덱스는 조회 패턴이 같으므로 entries와 같은 INDEXES)"""
+        try:
+            self.db.create_collection(
+                self.collection_name,
+                storageEngine={"wiredTiger": {"configString": f"block_compressor={ENTRY_ARCHIVE_COMPRESSOR}"}},
+            )
+        except CollectionInvalid:
+            pass  # 이미 존재
+
+
+class AsyncEntryArchiveRepository(AsyncEntryRepository):
+    """EntryArchiveRepository의 asyncio 변형 (읽기 전용)"""
+
+    def __init__(self):
+        AsyncBaseRepository.__init__(self, ARCHIVE_COLLECTION)
+
+    async def get_rollup(self) -> Optional[Dict[str, Any]]:
+        """아카이브 누적 롤업 (아카이브한 적이 없으면 None)"""
+        return await self.db[ROLLUP_COLLECTION].find_one({"_id": _ROLLUP_ID})
+
+    async def archived_before(self) -> Optional[datetime]:
+        """이 시각 이전 발행 엔트리는 아카이브에 있음 (아카이브한 적이 없으면 None)"""
+        doc = await self.db[ROLLUP_COLLECTION].find_one({"_id": _ROLLUP_ID}, {"archived_before": 1})
+        return _aware(doc.get("archived_before")) if doc else None
+
+    async def boundary(self) -> Tuple[Optional[datetime], int]:
+        """(archived_before, 롤업의 아카이브 전체 건수) — 아카이브한 적이 없으면 (None, 0)"""
+        doc = await self.db[ROLLUP_COLLECTION].find_one({"_id": _ROLLUP_ID}, {"archived_before": 1, "total": 1})
+        if not doc:
+            return None, 0
+        return _aware(doc.get("archived_before")), doc.get("total", 0)
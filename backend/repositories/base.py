@@ -1,11 +1,17 @@
 # backend/repositories/base.py
 from abc import ABC, abstractmethod
 from typing import Any, List, Optional, Dict
+from pymongo import IndexModel
+from pymongo.asynchronous.database import AsyncDatabase
 from pymongo.database import Database
-from backend.core.database import MongoManager
+from backend.core.database import AsyncMongoManager, MongoManager
+from backend.core.metrics import MONGO_OP_DURATION
 
 
 class BaseRepository(ABC):
+    # 이 컬렉션에 있어야 하는 인덱스 선언 (_id 제외) — IndexService가 실제 인덱스와 비교해 맞춤
+    INDEXES: List[IndexModel] = []
+
     def __init__(self, collection_name: str):
         self.collection_name = collection_name
 
@@ -17,6 +23,10 @@ class BaseRepository(ABC):
     def collection(self):
         return self.db[self.collection_name]
 
+    def _timed(self, op: str):
+        """MongoDB 작업 소요 시간 기록 (/metrics)"""
+        return MONGO_OP_DURATION.time(collection=self.collection_name, op=op)
+
     @abstractmethod
     def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         pass
@@ -26,3 +36,36 @@ class BaseRepository(ABC):
         """대량 삽입/수정 처리. 수정된/삽입된 개수 반환"""
         pass
 
+    def ensure_collection(self):
+        """컬렉션 생성 옵션이 필요한 저장소만 재정의 (기본: 첫 쓰기/인덱스 생성 때 자동 생성)"""
+        pass
+
+    def create_indexes(self):
+        """선언된 인덱스(INDEXES) 생성 — 이미 같은 인덱스가 있으면 아무 일도 하지 않음"""
+        self.ensure_collection()
+        if self.INDEXES:
+            self.collection.create_indexes(self.INDEXES)
+
+
+
+class AsyncBaseRepository(ABC):
+    """BaseRepository의 asyncio 변형 (FastAPI 읽기 경로 전용)"""
+
+    def __init__(self, collection_name: str):
+        self.collection_name = collection_name
+
+    @property
+    def db(self) -> AsyncDatabase:
+        return AsyncMongoManager.get_db()
+
+    @property
+    def collection(self):
+        return self.db[self.collection_name]
+
+    def _timed(self, op: str):
+        """MongoDB 작업 소요 시간 기록 (/metrics)"""
+        return MONGO_OP_DURATION.time(collection=self.collection_name, op=op)
+
+    @abstractmethod
+    async def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        pass
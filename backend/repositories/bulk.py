@@ -0,0 +1,176 @@
+# backend/repositories/bulk.py
+"""적응형 bulk_write 배치
+
+고정 작업 수(1000개) 배치 대신
+- 직렬화 크기(BSON 바이트)와 작업 수 중 먼저 닿는 쪽에서 배치를 자르고
+- 배치 왕복 시간을 보고 다음 배치의 작업 수를 조정하며(목표 MONGO_BULK_TARGET_SEC)
+- BulkWriteError에서 일시적 오류로 실패한 작업만 백오프 후 재시도합니다.
+  영구 오류(문서 크기 초과, 스키마 검증 실패 등) 작업은 건너뛰고 나머지는 계속 씁니다.
+
+컬렉션별로 마지막에 맞춘 배치 크기를 프로세스 안에서 기억해 다음 호출이 이어서 사용합니다.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import bson
+from pymongo.errors import AutoReconnect, BulkWriteError, NetworkTimeout
+
+from backend.core.config import (
+    MONGO_BULK_INITIAL_OPS, MONGO_BULK_MIN_OPS, MONGO_BULK_MAX_OPS, MONGO_BULK_MAX_BYTES,
+    MONGO_BULK_TARGET_SEC, MONGO_BULK_RETRIES, MONGO_BULK_RETRY_BACKOFF,
+)
+from backend.core.metrics import (
+    MONGO_BULK_BATCH_SIZE, MONGO_BULK_FAILED_OPS, MONGO_BULK_THROUGHPUT, MONGO_OP_DURATION,
+)
+
+logger = logging.getLogger(__name__)
+
+# 다시 보내면 성공할 수 있는 쓰기 오류 코드
+# (동시 upsert 중복 키, 쓰기 충돌, 프라이머리 교체/종료, 네트워크, 시간 초과)
+RETRYABLE_CODES = frozenset({
+    6, 7, 50, 89, 91, 112, 189, 262, 9001, 10107, 11000, 11600, 11602, 13435, 13436,
+})
+# 보고서에 남길 영구 오류 메시지 수
+_MAX_ERRORS = 5
+
+# 컬렉션별 마지막 배치 작업 수
+_learned: Dict[str, int] = {}
+_learned_lock = threading.Lock()
+
+
+def doc_size(doc: Dict[str, Any]) -> int:
+    """문서의 BSON 크기(바이트) — 배치 크기 계산용"""
+    return len(bson.encode(doc))
+
+
+class AdaptiveBulkWriter:
+    """한 컬렉션에 대한 적응형 bulk_write (ordered=False)"""
+
+    def __init__(
+        self,
+        collection,
+        name: Optional[str] = None,
+        max_ops: int = MONGO_BULK_MAX_OPS,
+        max_bytes: int = MONGO_BULK_MAX_BYTES,
+        target_sec: float = MONGO_BULK_TARGET_SEC,
+        retries: int = MONGO_BULK_RETRIES,
+        backoff: float = MONGO_BULK_RETRY_BACKOFF,
+    ):
+        self.collection = collection
+        self.name = name or collection.name
+        self.max_ops = max(max_ops, MONGO_BULK_MIN_OPS)
+        self.max_bytes = max_bytes
+        self.target_sec = target_sec
+        self.retries = retries
+        self.backoff = backoff
+        with _learned_lock:
+            self.batch_ops = min(_learned.get(self.name, MONGO_BULK_INITIAL_OPS), self.max_ops)
+
+    def _adapt(self, ops: int, full: bool, sec: float) -> None:
+        """왕복 시간이 목표를 넘으면 비례해서 줄이고, 작업 수로 꽉 찬 배치가 빨리 끝나면 1.5배로 늘림"""
+        if sec > self.target_sec:
+            size = max(MONGO_BULK_MIN_OPS, int(ops * self.target_sec / sec))
+        elif full and sec < self.target_sec / 2:
+            size = min(self.max_ops, int(self.batch_ops * 1.5))
+        else:
+            return
+        if size != self.batch_ops:
+            logger.debug(f"bulk 배치 크기 조정 ({self.name}): {self.batch_ops} → {size} ({sec:.3f}초)")
+            self.batch_ops = size
+            with _learned_lock:
+                _learned[self.name] = size
+
+    def write(self, ops: Sequence[Any], sizes: Sequence[int]) -> Dict[str, Any]:
+        """ops를 적응형 배치로 씀 (sizes: 작업별 BSON 크기 추정치)
+
+        Returns:
+            {"upserted", "modified", "matched", "failed", "failed_index", "retried", "batches", "bytes",
+             "elapsed_sec", "ops_per_sec", "batch_ops", "errors"}
+            failed_index는 포기한 작업의 ops 내 위치 (호출자가 해당 문서를 후속 처리에서 제외할 때 사용)
+        """
+        report = {"upserted": 0, "modified": 0, "matched": 0, "failed": 0, "failed_index": [], "retried": 0,
+                  "batches": 0, "bytes": 0, "errors": []}
+        started = time.perf_counter()
+        i, n = 0, len(ops)
+        while i < n:
+            j, nbytes = i, 0
+            limit = self.batch_ops
+            while j < n and j - i < limit and (j == i or nbytes + sizes[j] <= self.max_bytes):
+                nbytes += sizes[j]
+                j += 1
+            sec = self._write_batch(list(range(i, j)), ops, report)
+            count = j - i
+            report["batches"] += 1
+            report["bytes"] += nbytes
+            MONGO_BULK_BATCH_SIZE.observe(count, collection=self.name)
+            if sec > 0:
+                MONGO_BULK_THROUGHPUT.observe(count / sec, collection=self.name)
+            logger.debug(
+                f"bulk 배치 ({self.name}): {count}개, {nbytes / 1024:.0f}KB, {sec:.3f}초, "
+                f"{count / sec if sec > 0 else 0:.0f}개/초"
+            )
+            self._adapt(count, count >= limit, sec)
+            i = j
+
+        elapsed = time.perf_counter() - started
+        report["elapsed_sec"] = round(elapsed, 3)
+        report["ops_per_sec"] = round(n / elapsed) if elapsed > 0 else n
+        report["batch_ops"] = self.batch_ops
+        return report
+
+    def _write_batch(self, pending: List[int], ops: Sequence[Any], report: Dict[str, Any]) -> float:
+        """한 배치(ops 내 위치 목록) 쓰기 + 실패 작업 재시도. 첫 시도의 왕복 시간(초) 반환 (배치 크기 조정용)"""
+        first_sec = 0.0
+        attempt = 0
+        while pending:
+            t0 = time.perf_counter()
+            try:
+                with MONGO_OP_DURATION.time(collection=self.name, op="bulk_write"):
+                    res = self.collection.bulk_write([ops[k] for k in pending], ordered=False)
+                self._count(res.bulk_api_result, report)
+                pending = []
+            except BulkWriteError as e:
+                details = e.details
+                self._count(details, report)
+                retry = []
+                for err in details.get("writeErrors", []):
+                    if err.get("code") in RETRYABLE_CODES:
+                        retry.append(pending[err["index"]])
+                    else:
+                        self._drop([pending[err["index"]]], err.get("errmsg", str(err.get("code"))), report)
+                pending = retry
+            except (AutoReconnect, NetworkTimeout) as e:
+                # 연결 오류 — 배치 전체를 다시 보냄 (upsert/$set/$max는 반복 적용해도 결과가 같음)
+                if attempt >= self.retries:
+                    raise
+                logger.warning(f"bulk_write 연결 오류 ({self.name}), 재시도: {str(e)}")
+            if attempt == 0:
+                first_sec = time.perf_counter() - t0
+            if not pending:
+                break
+            if attempt >= self.retries:
+                self._drop(pending, f"재시도 {self.retries}회 후 실패", report)
+                break
+            attempt += 1
+            report["retried"] += len(pending)
+            MONGO_BULK_FAILED_OPS.inc(len(pending), collection=self.name, outcome="retried")
+            time.sleep(self.backoff * (2 ** (attempt - 1)))
+        return first_sec
+
+    @staticmethod
+    def _count(result: Dict[str, Any], report: Dict[str, Any]) -> None:
+        report["upserted"] += result.get("nUpserted", 0)
+        report["modified"] += result.get("nModified", 0)
+        report["matched"] += result.get("nMatched", 0)
+
+    def _drop(self, index: List[int], reason: str, report: Dict[str, Any]) -> None:
+        """재시도하지 않을 작업 기록 (나머지 작업은 계속 씀)"""
+        count = len(index)
+        report["failed"] += count
+        report["failed_index"].extend(index)
+        MONGO_BULK_FAILED_OPS.inc(count, collection=self.name, outcome="dropped")
+        if len(report["errors"]) < _MAX_ERRORS:
+            report["errors"].append(reason)
+        logger.warning(f"bulk_write 작업 {count}개 실패 ({self.name}): {reason}")
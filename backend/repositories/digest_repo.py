@@ -0,0 +1,46 @@
+# backend/repositories/digest_repo.py
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional
+from pymongo import IndexModel, UpdateOne
+from .base import BaseRepository
+
+
+class DigestInputRepository(BaseRepository):
+    """요약 입력 배치 캐시 (scope, period_unit, period_start 단위)"""
+
+    INDEXES = [
+        IndexModel([("scope", 1), ("period_start", 1), ("period_unit", 1)], unique=True),
+    ]
+
+    def __init__(self):
+        super().__init__("digest_inputs")
+
+    def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        return self.collection.find_one({"_id": id})
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> int:
+        """대량 삽입/수정 처리. 수정된/삽입된 개수 반환"""
+        if not items:
+            return 0
+        ops = [
+            UpdateOne(
+                {"scope": it["scope"], "period_unit": it["period_unit"], "period_start": it["period_start"]},
+                {"$set": it},
+                upsert=True,
+            )
+            for it in items
+        ]
+        res = self.collection.bulk_write(ops, ordered=False)
+        return res.upserted_count + res.modified_count
+
+    def get_batch(self, scope: Dict[str, Any], unit: str, period_start: datetime) -> Optional[Dict[str, Any]]:
+        """캐시된 요약 입력 배치 조회"""
+        return self.collection.find_one(
+            {"scope": scope, "period_unit": unit, "period_start": period_start},
+            {"_id": 0},
+        )
+
+    def save_batch(self, doc: Dict[str, Any]) -> None:
+        """요약 입력 배치 저장 (scope/unit/period_start 기준 upsert)"""
+        doc = {**doc, "built_at": datetime.now(timezone.utc)}
+        self.upsert_many([doc])
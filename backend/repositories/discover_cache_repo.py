@@ -0,0 +1,56 @@
+# backend/repositories/discover_cache_repo.py
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterable, Optional
+from pymongo import IndexModel, UpdateOne
+from .base import BaseRepository
+
+
+class DiscoveryCacheRepository(BaseRepository):
+    """피드 발견 결과 TTL 캐시 — _id는 정규화된 타깃 URL
+
+    후보가 없던 타깃도 저장(negative cache)해 짧은 TTL 동안 재탐색하지 않습니다.
+    CLI/Airflow가 매번 새 프로세스로 실행되므로 프로세스 메모리가 아닌 MongoDB에 둡니다.
+    """
+
+    INDEXES = [
+        # 만료 문서 자동 삭제
+        IndexModel([("expires_at", 1)], expireAfterSeconds=0),
+    ]
+
+    def __init__(self):
+        super().__init__("discover_cache")
+
+    def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        return self.collection.find_one({"_id": id})
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> int:
+        """대량 삽입/수정 처리. 수정된/삽입된 개수 반환"""
+        if not items:
+            return 0
+        ops = [UpdateOne({"_id": it["_id"]}, {"$set": it}, upsert=True) for it in items]
+        res = self.collection.bulk_write(ops, ordered=False)
+        return res.upserted_count + res.modified_count
+
+    def get_many(self, targets: Iterable[str]) -> Dict[str, List[str]]:
+        """만료되지 않은 캐시 {타깃: 후보 목록} (TTL 모니터는 분 단위라 expires_at도 직접 비교)"""
+        now = datetime.now(timezone.utc)
+        cur = self.collection.find(
+            {"_id": {"$in": list(targets)}, "expires_at": {"$gt": now}},
+            {"candidates": 1},
+        )
+        with self._timed("find"):
+            return {d["_id"]: d.get("candidates", []) for d in cur}
+
+    def put_many(self, results: Dict[str, List[str]], ttl_sec: int, negative_ttl_sec: int) -> int:
+        """발견 결과 저장 (후보가 없으면 negative_ttl_sec 적용)"""
+        now = datetime.now(timezone.utc)
+        items = [
+            {
+                "_id": target,
+                "candidates": cands,
+                "cached_at": now,
+                "expires_at": now + timedelta(seconds=ttl_sec if cands else negative_ttl_sec),
+            }
+            for target, cands in results.items()
+        ]
+        return self.upsert_many(items)
@@ -1,37 +1,156 @@
 # backend/repositories/entry_repo.py
-from typing import List, Dict, Any, Optional, Tuple
-from pymongo import UpdateOne
-from .base import BaseRepository
+from typing import List, Dict, Any, Optional, Set, Tuple
+from pymongo import IndexModel, UpdateOne
+from backend.core.config import ENTRY_STORAGE_MODE
+from backend.core.metrics import MONGO_OP_DURATION
+from backend.utils.agg_queries import DATED
+from backend.utils.entry_body import author_docs, split_entry, unpack_body
+from .base import AsyncBaseRepository, BaseRepository
+from .bulk import AdaptiveBulkWriter, doc_size
+
+ENTRY_BODIES_COLLECTION = "entry_bodies"
 
 
 class EntryRepository(BaseRepository):
+    INDEXES = [
+        # /entries 피드·도메인 필터 + 최신순, 요약 입력 조회
+        IndexModel([("feed_url", 1), ("published", -1)]),
+        IndexModel([("domain", 1), ("published", -1)]),
+        # 필터 없는 최신순 목록, 보관 기간 경계 조회 (published 없는 엔트리 포함)
+        IndexModel([("published", -1)]),
+        # 미러링 시각 기준 조회
+        IndexModel([("mirrored_at", 1)]),
+        # 통계 최근 N일 집계/요일 분포/기간 경계 — published가 있는 엔트리만 담는 부분 인덱스
+        # (집계에 필요한 필드를 모두 포함해 문서를 읽지 않음)
+        IndexModel([("published", -1), ("feed_url", 1)], name="published_feed_url_dated",
+                   partialFilterExpression=DATED),
+        IndexModel([("published", -1), ("domain", 1)], name="published_domain_dated",
+                   partialFilterExpression=DATED),
+    ]
+
     def __init__(self):
         super().__init__("entries")
+        # 마지막 upsert_many의 bulk 보고서 (배치 수, 처리량, 실패 작업)
+        self.last_bulk: Optional[Dict[str, Any]] = None
+
+    @property
+    def bodies(self):
+        """compact 모드의 본문 컬렉션 (압축 summary + authors)"""
+        return self.db[ENTRY_BODIES_COLLECTION]
 
     def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         return self.collection.find_one({"_id": id})
 
-    def upsert_many(self, items: List[Dict[str, Any]], batch_size: int = 1000) -> int:
-        """대량 삽입/수정 처리. 1000개 단위로 배치 처리. 수정된/삽입된 개수 반환"""
+    def _with_body(self, ids: List[str], chunk: int = 1000) -> Set[str]:
+        """ids 중 현재 has_body=True인 엔트리 _id 집합"""
+        found: Set[str] = set()
+        for i in range(0, len(ids), chunk):
+            with self._timed("find"):
+                found.update(d["_id"] for d in self.collection.find(
+                    {"_id": {"$in": ids[i:i + chunk]}, "has_body": True}, {"_id": 1}))
+        return found
+
+    def _write_compact(self, items: List[Dict[str, Any]], had_body: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """compact 형식으로 entries/entry_bodies 쓰기 (had_body: 기존 has_body 문서 _id, None이면 조회)
+
+        본문을 먼저 쓰고, 본문 쓰기에 실패한 엔트리는 이번에 entries를 건드리지 않습니다
+        (기존 문서·본문 유지, 다음 미러링에서 다시 씀). 본문이 필요 없어진 엔트리의 이전 본문은
+        entries 갱신 뒤 지웁니다. 반환 보고서의 failed/failed_index는 items 기준입니다.
+        """
+        ops, sizes, body_ops, body_sizes, body_pos, bodyless = [], [], [], [], [], []
+        for item in items:
+            hot, body, unset = split_entry(item)
+            update: Dict[str, Any] = {"$set": hot}
+            if unset:
+                update["$unset"] = {k: "" for k in unset}
+            ops.append(UpdateOne({"_id": item["_id"]}, update, upsert=True))
+            sizes.append(doc_size(hot))
+            if body:
+                body_ops.append(UpdateOne({"_id": body["_id"]}, {"$set": body}, upsert=True))
+                body_sizes.append(doc_size(body))
+                body_pos.append(len(ops) - 1)
+            else:
+                bodyless.append(item["_id"])
+
+        # 본문이 있던 엔트리인지는 entries를 덮어쓰기 전에 확인
+        stale = [i for i in bodyless if i in had_body] if had_body is not None else list(self._with_body(bodyless))
+
+        body_report = AdaptiveBulkWriter(self.bodies, ENTRY_BODIES_COLLECTION).write(body_ops, body_sizes) if body_ops else None
+        skip = {body_pos[k] for k in body_report["failed_index"]} if body_report else set()
+        keep = [i for i in range(len(ops)) if i not in skip]
+        report = AdaptiveBulkWriter(self.collection, self.collection_name).write(
+            [ops[i] for i in keep], [sizes[i] for i in keep])
+        failed = sorted(skip | {keep[k] for k in report["failed_index"]})
+        report["failed"], report["failed_index"] = len(failed), failed
+        if body_report:
+            report["errors"] = body_report["errors"] + report["errors"]
+            report["bodies"] = {"ops": len(body_ops), **{k: body_report[k] for k in ("upserted", "modified", "failed")}}
+
+        # 작아진 엔트리(본문 없음)의 이전 entry_bodies 문서 삭제
+        failed_ids = {items[i]["_id"] for i in failed}
+        stale = [i for i in stale if i not in failed_ids]
+        if stale:
+            with MONGO_OP_DURATION.time(collection=ENTRY_BODIES_COLLECTION, op="delete_many"):
+                report["bodies_deleted"] = self.bodies.delete_many({"_id": {"$in": stale}}).deleted_count
+        return report
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> int:
+        """대량 삽입/수정 처리 (적응형 배치, 실패 작업만 재시도). 수정된/삽입된 개수 반환
+
+        ENTRY_STORAGE_MODE=compact면 큰 summary/authors를 entry_bodies로 분리해 저장합니다.
+        배치별 처리량/실패 보고서(본문 쓰기 실패 포함)는 last_bulk에 남습니다.
+        """
         if not items:
             return 0
 
-        total_upserted = 0
-        total_modified = 0
+        if ENTRY_STORAGE_MODE == "compact":
+            self.last_bulk = self._write_compact(items)
+        else:
+            # item["_id"]가 반드시 존재해야 함
+            ops = [UpdateOne({"_id": item["_id"]}, {"$set": item}, upsert=True) for item in items]
+            sizes = [doc_size(item) for item in items]
+            self.last_bulk = AdaptiveBulkWriter(self.collection, self.collection_name).write(ops, sizes)
+        return self.last_bulk["upserted"] + self.last_bulk["modified"]
 
-        for i in range(0, len(items), batch_size):
-            batch = items[i:i + batch_size]
-            ops = []
-            for item in batch:
-                # item["_id"]가 반드시 존재해야 함
-                ops.append(UpdateOne({"_id": item["_id"]}, {"$set": item}, upsert=True))
+    def load_bodies(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """entry_bodies에서 본문 로드 {엔트리 ID: {"summary", "authors"}}"""
+        if not ids:
+            return {}
+        with MONGO_OP_DURATION.time(collection=ENTRY_BODIES_COLLECTION, op="find"):
+            return {b["_id"]: unpack_body(b) for b in self.bodies.find({"_id": {"$in": ids}})}
 
-            if ops:
-                res = self.collection.bulk_write(ops, ordered=False)
-                total_upserted += res.upserted_count
-                total_modified += res.modified_count
+    def attach_bodies(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """summary가 없는 has_body 문서에 분리 저장된 본문을 채움 (inline 문서는 그대로)"""
+        need = [d["_id"] for d in docs if d.get("has_body") and "summary" not in d]
+        bodies = self.load_bodies(need)
+        for d in docs:
+            for k, v in bodies.get(d["_id"], {}).items():
+                d.setdefault(k, v)
+        return docs
 
-        return total_upserted + total_modified
+    def compact_existing(self, batch_size: int = 1000) -> Dict[str, int]:
+        """기존 inline 문서를 compact 형식으로 변환 (_id 순서로 배치 처리, 중단 후 재실행 가능)"""
+        legacy = {"$or": [
+            {"summary": {"$exists": True}, "preview": {"$exists": False}},
+            {"authors": {"$exists": True}},
+        ]}
+        converted = offloaded = failed = 0
+        last = None
+        while True:
+            q = legacy if last is None else {"$and": [legacy, {"_id": {"$gt": last}}]}
+            batch = list(self.collection.find(q).sort([("_id", 1)]).limit(batch_size))
+            if not batch:
+                break
+            for d in batch:
+                d["authors"] = author_docs(d.get("authors"))
+            had_body = {d["_id"] for d in batch if d.get("has_body")}
+            report = self._write_compact(batch, had_body)
+            converted += len(batch) - report["failed"]
+            bodies = report.get("bodies", {})
+            offloaded += bodies.get("ops", 0) - bodies.get("failed", 0)
+            failed += report["failed"]
+            last = batch[-1]["_id"]
+        return {"converted": converted, "bodies": offloaded, "failed": failed}
 
     def estimated_count(self) -> int:
         """entries 컬렉션 예상 문서 수"""
@@ -39,7 +158,8 @@ class EntryRepository(BaseRepository):
 
     def aggregate(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """aggregation 파이프라인 실행"""
-        return list(self.collection.aggregate(pipeline))
+        with self._timed("aggregate"):
+            return list(self.collection.aggregate(pipeline))
 
     def find_one(self, filter: Optional[Dict[str, Any]] = None, sort: Optional[List[Tuple[str, int]]] = None) -> Optional[Dict[str, Any]]:
         """단일 문서 조회 (정렬 옵션 포함)"""
@@ -47,9 +167,96 @@ class EntryRepository(BaseRepository):
             filter = {}
         return self.collection.find_one(filter, sort=sort)
 
-    def create_indexes(self):
-        """인덱스 생성 로직"""
-        self.collection.create_index([("feed_url", 1), ("published", -1)])
-        self.collection.create_index([("domain", 1), ("published", -1)])
-        self.collection.create_index([("published", -1)])
+    def find(
+        self,
+        filter: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """조건 조회 (정렬/제한 옵션 포함)"""
+        cur = self.collection.find(filter, projection)
+        if sort:
+            cur = cur.sort(sort)
+        if limit:
+            cur = cur.limit(limit)
+        with self._timed("find"):
+            return list(cur)
+
+    def count(self, filter: Dict[str, Any]) -> int:
+        """조건에 맞는 문서 수 (인덱스 범위 카운트)"""
+        return self.collection.count_documents(filter)
+
+    def existing_ids(self, ids: List[str]) -> Set[str]:
+        """ids 중 이 컬렉션에 있는 _id 집합 (_id 인덱스만 읽음)"""
+        if not ids:
+            return set()
+        with self._timed("find"):
+            return {d["_id"] for d in self.collection.find({"_id": {"$in": ids}}, {"_id": 1})}
+
+    def delete_ids(self, ids: List[str]) -> int:
+        """_id 목록 삭제. 삭제된 개수 반환"""
+        if not ids:
+            return 0
+        with self._timed("delete_many"):
+            return self.collection.delete_many({"_id": {"$in": ids}}).deleted_count
+
+
+
+class AsyncEntryRepository(AsyncBaseRepository):
+    """EntryRepository의 asyncio 변형 (읽기 전용)"""
+
+    def __init__(self):
+        super().__init__("entries")
+
+    async def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one({"_id": id})
+
+    async def estimated_count(self) -> int:
+        """entries 컬렉션 예상 문서 수"""
+        return await self.collection.estimated_document_count()
+
+    async def get_with_body(self, id: str) -> Optional[Dict[str, Any]]:
+        """엔트리 단건 + 분리 저장된 본문 (compact 모드 문서도 summary/authors 포함)"""
+        doc = await self.collection.find_one({"_id": id})
+        if doc and doc.get("has_body"):
+            with MONGO_OP_DURATION.time(collection=ENTRY_BODIES_COLLECTION, op="find"):
+                body = await self.db[ENTRY_BODIES_COLLECTION].find_one({"_id": id})
+            for k, v in unpack_body(body).items():
+                doc.setdefault(k, v)
+        return doc
+
+    async def aggregate(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """aggregation 파이프라인 실행"""
+        with self._timed("aggregate"):
+            cur = await self.collection.aggregate(pipeline)
+            return await cur.to_list(None)
+
+    async def find_one(self, filter: Optional[Dict[str, Any]] = None, sort: Optional[List[Tuple[str, int]]] = None) -> Optional[Dict[str, Any]]:
+        """단일 문서 조회 (정렬 옵션 포함)"""
+        if filter is None:
+            filter = {}
+        return await self.collection.find_one(filter, sort=sort)
+
+    async def find(
+        self,
+        filter: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        skip: int = 0,
+        limit: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """조건 조회 (정렬/건너뛰기/제한 옵션 포함)"""
+        cur = self.collection.find(filter, projection)
+        if sort:
+            cur = cur.sort(sort)
+        if skip:
+            cur = cur.skip(skip)
+        if limit:
+            cur = cur.limit(limit)
+        with self._timed("find"):
+            return await cur.to_list(None)
 
+    async def count(self, filter: Dict[str, Any]) -> int:
+        """조건에 맞는 문서 수 (인덱스 범위 카운트)"""
+        return await self.collection.count_documents(filter)
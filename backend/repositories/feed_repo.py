@@ -1,16 +1,65 @@
 # backend/repositories/feed_repo.py
-from typing import List, Dict, Any, Optional
-from pymongo import UpdateOne
-from .base import BaseRepository
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+from pymongo import IndexModel, UpdateOne
+from .base import AsyncBaseRepository, BaseRepository
+from .bulk import AdaptiveBulkWriter, doc_size
+from .sync_state_repo import FEEDS_VERSION, SyncStateRepository
+
+FEED_LIST_PROJECTION = {"_id": 1, "title": 1, "site_url": 1, "enabled": 1}
+# 필드 몇 개짜리 작업의 BSON 크기 추정치(바이트)
+_SMALL_OP_BYTES = 128
 
 
 class FeedRepository(BaseRepository):
+    INDEXES = [
+        # _id는 기본적으로 unique 인덱스가 자동 생성됨
+        # /feeds 커서 페이지네이션: (정렬 필드, _id) — 역방향 스캔으로 asc/desc 모두 처리
+        IndexModel([("title", 1), ("_id", 1)]),
+        IndexModel([("last_published", 1), ("_id", 1)]),
+        IndexModel([("enabled", 1), ("_id", 1)]),
+        # enabled 필터 + 정렬
+        IndexModel([("enabled", 1), ("title", 1), ("_id", 1)]),
+        IndexModel([("enabled", 1), ("last_published", 1), ("_id", 1)]),
+    ]
+
     def __init__(self):
         super().__init__("feeds")
+        self.state_repo = SyncStateRepository()
+
+    def _changed(self, n: int) -> None:
+        """피드가 추가/삭제됐으면 대상 버전 증가 (동기화 생략 판정용)"""
+        if n:
+            self.state_repo.bump(FEEDS_VERSION)
 
     def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
         return self.collection.find_one({"_id": id})
 
+    def list_ids(self) -> List[str]:
+        """전체 피드 _id (_id 인덱스만 읽음)"""
+        with self._timed("find"):
+            return [d["_id"] for d in self.collection.find({}, {"_id": 1})]
+
+    def add_urls(self, urls: List[str]) -> Dict[str, int]:
+        """URL만으로 피드 추가 (제목/사이트는 URL, 활성화) — {"upserted", "modified"}"""
+        if not urls:
+            return {"upserted": 0, "modified": 0}
+        ops = [UpdateOne({"_id": u}, {"$set": {"title": u, "site_url": u, "enabled": True}}, upsert=True)
+               for u in urls]
+        with self._timed("bulk_write"):
+            res = self.collection.bulk_write(ops, ordered=False)
+        self._changed(res.upserted_count)
+        return {"upserted": res.upserted_count, "modified": res.modified_count}
+
+    def delete_ids(self, ids: List[str]) -> int:
+        """_id 목록 삭제. 삭제된 개수 반환"""
+        if not ids:
+            return 0
+        with self._timed("delete_many"):
+            deleted = self.collection.delete_many({"_id": {"$in": ids}}).deleted_count
+        self._changed(deleted)
+        return deleted
+
     def upsert_many(self, items: List[Dict[str, Any]]) -> int:
         """대량 삽입/수정 처리. 수정된/삽입된 개수 반환"""
         if not items:
@@ -21,19 +70,42 @@ class FeedRepository(BaseRepository):
             # item["_id"]가 반드시 존재해야 함
             ops.append(UpdateOne({"_id": item["_id"]}, {"$set": item}, upsert=True))
 
-        # bulk_write 실행
-        res = self.collection.bulk_write(ops, ordered=False)
-        return res.upserted_count + res.modified_count
+        # 적응형 배치로 bulk_write 실행 (실패 작업만 재시도)
+        report = AdaptiveBulkWriter(self.collection, self.collection_name).write(ops, [doc_size(i) for i in items])
+        self._changed(report["upserted"])
+        return report["upserted"] + report["modified"]
 
     def count(self) -> int:
         """feeds 컬렉션 문서 수 조회"""
         return self.collection.estimated_document_count()
 
-    def create_indexes(self):
-        """인덱스 생성 로직"""
-        # _id는 기본적으로 unique 인덱스가 자동 생성됨
-        # 필요시 추가 인덱스 생성 가능
-        pass
+    def list_feeds(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """피드 목록 조회 (기본: 목록 표시용 필드만)"""
+        cur = self.collection.find(filter or {}, projection or FEED_LIST_PROJECTION)
+        if sort:
+            cur = cur.sort(sort)
+        if limit:
+            cur = cur.limit(limit)
+        with self._timed("find"):
+            return list(cur)
+
+    def update_last_published(self, latest: Dict[str, datetime]) -> int:
+        """피드별 최신 발행 시각 갱신 ($max라 과거 값으로 덮어쓰지 않음)"""
+        ops = [
+            UpdateOne({"_id": url}, {"$max": {"last_published": dt}})
+            for url, dt in latest.items() if dt is not None
+        ]
+        if not ops:
+            return 0
+        # 작업 하나가 (_id, 시각) 수준으로 작으므로 크기는 고정 추정치
+        report = AdaptiveBulkWriter(self.collection, self.collection_name).write(ops, [_SMALL_OP_BYTES] * len(ops))
+        return report["modified"]
 
     def get_enabled_feeds(self) -> List[str]:
         """활성화된 피드 URL 목록 반환"""
@@ -41,7 +113,14 @@ class FeedRepository(BaseRepository):
             {"enabled": {"$ne": False}},  # enabled가 False가 아닌 모든 문서 (None도 포함)
             {"_id": 1}
         )
-        return [feed["_id"] for feed in feeds]
+        with self._timed("find"):
+            return [feed["_id"] for feed in feeds]
+
+    def get_titles(self) -> Dict[str, str]:
+        """제목이 있는 피드 {URL: 제목} (OPML 내보내기용)"""
+        cur = self.collection.find({"title": {"$type": "string"}}, {"title": 1})
+        with self._timed("find"):
+            return {feed["_id"]: feed["title"] for feed in cur}
 
     def add_feed(self, url: str, title: Optional[str] = None, site_url: Optional[str] = None, enabled: bool = True) -> bool:
         """피드 추가 (또는 업데이트)"""
@@ -55,11 +134,13 @@ class FeedRepository(BaseRepository):
             {"$set": doc, "$setOnInsert": {"enabled": enabled}},
             upsert=True
         )
-        return result.upserted_count > 0 or result.modified_count > 0
+        self._changed(result.upserted_id is not None)
+        return result.upserted_id is not None or result.modified_count > 0
 
     def remove_feed(self, url: str) -> bool:
         """피드 삭제"""
         result = self.collection.delete_one({"_id": url})
+        self._changed(result.deleted_count)
         return result.deleted_count > 0
 
     def set_enabled(self, url: str, enabled: bool) -> bool:
@@ -72,7 +153,7 @@ class FeedRepository(BaseRepository):
 
     def bulk_upsert_feeds(self, feeds) -> Dict[str, Any]:
         """Reader feed 객체 리스트를 받아 MongoDB로 변환하여 upsert"""
-        ops = []
+        ops, sizes = [], []
         for f in feeds:
             url = getattr(f, "url", None)
             title = getattr(f, "title", None) or url
@@ -91,9 +172,48 @@ class FeedRepository(BaseRepository):
                 },
                 upsert=True
             ))
+            sizes.append(_SMALL_OP_BYTES + len(url) + len(title) + len(site_url))
 
         if ops:
-            res = self.collection.bulk_write(ops, ordered=False)
-            return {"feeds_upserted": res.upserted_count, "feeds_modified": res.modified_count}
-        return {"feeds_upserted": 0, "feeds_modified": 0}
+            report = AdaptiveBulkWriter(self.collection, self.collection_name).write(ops, sizes)
+            self._changed(report["upserted"])
+            return {"feeds_upserted": report["upserted"], "feeds_modified": report["modified"],
+                    "feeds_failed": report["failed"]}
+        return {"feeds_upserted": 0, "feeds_modified": 0, "feeds_failed": 0}
+
+
 
+class AsyncFeedRepository(AsyncBaseRepository):
+    """FeedRepository의 asyncio 변형 (읽기 전용)"""
+
+    def __init__(self):
+        super().__init__("feeds")
+
+    async def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one({"_id": id})
+
+    async def count(self) -> int:
+        """feeds 컬렉션 문서 수 조회"""
+        return await self.collection.estimated_document_count()
+
+    async def list_feeds(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        limit: int = 0,
+    ) -> List[Dict[str, Any]]:
+        """피드 목록 조회 (기본: 목록 표시용 필드만)"""
+        cur = self.collection.find(filter or {}, projection or FEED_LIST_PROJECTION)
+        if sort:
+            cur = cur.sort(sort)
+        if limit:
+            cur = cur.limit(limit)
+        with self._timed("find"):
+            return await cur.to_list(None)
+
+    async def get_enabled_feeds(self) -> List[str]:
+        """활성화된 피드 URL 목록 반환"""
+        cur = self.collection.find({"enabled": {"$ne": False}}, {"_id": 1})
+        with self._timed("find"):
+            return [feed["_id"] async for feed in cur]
@@ -0,0 +1,51 @@
+# backend/repositories/run_repo.py
+from typing import List, Dict, Any, Optional
+from pymongo import IndexModel, UpdateOne
+from .base import BaseRepository
+
+
+class CrawlRunRepository(BaseRepository):
+    """크롤러 실행(update_all) 이력 — _id는 run_id"""
+
+    INDEXES = [
+        IndexModel([("started_at", -1)]),
+        IndexModel([("trigger", 1), ("started_at", -1)]),
+        IndexModel([("status", 1), ("started_at", -1)]),
+    ]
+
+    def __init__(self):
+        super().__init__("crawl_runs")
+
+    def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        return self.collection.find_one({"_id": id})
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> int:
+        """대량 삽입/수정 처리. 수정된/삽입된 개수 반환"""
+        if not items:
+            return 0
+        ops = [UpdateOne({"_id": it["_id"]}, {"$set": it}, upsert=True) for it in items]
+        res = self.collection.bulk_write(ops, ordered=False)
+        return res.upserted_count + res.modified_count
+
+    def start_run(self, doc: Dict[str, Any]) -> None:
+        """실행 시작 기록 (status=running)"""
+        self.collection.insert_one(doc)
+
+    def finish_run(self, run_id: str, fields: Dict[str, Any]) -> None:
+        """실행 종료 기록 (소요 시간, 단계별 시간, 결과/에러)"""
+        self.collection.update_one({"_id": run_id}, {"$set": fields})
+
+    def list_runs(
+        self,
+        filter: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """실행 이력 조회 (최신순)"""
+        cur = self.collection.find(filter or {}).sort([("started_at", -1)])
+        if skip:
+            cur = cur.skip(skip)
+        if limit:
+            cur = cur.limit(limit)
+        with self._timed("find"):
+            return list(cur)
@@ -0,0 +1,50 @@
+# backend/repositories/sync_state_repo.py
+from typing import List, Dict, Any, Optional
+from pymongo import ReturnDocument, UpdateOne
+from .base import BaseRepository
+
+# 대상 피드 집합 버전 문서 _id — 피드가 추가/삭제될 때마다 1씩 증가
+FEEDS_VERSION = "version:feeds"
+READER_FEEDS_VERSION = "version:reader_feeds"
+
+
+class SyncStateRepository(BaseRepository):
+    """동기화 마지막 적용 상태 — _id는 동기화 종류(sot_mongo, yaml_reader)
+
+    입력 파일 지문과 적용 직후 대상 버전(FEEDS_VERSION / READER_FEEDS_VERSION)을 저장해, 둘 다 그대로면
+    다음 동기화를 생략합니다. 대상 버전은 피드를 추가/삭제하는 쪽(FeedRepository, Reader 피드를
+    바꾸는 서비스)이 bump로 올리므로 생략 판정은 문서 두 개만 읽습니다 (피드 목록을 읽지 않음).
+    """
+
+    # _id 단건 조회만 하므로 추가 인덱스 없음
+    INDEXES = []
+
+    def __init__(self):
+        super().__init__("sync_state")
+
+    def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        return self.collection.find_one({"_id": id})
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> int:
+        """대량 삽입/수정 처리. 수정된/삽입된 개수 반환"""
+        if not items:
+            return 0
+        ops = [UpdateOne({"_id": it["_id"]}, {"$set": it}, upsert=True) for it in items]
+        res = self.collection.bulk_write(ops, ordered=False)
+        return res.upserted_count + res.modified_count
+
+    def save(self, id: str, fields: Dict[str, Any]) -> None:
+        """상태 저장 (없으면 생성)"""
+        self.collection.update_one({"_id": id}, {"$set": fields}, upsert=True)
+
+    def version(self, id: str) -> int:
+        """대상 버전 (한 번도 바뀐 적 없으면 0)"""
+        doc = self.collection.find_one({"_id": id}, {"version": 1})
+        return doc.get("version", 0) if doc else 0
+
+    def bump(self, id: str) -> int:
+        """대상 버전 1 증가 후 새 값 반환"""
+        doc = self.collection.find_one_and_update(
+            {"_id": id}, {"$inc": {"version": 1}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        return doc["version"]
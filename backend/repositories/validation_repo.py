@@ -0,0 +1,65 @@
+# backend/repositories/validation_repo.py
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Any, Iterable, Optional
+from pymongo import IndexModel, UpdateOne
+from .base import BaseRepository
+
+
+class FeedValidationRepository(BaseRepository):
+    """피드 검증 결과 — _id는 정규화된 피드 URL
+
+    ok=False 문서가 격리(quarantine) 목록입니다. 격리된 URL은 Reader/feeds에 등록되지 않고,
+    다음 등록 시도 때 다시 검증됩니다. ok=None 문서는 시간 예산 안에 확인하지 못한 채 등록된
+    URL(보류)로, FeedService.revalidate_deferred가 다시 검증합니다.
+    """
+
+    INDEXES = [
+        IndexModel([("ok", 1), ("checked_at", -1)]),
+    ]
+
+    def __init__(self):
+        super().__init__("feed_validations")
+
+    def find_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        return self.collection.find_one({"_id": id})
+
+    def upsert_many(self, items: List[Dict[str, Any]]) -> int:
+        """대량 삽입/수정 처리. 수정된/삽입된 개수 반환"""
+        if not items:
+            return 0
+        ops = [UpdateOne({"_id": it["_id"]}, {"$set": it}, upsert=True) for it in items]
+        with self._timed("bulk_write"):
+            res = self.collection.bulk_write(ops, ordered=False)
+        return res.upserted_count + res.modified_count
+
+    def get_fresh_ok(self, urls: Iterable[str], ttl_sec: int) -> Dict[str, Dict[str, Any]]:
+        """ttl_sec 안에 검증을 통과한 URL {url: 결과}"""
+        since = datetime.now(timezone.utc) - timedelta(seconds=ttl_sec)
+        cur = self.collection.find({"_id": {"$in": list(urls)}, "ok": True, "checked_at": {"$gte": since}})
+        with self._timed("find"):
+            return {d["_id"]: d for d in cur}
+
+    def record_many(self, results: Iterable[Dict[str, Any]], source: str) -> int:
+        """검증 결과 저장 (source: api|opml|discover|revalidate)"""
+        now = datetime.now(timezone.utc)
+        items = [{**{k: v for k, v in r.items() if k != "url"}, "_id": r["url"], "source": source, "checked_at": now}
+                 for r in results]
+        return self.upsert_many(items)
+
+    def list_deferred(self, limit: int = 0) -> List[Dict[str, Any]]:
+        """검증 보류(ok=None) URL 목록 (오래된 순)"""
+        cur = self.collection.find({"ok": None}).sort([("checked_at", 1)])
+        if limit:
+            cur = cur.limit(limit)
+        with self._timed("find"):
+            return list(cur)
+
+    def list_quarantined(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """격리된 URL 목록 (최근 검증순)"""
+        cur = self.collection.find({"ok": False}).sort([("checked_at", -1)])
+        if skip:
+            cur = cur.skip(skip)
+        if limit:
+            cur = cur.limit(limit)
+        with self._timed("find"):
+            return list(cur)
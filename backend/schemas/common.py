@@ -1,6 +1,7 @@
 # backend/schemas/common.py
+from datetime import datetime
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class MessageResponse(BaseModel):
@@ -15,6 +16,8 @@ class HealthResponse(BaseModel):
 class DiscoverRequest(BaseModel):
     url: str
     top_k: int = 3
+    refresh: bool = False
+    skip_validation: bool = False
 
 
 class DiscoverResponse(BaseModel):
@@ -22,6 +25,10 @@ class DiscoverResponse(BaseModel):
     candidates: list[str]
     added: int
     skipped: int
+    known: int = 0
+    invalid: int = 0
+    status: Optional[str] = None
+    error: Optional[str] = None
 
 
 class InitResponse(BaseModel):
@@ -36,6 +43,30 @@ class UpdateResponse(BaseModel):
     status: str
     message: str
     days: Optional[int] = None
+    run_id: Optional[str] = None
+    profile: Optional[str] = None
+
+
+class CrawlRunResponse(BaseModel):
+    run_id: str
+    trigger: str
+    status: str
+    days: Optional[int] = None
+    started_at: datetime
+    finished_at: Optional[datetime] = None
+    duration_sec: Optional[float] = None
+    phases: Dict[str, float] = {}
+    feeds_attempted: int = 0
+    feeds_failed: int = 0
+    entries_new: int = 0
+    entries_updated: int = 0
+    entries_mirrored: int = 0
+    profile: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+
+class CrawlRunListResponse(BaseModel):
+    runs: List[CrawlRunResponse]
 
 
 class MigrateResponse(BaseModel):
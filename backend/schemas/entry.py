@@ -16,6 +16,18 @@ class EntryResponse(BaseModel):
         from_attributes = True
 
 
+class EntryDetailResponse(EntryResponse):
+    updated: Optional[datetime] = None
+    summary: Optional[str] = None
+    preview: Optional[str] = None
+    authors: list[Dict[str, str]] = []
+
+
+class EntryListResponse(BaseModel):
+    entries: list[EntryResponse]
+    total: int
+
+
 class DomainStats(BaseModel):
     domain: str
     count: int
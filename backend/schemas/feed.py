@@ -1,6 +1,7 @@
 # backend/schemas/feed.py
 from pydantic import BaseModel, HttpUrl, Field
 from typing import Optional
+from datetime import datetime
 
 
 class FeedBase(BaseModel):
@@ -21,6 +22,7 @@ class FeedUpdate(BaseModel):
 
 class FeedResponse(FeedBase):
     enabled: bool = Field(True, description="활성화 여부")
+    last_published: Optional[datetime] = Field(None, description="최신 엔트리 발행 시각")
 
     class Config:
         from_attributes = True
@@ -28,7 +30,8 @@ class FeedResponse(FeedBase):
 
 class FeedListResponse(BaseModel):
     feeds: list[FeedResponse]
-    total: int
+    total: Optional[int] = Field(None, description="전체 조회(limit 미지정)일 때만 채워짐")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
 
 
 class FeedOperationResponse(BaseModel):
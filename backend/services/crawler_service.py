@@ -7,21 +7,45 @@ RSS 피드 발견 로직은 backend.utils.discovery를 사용합니다.
 import hashlib
 import logging
 import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from urllib.parse import urlparse
 from inspect import signature
 
-from backend.repositories import FeedRepository, EntryRepository
+from backend.core.config import INGEST_TARGETED_MAX, INGEST_UPDATE_WORKERS
+from backend.core.metrics import ENTRIES_MIRRORED, MIRROR_ENTRIES_PER_RUN, READER_UPDATE_DURATION
+from backend.repositories import (
+    FeedRepository, EntryRepository, CrawlRunRepository, EntryArchiveRepository, SyncStateRepository
+)
+from backend.repositories.sync_state_repo import READER_FEEDS_VERSION
 from backend.services.reader_service import ReaderService
+from backend.utils.blacklist import get_blacklist
+from backend.utils.entry_body import author_docs
 from backend.utils.agg_queries import (
     pipeline_recent_count, pipeline_domains_top, 
-    pipeline_by_feed, pipeline_weekday_dist
+    pipeline_by_feed, pipeline_weekday_dist, shape_stats, DATED
 )
-from backend.utils.discovery import discover_rss_feeds
+from backend.utils.profiling import RunProfiler, artifact_path, list_artifacts, new_run_id
 
 logger = logging.getLogger(__name__)
 
+# 실행 트리거 구분 (crawl_runs.trigger)
+RUN_TRIGGERS = ("api", "cli", "dag")
+# ingest_feeds 대량 업데이트 대상 표시용 임시 피드 태그
+_INGEST_TAG = "redfin-ingest"
+
+
+def entry_key(e) -> str:
+    """Reader 엔트리 → MongoDB _id (엔트리 고유 키)"""
+    if getattr(e, "id", None):
+        return str(e.id)
+    if getattr(e, "link", None):
+        return str(e.link)
+    base = f"{e.feed.url}|{getattr(e,'title',None)}|{getattr(e,'published',None)}"
+    return hashlib.sha256(base.encode("utf-8", "ignore")).hexdigest()
+
 
 class CrawlerService:
     """RSS 피드 수집 및 MongoDB 미러링 서비스"""
@@ -30,13 +54,20 @@ class CrawlerService:
         self,
         feed_repo: Optional[FeedRepository] = None,
         entry_repo: Optional[EntryRepository] = None,
+        run_repo: Optional[CrawlRunRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+        state_repo: Optional[SyncStateRepository] = None,
     ):
         self.feed_repo = feed_repo or FeedRepository()
         self.entry_repo = entry_repo or EntryRepository()
+        self.run_repo = run_repo or CrawlRunRepository()
+        self.archive_repo = archive_repo or EntryArchiveRepository()
+        self.state_repo = state_repo or SyncStateRepository()
         self.reader_service = ReaderService()
 
     def discover_urls(self, url: str, top_k: int = 3) -> List[str]:
         """URL에서 RSS 피드 발견 (utils/discovery.py 사용)"""
+        from backend.utils.discovery import discover_rss_feeds
         return discover_rss_feeds(url, top_k=top_k)
 
     def _supports_newer_than(self, r) -> bool:
@@ -61,175 +92,379 @@ class CrawlerService:
             return v if v.tzinfo else v.replace(tzinfo=timezone.utc)
         return None
 
-    def _entry_key(self, e) -> str:
-        """엔트리 고유 키 생성"""
-        if getattr(e, "id", None):
-            return str(e.id)
-        if getattr(e, "link", None):
-            return str(e.link)
-        base = f"{e.feed.url}|{getattr(e,'title',None)}|{getattr(e,'published',None)}"
-        return hashlib.sha256(base.encode("utf-8", "ignore")).hexdigest()
+    _entry_key = staticmethod(entry_key)
 
     def sync_feeds_to_reader(self) -> Dict[str, Any]:
-        """MongoDB의 활성화된 피드를 Reader와 동기화"""
-        r = self.reader_service.get_reader()
-        
-        # MongoDB에서 활성화된 피드 목록
-        enabled_feeds = set(self.feed_repo.get_enabled_feeds())
-        logger.info(f"MongoDB 활성화 피드: {len(enabled_feeds)}개")
-        
-        # Reader에 등록된 피드 목록
-        reader_feeds = {f.url for f in r.get_feeds()}
-        logger.info(f"Reader 등록 피드: {len(reader_feeds)}개")
-        
-        # 추가할 피드
-        to_add = enabled_feeds - reader_feeds
-        # 제거할 피드 (MongoDB에서 비활성화된 피드)
-        to_remove = reader_feeds - enabled_feeds
-        
-        added, removed = 0, 0
-        
-        # 피드 추가
-        for url in to_add:
-            try:
-                r.add_feed(url)
-                added += 1
-                logger.debug(f"피드 추가: {url}")
-            except Exception as e:
-                logger.warning(f"피드 추가 실패: {url} - {str(e)}")
-        
-        # 피드 제거
-        for url in to_remove:
-            try:
-                r.delete_feed(url)
-                removed += 1
-                logger.debug(f"피드 제거: {url}")
-            except Exception as e:
-                logger.warning(f"피드 제거 실패: {url} - {str(e)}")
-        
-        if added > 0 or removed > 0:
-            logger.info(f"피드 동기화 완료: 추가 {added}개, 제거 {removed}개")
-        
-        return {"added": added, "removed": removed, "total_enabled": len(enabled_feeds)}
+        """MongoDB의 활성화된 피드를 Reader와 동기화 (블랙리스트 피드는 추가하지 않고 제거)"""
+        bl = get_blacklist()
+        with self.reader_service.writer() as r:
+            # MongoDB에서 활성화된 피드 목록 (블랙리스트 제외)
+            enabled_feeds = set(self.feed_repo.get_enabled_feeds())
+            blocked = {u for u in enabled_feeds if u in bl} if bl else set()
+            enabled_feeds -= blocked
+            logger.info(f"MongoDB 활성화 피드: {len(enabled_feeds)}개 (블랙리스트 제외 {len(blocked)}개)")
+            
+            # Reader에 등록된 피드 목록
+            reader_feeds = {f.url for f in r.get_feeds()}
+            logger.info(f"Reader 등록 피드: {len(reader_feeds)}개")
+            
+            # 추가할 피드
+            to_add = enabled_feeds - reader_feeds
+            # 제거할 피드 (MongoDB에서 비활성화된 피드)
+            to_remove = reader_feeds - enabled_feeds
+            
+            added, removed = 0, 0
+            
+            # 피드 추가
+            for url in to_add:
+                try:
+                    r.add_feed(url)
+                    added += 1
+                    logger.debug(f"피드 추가: {url}")
+                except Exception as e:
+                    logger.warning(f"피드 추가 실패: {url} - {str(e)}")
+            
+            # 피드 제거
+            for url in to_remove:
+                try:
+                    r.delete_feed(url)
+                    removed += 1
+                    logger.debug(f"피드 제거: {url}")
+                except Exception as e:
+                    logger.warning(f"피드 제거 실패: {url} - {str(e)}")
+            
+            if added > 0 or removed > 0:
+                logger.info(f"피드 동기화 완료: 추가 {added}개, 제거 {removed}개")
+                # sync-yaml 생략 판정용 Reader 피드 버전
+                self.state_repo.bump(READER_FEEDS_VERSION)
+            
+        return {"added": added, "removed": removed, "total_enabled": len(enabled_feeds), "blocked": len(blocked)}
+
+    def _iter_updates(self, r, feeds: Optional[List[str]]) -> Iterable:
+        """업데이트 대상 선택 — feeds가 None이면 전체"""
+        if feeds is None:
+            return r.update_feeds_iter()
+        if len(feeds) <= INGEST_TARGETED_MAX:
+            return chain.from_iterable(r.update_feeds_iter(feed=url) for url in feeds)
+        return self._iter_tagged_updates(r, feeds)
 
-    def update_feeds(self) -> None:
-        """Reader 피드 업데이트"""
-        r = self.reader_service.get_reader()
-        logger.info("Reader 피드 업데이트 중...")
-        r.update_feeds()
-        logger.info("Reader 피드 업데이트 완료")
+    def _iter_tagged_updates(self, r, feeds: List[str]) -> Iterator:
+        """대량 대상은 임시 태그를 붙여 reader 워커(INGEST_UPDATE_WORKERS)로 병렬 업데이트"""
+        for url in feeds:
+            r.set_tag(url, _INGEST_TAG)
+        try:
+            yield from r.update_feeds_iter(tags=[_INGEST_TAG], workers=INGEST_UPDATE_WORKERS)
+        finally:
+            for url in feeds:
+                r.delete_tag(url, _INGEST_TAG, missing_ok=True)
+
+    def update_feeds(self, feeds: Optional[List[str]] = None) -> Dict[str, int]:
+        """Reader 피드 업데이트 (피드별 결과 집계, feeds를 주면 해당 피드만)"""
+        stats = {"feeds_attempted": 0, "feeds_failed": 0, "entries_new": 0, "entries_updated": 0}
+        with self.reader_service.writer() as r, READER_UPDATE_DURATION.time():
+            logger.info(f"Reader 피드 업데이트 중... ({'전체' if feeds is None else f'{len(feeds)}개'})")
+            for res in self._iter_updates(r, feeds):
+                stats["feeds_attempted"] += 1
+                if res.error is not None:
+                    stats["feeds_failed"] += 1
+                    logger.warning(f"피드 업데이트 실패: {res.url} - {res.error}")
+                elif res.updated_feed is not None:
+                    uf = res.updated_feed
+                    stats["entries_new"] += uf.new
+                    # reader 구버전은 updated, 신버전은 modified
+                    stats["entries_updated"] += getattr(uf, "modified", getattr(uf, "updated", 0))
+            logger.info(f"Reader 피드 업데이트 완료: {stats}")
+        return stats
 
-    def mirror_feeds_to_mongo(self) -> Dict[str, Any]:
-        """Reader의 feed 목록을 MongoDB로 미러링"""
-        r = self.reader_service.get_reader()
-        return self.feed_repo.bulk_upsert_feeds(r.get_feeds())
+    def mirror_feeds_to_mongo(self, feeds: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Reader의 feed 목록을 MongoDB로 미러링 (feeds를 주면 해당 피드만)"""
+        with self.reader_service.read_reader() as r:
+            if feeds is None:
+                items = list(r.get_feeds())
+            else:
+                wanted = set(feeds)
+                items = [f for f in r.get_feeds() if f.url in wanted]
+        return self.feed_repo.bulk_upsert_feeds(items)
 
-    def mirror_entries_to_mongo(self, days: Optional[int] = None) -> Dict[str, Any]:
-        """Reader 엔트리를 MongoDB로 미러링"""
-        r = self.reader_service.get_reader()
+    def mirror_entries_to_mongo(self, days: Optional[int] = None, feeds: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Reader 엔트리를 MongoDB로 미러링 (feeds를 주면 해당 피드 엔트리만)
 
+        아카이브 경계(archived_before) 이전에 발행된 엔트리는 건너뜁니다. 이미 entries_archive와
+        롤업에 집계돼 있으므로 entries에 다시 쓰면 통계/목록에서 두 번 셉니다.
+        Reader DB에 남은 이런 엔트리는 maintain-reader(ReaderMaintenanceService)가 정리합니다.
+        """
         # 기간 기준 계산
         newer_ts = None
         if days:
             newer_ts = (datetime.now(timezone.utc) - timedelta(days=days)).timestamp()
             logger.debug(f"기간 필터 적용: 최근 {days}일 (timestamp: {newer_ts})")
+        archived_before = self.archive_repo.archived_before()
+
+        # 읽기 전용 Reader 사용 — 진행 중인 쓰기(update_feeds)를 막지 않음
+        with self.reader_service.read_reader() as r:
+            # 피드 지정 시 피드별 조회, 아니면 reader 버전에 따라 분기
+            native = newer_ts is not None and feeds is None and self._supports_newer_than(r)
+            manual_filter = newer_ts is not None and not native
+            if feeds is not None:
+                it = chain.from_iterable(r.get_entries(feed=url) for url in feeds)
+                logger.debug(f"피드 {len(feeds)}개 엔트리만 미러링")
+            elif native:
+                it = r.get_entries(newer_than=newer_ts)  # 신버전 경로
+                logger.debug("Reader 신버전 경로 사용 (newer_than 파라미터)")
+            else:
+                it = r.get_entries()  # 구버전 경로(수동 필터)
+                logger.debug("Reader 구버전 경로 사용 (수동 필터)")
+
+            docs = []
+            latest_by_feed: Dict[str, datetime] = {}
+            processed_count = 0
+            # 블랙리스트: 피드 URL은 피드당 한 번만 판정, 엔트리 링크는 도메인 trie로 판정
+            bl = get_blacklist()
+            feed_blocked: Dict[str, bool] = {}
+            blocked_count = archived_count = 0
+            for e in it:
+                # 구버전 경로/피드 지정일 때 수동 필터
+                if manual_filter:
+                    pub_ts = self._to_ts(getattr(e, "published", None)) or self._to_ts(getattr(e, "updated", None))
+                    if pub_ts is None or pub_ts < newer_ts:
+                        continue
 
-        # reader 버전에 따라 분기
-        if newer_ts is not None and self._supports_newer_than(r):
-            it = r.get_entries(newer_than=newer_ts)  # 신버전 경로
-            logger.debug("Reader 신버전 경로 사용 (newer_than 파라미터)")
-        else:
-            it = r.get_entries()  # 구버전 경로(수동 필터)
-            logger.debug("Reader 구버전 경로 사용 (수동 필터)")
-
-        docs = []
-        processed_count = 0
-        for e in it:
-            # 구버전 경로일 때 수동 필터
-            if newer_ts is not None and not self._supports_newer_than(r):
-                pub_ts = self._to_ts(getattr(e, "published", None)) or self._to_ts(getattr(e, "updated", None))
-                if pub_ts is None or pub_ts < newer_ts:
+                dom = host = None
+                try:
+                    parsed = urlparse(getattr(e, "link", "") or "")
+                    dom, host = parsed.netloc or None, parsed.hostname
+                except Exception:
+                    pass
+                if bl:
+                    fu = e.feed.url
+                    if fu not in feed_blocked:
+                        feed_blocked[fu] = bl.is_blocked(fu)
+                    if feed_blocked[fu] or bl.host_blocked(host):
+                        blocked_count += 1
+                        continue
+
+                pub = self._to_dt(getattr(e, "published", None)) or self._to_dt(getattr(e, "updated", None))
+                if archived_before is not None and pub is not None and pub < archived_before:
+                    archived_count += 1
                     continue
 
-            processed_count += 1
-            _id = self._entry_key(e)
-            pub = self._to_dt(getattr(e, "published", None)) or self._to_dt(getattr(e, "updated", None))
-            dom = None
-            try:
-                dom = urlparse(getattr(e, "link", "") or "").netloc or None
-            except Exception:
-                pass
-            doc = {
-                "_id": _id,
-                "feed_url": e.feed.url,
-                "title": getattr(e, "title", None),
-                "link": getattr(e, "link", None),
-                "published": pub,
-                "updated": self._to_dt(getattr(e, "updated", None)),
-                "authors": getattr(e, "authors", None),
-                "summary": getattr(e, "summary", None),
-                "domain": dom,
-                "mirrored_at": datetime.now(timezone.utc),
-            }
-            docs.append(doc)
-            
-            # 진행 상황 로깅 (1000개마다)
-            if processed_count % 1000 == 0:
-                logger.info(f"엔트리 처리 중: {processed_count}개 수집 완료...")
+                processed_count += 1
+                _id = self._entry_key(e)
+                doc = {
+                    "_id": _id,
+                    "feed_url": e.feed.url,
+                    "title": getattr(e, "title", None),
+                    "link": getattr(e, "link", None),
+                    "published": pub,
+                    "updated": self._to_dt(getattr(e, "updated", None)),
+                    "authors": author_docs(getattr(e, "authors", None)),
+                    "summary": getattr(e, "summary", None),
+                    "domain": dom,
+                    "mirrored_at": datetime.now(timezone.utc),
+                }
+                docs.append(doc)
+                if pub is not None and (e.feed.url not in latest_by_feed or pub > latest_by_feed[e.feed.url]):
+                    latest_by_feed[e.feed.url] = pub
+                
+                # 진행 상황 로깅 (1000개마다)
+                if processed_count % 1000 == 0:
+                    logger.info(f"엔트리 처리 중: {processed_count}개 수집 완료...")
 
         logger.info(f"총 {len(docs)}개 엔트리 MongoDB 저장 시작...")
-        # Repository의 upsert_many가 1000개 단위 배치 처리
+        # Repository의 upsert_many가 크기/지연 기반 적응형 배치로 처리 (실패 작업만 재시도)
         self.entry_repo.upsert_many(docs)
-        logger.info(f"MongoDB 저장 완료: {len(docs)}개 엔트리")
-        return {"entries_processed": len(docs)}
+        bulk = self.entry_repo.last_bulk or {}
+        MIRROR_ENTRIES_PER_RUN.observe(len(docs))
+        ENTRIES_MIRRORED.inc(len(docs))
+        # /feeds?sort=last_published 용 피드별 최신 발행 시각
+        self.feed_repo.update_last_published(latest_by_feed)
+        logger.info(
+            f"MongoDB 저장 완료: {len(docs)}개 엔트리 (블랙리스트 제외 {blocked_count}개, 아카이브 경계 이전 {archived_count}개, "
+            f"배치 {bulk.get('batches', 0)}개, {bulk.get('ops_per_sec', 0)}개/초, 실패 {bulk.get('failed', 0)}개)"
+        )
+        return {
+            "entries_processed": len(docs),
+            "entries_blocked": blocked_count,
+            "entries_archived": archived_count,
+            "entries_failed": bulk.get("failed", 0),
+            "bulk": {k: bulk[k] for k in ("batches", "batch_ops", "bytes", "elapsed_sec", "ops_per_sec", "retried", "errors", "bodies")
+                     if k in bulk},
+        }
+
+    def ingest_feeds(self, feeds: List[str], mirror: bool = True) -> Dict[str, Any]:
+        """새로 추가된 피드만 업데이트하고 그 엔트리/피드만 MongoDB로 미러링
 
-    def update_all(self, days: Optional[int] = 1) -> Dict[str, Any]:
-        """피드 업데이트 및 MongoDB 미러링 (백그라운드 실행 가능)"""
-        logger.info(f"피드 업데이트 시작 (days={days})")
+        OPML import, feeds.yaml 동기화 직후 전체 크롤(update_feeds) 대신 사용합니다.
+        """
+        if not feeds:
+            return {"feeds": 0}
         start = time.time()
+        result: Dict[str, Any] = {"feeds": len(feeds), "fetch": self.update_feeds(feeds=feeds)}
+        if mirror:
+            result["mongo_entries"] = self.mirror_entries_to_mongo(feeds=feeds)
+            result["mongo_feeds"] = self.mirror_feeds_to_mongo(feeds=feeds)
+        result["update_sec"] = round(time.time() - start, 2)
+        logger.info(f"새 피드 {len(feeds)}개 반영 완료: {result}")
+        return result
+
+    @contextmanager
+    def _phase_timer(self, phases: Dict[str, float], name: str) -> Iterator[None]:
+        """단계 소요 시간(초) 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            phases[name] = round(time.perf_counter() - start, 3)
+
+    def _record_run(self, run_id: str, fields: Dict[str, Any], start: bool = False) -> None:
+        """실행 이력 기록 — 기록 실패가 수집 자체를 막지 않도록 경고만 남김"""
+        try:
+            if start:
+                self.run_repo.start_run({"_id": run_id, **fields})
+            else:
+                self.run_repo.finish_run(run_id, fields)
+        except Exception as e:
+            logger.warning(f"실행 이력 기록 실패 (run_id={run_id}): {str(e)}")
+
+    def update_all(
+        self,
+        days: Optional[int] = 1,
+        profile: Optional[str] = None,
+        run_id: Optional[str] = None,
+        trigger: str = "api",
+    ) -> Dict[str, Any]:
+        """피드 업데이트 및 MongoDB 미러링 (백그라운드 실행 가능)
+
+        실행마다 crawl_runs에 트리거, 단계별 시간(sync/fetch/mirror), 피드/엔트리 수, 에러를 기록합니다.
+        profile="cpu"|"mem"이면 단계별 프로파일을 PROFILE_DIR/<run_id>/에 저장합니다.
+        """
+        if trigger not in RUN_TRIGGERS:
+            raise ValueError(f"지원하지 않는 trigger: {trigger} (가능: {', '.join(RUN_TRIGGERS)})")
+        run_id = run_id or new_run_id()
+        logger.info(f"피드 업데이트 시작 (days={days}, run_id={run_id}, trigger={trigger})")
+        start = time.time()
+        started_at = datetime.now(timezone.utc)
+        self._record_run(run_id, {
+            "trigger": trigger,
+            "status": "running",
+            "days": days,
+            "profile_mode": profile,
+            "started_at": started_at,
+        }, start=True)
+        profiler = RunProfiler(profile, run_id)
+        phases: Dict[str, float] = {}
+        fetch: Dict[str, int] = {}
+        me: Dict[str, Any] = {}
+        error: Optional[str] = None
         
         try:
             # MongoDB와 Reader 동기화
-            sync_result = self.sync_feeds_to_reader()
+            with profiler.phase("sync_feeds_to_reader"), self._phase_timer(phases, "sync"):
+                sync_result = self.sync_feeds_to_reader()
             logger.info(f"피드 동기화: {sync_result}")
             
             # Reader 피드 업데이트
-            self.update_feeds()
+            with profiler.phase("update_feeds"), self._phase_timer(phases, "fetch"):
+                fetch = self.update_feeds()
             
             # MongoDB 엔트리 미러링
             logger.info(f"MongoDB 엔트리 미러링 시작 (days={days})...")
-            me = self.mirror_entries_to_mongo(days=days)
+            with profiler.phase("mirror_entries_to_mongo"), self._phase_timer(phases, "mirror"):
+                me = self.mirror_entries_to_mongo(days=days)
             elapsed = round(time.time() - start, 2)
             logger.info(f"피드 업데이트 완료 (소요 시간: {elapsed}초, 처리된 엔트리: {me.get('entries_processed', 0)})")
             
-            return {
+            result = {
+                "run_id": run_id,
                 "updated": True,
                 "update_sec": elapsed,
+                "phases": phases,
+                "fetch": fetch,
                 "mongo_entries": me,
                 "feed_sync": sync_result
             }
+            if profiler.summary():
+                result["profile"] = profiler.summary()
+            return result
         except Exception as e:
+            error = str(e)
             elapsed = round(time.time() - start, 2)
             logger.error(f"피드 업데이트 실패 (소요 시간: {elapsed}초): {str(e)}", exc_info=True)
             raise
+        finally:
+            profiler.close()
+            self._record_run(run_id, {
+                "status": "failed" if error else "success",
+                "finished_at": datetime.now(timezone.utc),
+                "duration_sec": round(time.time() - start, 3),
+                "phases": phases,
+                "feeds_attempted": fetch.get("feeds_attempted", 0),
+                "feeds_failed": fetch.get("feeds_failed", 0),
+                "entries_new": fetch.get("entries_new", 0),
+                "entries_updated": fetch.get("entries_updated", 0),
+                "entries_mirrored": me.get("entries_processed", 0),
+                "profile": profiler.summary(),
+                "error": error,
+            })
+
+    def list_runs(
+        self,
+        trigger: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """실행 이력 조회 (트리거/상태/시작 시각 범위 필터, 최신순)"""
+        query: Dict[str, Any] = {}
+        if trigger:
+            query["trigger"] = trigger
+        if status:
+            query["status"] = status
+        if since or until:
+            rng: Dict[str, Any] = {}
+            if since:
+                rng["$gte"] = since
+            if until:
+                rng["$lt"] = until
+            query["started_at"] = rng
+        runs = self.run_repo.list_runs(query, skip=skip, limit=limit)
+        return [{**{k: v for k, v in d.items() if k != "_id"}, "run_id": d["_id"]} for d in runs]
+
+    def get_run(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """실행 이력 단건 조회"""
+        d = self.run_repo.find_by_id(run_id)
+        if d is None:
+            return None
+        return {**{k: v for k, v in d.items() if k != "_id"}, "run_id": d["_id"]}
+
+    def get_profile_artifacts(self, run_id: str) -> List[Dict[str, Any]]:
+        """실행의 프로파일 아티팩트 목록"""
+        return list_artifacts(run_id)
+
+    def get_profile_artifact_path(self, run_id: str, name: str):
+        """프로파일 아티팩트 파일 경로 (없으면 None)"""
+        return artifact_path(run_id, name)
 
     def init_feeds(self) -> Dict[str, Any]:
         """MongoDB에서 활성화된 피드를 Reader에 등록하고 업데이트"""
-        r = self.reader_service.get_reader()
-        
-        # MongoDB에서 활성화된 피드 목록 가져오기
-        enabled_feeds = self.feed_repo.get_enabled_feeds()
-        logger.info(f"MongoDB에서 활성화된 피드 {len(enabled_feeds)}개 발견")
-        
-        added, skipped = 0, 0
-        for url in enabled_feeds:
-            try:
-                r.add_feed(url)
-                added += 1
-            except Exception as e:
-                logger.warning(f"피드 추가 실패: {url} - {str(e)}")
-                skipped += 1
-        
+        with self.reader_service.writer() as r:
+            # MongoDB에서 활성화된 피드 목록 가져오기
+            enabled_feeds = self.feed_repo.get_enabled_feeds()
+            logger.info(f"MongoDB에서 활성화된 피드 {len(enabled_feeds)}개 발견")
+            
+            added, skipped = 0, 0
+            for url in enabled_feeds:
+                try:
+                    r.add_feed(url)
+                    added += 1
+                except Exception as e:
+                    logger.warning(f"피드 추가 실패: {url} - {str(e)}")
+                    skipped += 1
+        if added:
+            self.state_repo.bump(READER_FEEDS_VERSION)
+            
         start = time.time()
         self.update_feeds()
         
@@ -252,53 +487,18 @@ class CrawlerService:
         }
 
     def get_stats(self, days: int = 7) -> Dict[str, Any]:
-        """통계 조회"""
-        now = datetime.now(timezone.utc).isoformat()
-
-        total = self.entry_repo.estimated_count()
-        recent = self.entry_repo.aggregate(pipeline_recent_count(days))
-        recent_cnt = recent[0]["recent"] if recent else 0
-
-        domains = self.entry_repo.aggregate(pipeline_domains_top(days, 10))
-        domains_out = [{"domain": d["_id"] or "(none)", "count": d["count"]} for d in domains]
-
+        """통계 조회 (전체 누적 값은 아카이브 롤업 포함)"""
         pipe_total, pipe_recent = pipeline_by_feed(days)
-        total_by_feed = {d["_id"]: {"total": d["total"], "title": d.get("feed_title", d["_id"])}
-                         for d in self.entry_repo.aggregate(pipe_total)}
-        for d in self.entry_repo.aggregate(pipe_recent):
-            total_by_feed.setdefault(d["_id"], {"total": 0, "title": d["_id"]})
-            total_by_feed[d["_id"]]["recent"] = d["recent"]
-
-        # 요일 분포
-        wd = self.entry_repo.aggregate(pipeline_weekday_dist())
-        weekday_dist = {str(item["_id"]): item["count"] for item in wd}  # 1..7(Sun..Sat)
-
-        out_by_feed = []
-        for feed_url, v in total_by_feed.items():
-            out_by_feed.append({
-                "feed_url": feed_url,
-                "feed_title": v.get("title", feed_url),
-                "total": v.get("total", 0),
-                f"recent_{days}d": v.get("recent", 0),
-            })
-
-        # Calculate date range
-        first_entry = self.entry_repo.find_one(sort=[("published", 1)])
-        last_entry = self.entry_repo.find_one(sort=[("published", -1)])
-        date_range = {
-            "start_date": first_entry["published"].isoformat() if first_entry else None,
-            "end_date": last_entry["published"].isoformat() if last_entry else None,
-        }
-
-        return {
-            "generated_at": now,
-            "days": days,
-            "feeds": self.feed_repo.count(),
-            "entries_total": total,
-            "entries_recent": recent_cnt,
-            "domains_top10": domains_out,
-            "weekday_dist": weekday_dist,
-            "by_feed": sorted(out_by_feed, key=lambda x: x["recent_7d" if days==7 else f"recent_{days}d"], reverse=True),
-            "date_range": date_range,
-        }
-
+        return shape_stats(
+            days=days,
+            feeds=self.feed_repo.count(),
+            total=self.entry_repo.estimated_count(),
+            recent=self.entry_repo.aggregate(pipeline_recent_count(days)),
+            domains=self.entry_repo.aggregate(pipeline_domains_top(days, 10)),
+            by_feed_total=self.entry_repo.aggregate(pipe_total),
+            by_feed_recent=self.entry_repo.aggregate(pipe_recent),
+            weekday=self.entry_repo.aggregate(pipeline_weekday_dist()),
+            first_entry=self.entry_repo.find_one(DATED, sort=[("published", 1)]),
+            last_entry=self.entry_repo.find_one(DATED, sort=[("published", -1)]),
+            archived=self.archive_repo.get_rollup(),
+        )
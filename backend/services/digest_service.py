@@ -0,0 +1,215 @@
+# backend/services/digest_service.py
+"""요약(Digest) 입력 배치 생성 서비스
+
+docs/mongo.md 9. 성능 팁의 규칙(건수/토큰 상한, 도메인 다양성, 초과분 제목만)을
+한 곳에서 구현합니다. 스코프(global/feed/domain)와 기간(day/week/month)을 받아
+인덱스를 타는 단일 find 한 번으로 후보를 읽고, 결과는 digest_inputs 컬렉션에
+(scope, period_unit, period_start) 단위로 캐시합니다 (기간 내 건수 + 최대 mirrored_at이 같으면 재사용).
+"""
+import logging
+from collections import OrderedDict, deque
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from backend.repositories import EntryRepository, DigestInputRepository, EntryArchiveRepository
+from backend.utils.agg_queries import merge_by_published, pipeline_period_marker
+from backend.utils.entry_body import plain_text
+from backend.core.config import (
+    DIGEST_TIMEZONE, DIGEST_MAX_ENTRIES, DIGEST_TOKEN_BUDGET, DIGEST_SUMMARY_CHARS
+)
+
+logger = logging.getLogger(__name__)
+
+PERIOD_UNITS = ("day", "week", "month")
+SCOPE_TYPES = ("global", "feed", "domain")
+
+
+def estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (약 4글자 = 1토큰)"""
+    return len(text) // 4 + 1 if text else 0
+
+
+class DigestService:
+    """요약 입력 배치 생성 및 캐시 관리"""
+
+    def __init__(
+        self,
+        entry_repo: Optional[EntryRepository] = None,
+        digest_repo: Optional[DigestInputRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+    ):
+        self.entry_repo = entry_repo or EntryRepository()
+        self.digest_repo = digest_repo or DigestInputRepository()
+        self.archive_repo = archive_repo or EntryArchiveRepository()
+        self.tz = ZoneInfo(DIGEST_TIMEZONE)
+
+    def make_scope(self, scope: str = "global", value: Optional[str] = None) -> Dict[str, Any]:
+        """스코프 문서 생성 (키 순서 고정 — Mongo 동등 비교용)"""
+        if scope not in SCOPE_TYPES:
+            raise ValueError(f"지원하지 않는 scope: {scope}")
+        if scope == "global":
+            return {"type": "global"}
+        if not value:
+            raise ValueError(f"scope={scope}에는 값이 필요합니다")
+        key = "feed_url" if scope == "feed" else "domain"
+        return {"type": scope, key: value}
+
+    def period_window(self, unit: str, start: date) -> Tuple[datetime, datetime]:
+        """기간 경계 계산 (DIGEST_TIMEZONE 기준으로 잘라 UTC로 반환)"""
+        if unit not in PERIOD_UNITS:
+            raise ValueError(f"지원하지 않는 unit: {unit}")
+        if unit == "week":
+            # $dateTrunc와 동일하게 월요일 시작
+            start = start - timedelta(days=start.weekday())
+        elif unit == "month":
+            start = start.replace(day=1)
+
+        local_start = datetime(start.year, start.month, start.day, tzinfo=self.tz)
+        if unit == "day":
+            local_end = local_start + timedelta(days=1)
+        elif unit == "week":
+            local_end = local_start + timedelta(days=7)
+        else:
+            y, m = (start.year + 1, 1) if start.month == 12 else (start.year, start.month + 1)
+            local_end = datetime(y, m, 1, tzinfo=self.tz)
+        return local_start.astimezone(timezone.utc), local_end.astimezone(timezone.utc)
+
+    def _period_filter(self, scope: Dict[str, Any], start: datetime, end: datetime) -> Dict[str, Any]:
+        """기간 + 스코프 필터 (feed_url/domain + published 복합 인덱스 대상)"""
+        q: Dict[str, Any] = {}
+        if scope["type"] == "feed":
+            q["feed_url"] = scope["feed_url"]
+        elif scope["type"] == "domain":
+            q["domain"] = scope["domain"]
+        q["published"] = {"$gte": start, "$lt": end}
+        return q
+
+    def _rank_diverse(self, docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """도메인 라운드로빈 정렬 — 각 도메인의 최신 글부터 번갈아 선택"""
+        buckets: "OrderedDict[str, deque]" = OrderedDict()
+        for d in docs:  # docs는 published 내림차순
+            buckets.setdefault(d.get("domain") or "(none)", deque()).append(d)
+        # 기사 수가 많은 도메인이 먼저 나오도록 하되, 라운드마다 도메인당 1건
+        order = sorted(buckets, key=lambda k: len(buckets[k]), reverse=True)
+        ranked = []
+        while order:
+            nxt = []
+            for k in order:
+                ranked.append(buckets[k].popleft())
+                if buckets[k]:
+                    nxt.append(k)
+            order = nxt
+        return ranked
+
+    def _select(self, ranked: List[Dict[str, Any]], max_entries: int, token_budget: int) -> Tuple[List[Dict[str, Any]], int]:
+        """토큰 예산 내에서 본문 포함 → 초과분은 제목만 사용"""
+        items = []
+        used = 0
+        for d in ranked:
+            if len(items) >= max_entries:
+                break
+            title = d.get("title") or ""
+            body = plain_text(d.get("summary"), DIGEST_SUMMARY_CHARS)
+            full_cost = estimate_tokens(title) + estimate_tokens(body)
+            title_cost = estimate_tokens(title)
+            item = {
+                "id": d["_id"],
+                "title": title,
+                "link": d.get("link"),
+                "feed_url": d.get("feed_url"),
+                "domain": d.get("domain"),
+                "published": d.get("published"),
+            }
+            if body and used + full_cost <= token_budget:
+                item["text"] = body
+                used += full_cost
+            elif used + title_cost <= token_budget:
+                item["title_only"] = True
+                used += title_cost
+            else:
+                break
+            items.append(item)
+        return items, used
+
+    def _period_marker(self, q: Dict[str, Any], use_archive: bool) -> Tuple[int, Optional[datetime]]:
+        """기간 내 (엔트리 수, 최대 mirrored_at) — 저장소별 인덱스 범위 집계 한 번"""
+        repos = [self.entry_repo, self.archive_repo] if use_archive else [self.entry_repo]
+        count, last = 0, None
+        for repo in repos:
+            for d in repo.aggregate(pipeline_period_marker(q)):
+                count += d["count"]
+                if d.get("last_mirrored") is not None and (last is None or d["last_mirrored"] > last):
+                    last = d["last_mirrored"]
+        return count, last
+
+    def build_input(
+        self,
+        scope: Dict[str, Any],
+        unit: str,
+        start: date,
+        *,
+        max_entries: int = DIGEST_MAX_ENTRIES,
+        token_budget: int = DIGEST_TOKEN_BUDGET,
+        use_cache: bool = True,
+    ) -> Dict[str, Any]:
+        """스코프/기간의 요약 입력 배치 반환 (캐시 우선)"""
+        period_start, period_end = self.period_window(unit, start)
+        q = self._period_filter(scope, period_start, period_end)
+
+        # 아카이브 경계 이전 기간이면 entries_archive도 읽음
+        archived_before = self.archive_repo.archived_before()
+        use_archive = archived_before is not None and period_start < archived_before
+
+        # 캐시 유효성: 기간 내 엔트리 수와 마지막 미러링 시각이 같으면 추가/갱신 없음
+        entry_count, last_mirrored = self._period_marker(q, use_archive)
+        if use_cache:
+            cached = self.digest_repo.get_batch(scope, unit, period_start)
+            if (cached
+                    and cached.get("entry_count") == entry_count
+                    and cached.get("last_mirrored") == last_mirrored
+                    and cached.get("max_entries") == max_entries
+                    and cached.get("token_budget") == token_budget):
+                logger.debug(f"요약 입력 캐시 사용: {scope} {unit} {period_start.isoformat()}")
+                return {**cached, "cached": True}
+
+        # 후보 스캔 상한: 다양성 확보를 위해 max_entries의 몇 배만 읽음
+        scan_limit = max_entries * 4
+        projection = {"_id": 1, "title": 1, "link": 1, "summary": 1, "has_body": 1,
+                      "feed_url": 1, "domain": 1, "published": 1}
+        docs = self.entry_repo.find(q, projection, sort=[("published", -1)], limit=scan_limit)
+        if use_archive:
+            archived = self.archive_repo.find(q, projection, sort=[("published", -1)], limit=scan_limit)
+            docs = merge_by_published(docs, archived, limit=scan_limit)
+        ranked = self._rank_diverse(docs)
+        # compact 모드: 선택될 수 있는 앞쪽 max_entries건만 분리 저장된 summary 로드
+        self.entry_repo.attach_bodies(ranked[:max_entries])
+        items, used = self._select(ranked, max_entries, token_budget)
+
+        domain_counts: Dict[str, int] = {}
+        for d in docs:
+            k = d.get("domain") or "(none)"
+            domain_counts[k] = domain_counts.get(k, 0) + 1
+        top_domains = sorted(domain_counts.items(), key=lambda kv: kv[1], reverse=True)[:10]
+
+        batch = {
+            "scope": scope,
+            "period_unit": unit,
+            "period_start": period_start,
+            "period_end": period_end,
+            "entry_count": entry_count,
+            "last_mirrored": last_mirrored,
+            "scanned": len(docs),
+            "max_entries": max_entries,
+            "token_budget": token_budget,
+            "tokens_used": used,
+            "titles_only": sum(1 for it in items if it.get("title_only")),
+            "top_domains": [{"domain": k, "count": v} for k, v in top_domains],
+            "items": items,
+        }
+        self.digest_repo.save_batch(batch)
+        logger.info(
+            f"요약 입력 생성: {scope} {unit} {period_start.isoformat()} "
+            f"(후보 {len(docs)}개 → 선택 {len(items)}개, 토큰 {used}/{token_budget})"
+        )
+        return {**batch, "cached": False}
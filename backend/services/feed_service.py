@@ -4,54 +4,87 @@
 단일 책임 원칙(SRP)에 따라 피드의 CRUD와 관리만 담당합니다.
 RSS 피드 발견 로직은 backend.utils.discovery를 사용합니다.
 """
+import hashlib
 import logging
+import os
 import tempfile
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
-import xml.etree.ElementTree as ET
-import yaml
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urljoin
 
-from backend.repositories import FeedRepository
+from backend.repositories import (
+    FeedRepository, DiscoveryCacheRepository, FeedValidationRepository, SyncStateRepository
+)
+from backend.repositories.sync_state_repo import FEEDS_VERSION, READER_FEEDS_VERSION
 from backend.services.reader_service import ReaderService
-from backend.core.config import PROJECT_ROOT, AI_FEEDS, BLACKLIST_FEEDS, BLACKLIST_DOMAINS
-from backend.utils.url_norm import normalize_url, sanitize_opml_bytes
-from backend.utils.opml_parser import load_opml_urls, parse_opml_file, generate_opml
-from backend.utils.discovery import discover_rss_feeds
-from backend.core.exceptions import FeedNotFoundException, FeedAlreadyExistsException
+from backend.core.config import (
+    PROJECT_ROOT, AI_FEEDS,
+    DISCOVER_MAX_WORKERS, DISCOVER_TIMEOUT_BUDGET, DISCOVER_CACHE_TTL, DISCOVER_NEGATIVE_TTL,
+    FEED_VALIDATION_ENABLED, FEED_VALIDATION_BUDGET, FEED_VALIDATION_TTL, OPML_EXPORT_DIR,
+)
+from backend.utils.url_norm import normalize_url
+from backend.utils.blacklist import BlacklistMatcher, get_blacklist, get_store
+from backend.utils.fingerprint import fingerprint_files
+from backend.utils.opml_parser import OPMLStream, iter_chunks, iter_opml_urls, load_opml_urls, iter_opml
+from backend.utils.pagination import build_feed_page, feed_page_query, feed_projection
+from backend.core.exceptions import FeedNotFoundException, FeedAlreadyExistsException, InvalidFeedException
 
 logger = logging.getLogger(__name__)
 
-BLACKLIST_PATH = PROJECT_ROOT / "data" / "blacklist.yaml"
 FEEDS_PATH = PROJECT_ROOT / "data" / "feeds.yaml"
 OPML_PATH = PROJECT_ROOT / "data" / "my_feeds.opml"
+# import 결과에 포함할 검증 실패 URL 최대 개수 (전체는 feed_validations)
+_REJECTED_SAMPLE = 100
 
 
 class FeedService:
     """피드 관리 서비스"""
     
-    def __init__(self, feed_repo: Optional[FeedRepository] = None):
+    def __init__(
+        self,
+        feed_repo: Optional[FeedRepository] = None,
+        cache_repo: Optional[DiscoveryCacheRepository] = None,
+        validation_repo: Optional[FeedValidationRepository] = None,
+        state_repo: Optional[SyncStateRepository] = None,
+    ):
         self.feed_repo = feed_repo or FeedRepository()
+        self.cache_repo = cache_repo or DiscoveryCacheRepository()
+        self.validation_repo = validation_repo or FeedValidationRepository()
+        self.state_repo = state_repo or SyncStateRepository()
         self.reader_service = ReaderService()
 
     def get_all_feeds(self, enabled: Optional[bool] = None) -> List[Dict[str, Any]]:
-        """피드 목록 조회"""
-        query = {}
-        if enabled is not None:
-            query["enabled"] = enabled
-        
-        feeds = list(self.feed_repo.collection.find(query, {"_id": 1, "title": 1, "site_url": 1, "enabled": 1}))
-        return [
-            {
-                "url": f["_id"],
-                "title": f.get("title"),
-                "site_url": f.get("site_url"),
-                "enabled": f.get("enabled", True)
-            }
-            for f in feeds
-        ]
-
-    def add_feed(self, url: str, title: Optional[str] = None, enabled: bool = True) -> Dict[str, Any]:
-        """피드 추가"""
+        """피드 목록 조회 (전체)"""
+        return self.get_feeds_page(enabled=enabled)["feeds"]
+
+    def get_feeds_page(
+        self,
+        enabled: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        sort: str = "url",
+        order: str = "asc",
+        cursor: Optional[str] = None,
+        limit: int = 0,
+    ) -> Dict[str, Any]:
+        """피드 목록 커서 페이지 조회 (limit=0이면 전체)"""
+        query, sort_spec, field = feed_page_query(enabled, sort, order, cursor)
+        projection, names = feed_projection(fields, field)
+        docs = self.feed_repo.list_feeds(query, projection, sort=sort_spec, limit=limit + 1 if limit else 0)
+        return build_feed_page(docs, names, field, limit)
+
+    def add_feed(
+        self, url: str, title: Optional[str] = None, enabled: bool = True, validate: bool = FEED_VALIDATION_ENABLED
+    ) -> Dict[str, Any]:
+        """피드 추가 (블랙리스트 또는 새 URL 검증 실패 시 InvalidFeedException)"""
+        if self.load_blacklist().is_blocked(url):
+            raise InvalidFeedException(f"블랙리스트에 있는 피드입니다: {url}")
+        if validate and self.feed_repo.find_by_id(url) is None:
+            res = self.validate_urls([url], source="api")[url]
+            if res["ok"] is False:
+                raise InvalidFeedException(f"피드 검증 실패 ({res['reason']}): {url}")
         success = self.feed_repo.add_feed(url, title=title, enabled=enabled)
         if not success:
             raise FeedAlreadyExistsException(f"피드가 이미 존재합니다: {url}")
@@ -94,37 +127,190 @@ class FeedService:
         
         return {"migrated": added, "skipped": skipped, "total": len(AI_FEEDS)}
 
-    def discover_feeds(self, url: str, top_k: int = 3) -> Dict[str, Any]:
+    def validate_urls(self, urls: List[str], source: str) -> Dict[str, Dict[str, Any]]:
+        """등록 전 피드 동시 검증 {url: 결과}
+
+        FEED_VALIDATION_TTL 안에 통과한 URL은 다시 받지 않고, 새 결과는 feed_validations에
+        기록합니다 (ok=False는 격리 목록, 시간 예산 초과로 확인하지 못한 ok=None은 보류 —
+        호출 측은 거부하지 않고 등록하며 revalidate_deferred가 다시 검증).
+        """
+        from backend.utils.feed_validation import validate_feeds
+
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return {}
+        results: Dict[str, Dict[str, Any]] = self.validation_repo.get_fresh_ok(urls, FEED_VALIDATION_TTL)
+        fresh = validate_feeds([u for u in urls if u not in results], budget_sec=FEED_VALIDATION_BUDGET)
+        if fresh:
+            self.validation_repo.record_many(fresh.values(), source)
+        results.update(fresh)
+        return results
+
+    def revalidate_deferred(self, limit: int = 160) -> Dict[str, Any]:
+        """검증 보류(ok=None) 상태로 등록된 URL 재검증
+
+        실패한 URL은 격리하고 Reader에서 제거, feeds 컬렉션에 있으면 비활성화합니다
+        (sync_feeds_to_reader가 다시 추가하지 않도록). 이번에도 예산 안에 끝나지 않은 URL은 보류로 남습니다.
+        """
+        from backend.utils.feed_validation import validate_feeds
+
+        urls = [d["_id"] for d in self.validation_repo.list_deferred(limit=limit)]
+        if not urls:
+            return {"checked": 0, "ok": 0, "quarantined": 0, "deferred": 0, "rejected": []}
+        checked = validate_feeds(urls, budget_sec=FEED_VALIDATION_BUDGET)
+        self.validation_repo.record_many(checked.values(), source="revalidate")
+        bad = [u for u in urls if checked[u]["ok"] is False]
+        if bad:
+            with self.reader_service.writer() as r:
+                for u in bad:
+                    r.delete_feed(u, missing_ok=True)
+            self._reader_feeds_changed()
+            for u in bad:
+                self.feed_repo.set_enabled(u, False)
+            logger.info(f"보류 피드 재검증: {len(bad)}개 격리 (Reader에서 제거)")
+        return {
+            "checked": len(urls),
+            "ok": sum(1 for u in urls if checked[u]["ok"]),
+            "quarantined": len(bad),
+            "deferred": sum(1 for u in urls if checked[u]["ok"] is None),
+            "rejected": [{"url": u, "reason": checked[u]["reason"]} for u in bad][:_REJECTED_SAMPLE],
+        }
+
+    def list_quarantined(self, skip: int = 0, limit: int = 100) -> List[Dict[str, Any]]:
+        """검증에 실패해 격리된 URL 목록"""
+        docs = self.validation_repo.list_quarantined(skip=skip, limit=limit)
+        return [{"url": d.pop("_id"), **d} for d in docs]
+
+    def discover_feeds(
+        self, url: str, top_k: int = 3, refresh: bool = False, validate: bool = FEED_VALIDATION_ENABLED
+    ) -> Dict[str, Any]:
         """URL에서 RSS 피드 발견 및 Reader에 추가"""
-        r = self.reader_service.get_reader()
-        # Discovery 로직은 utils/discovery.py로 분리됨
-        cands = discover_rss_feeds(url, top_k=top_k)
-        added, skipped = 0, 0
-        for u in cands:
-            try:
-                r.add_feed(u)
-                added += 1
-            except Exception:
-                skipped += 1
-        return {"source_url": url, "candidates": cands, "added": added, "skipped": skipped}
-
-    def load_blacklist_urls(self) -> Set[str]:
-        """블랙리스트 URL 로드"""
-        urls: Set[str] = set()
-        if BLACKLIST_PATH.exists():
-            data = yaml.safe_load(BLACKLIST_PATH.read_text(encoding="utf-8"))
-            items = data.get("items", []) if isinstance(data, dict) else []
-            for it in items:
-                u = (it.get("final_url") or it.get("url") or "").strip()
-                if u:
-                    urls.add(normalize_url(u))
-        return urls
+        return self.discover_many([url], top_k=top_k, refresh=refresh, validate=validate)["results"][0]
+
+    def _known_feed_urls(self) -> Set[str]:
+        """MongoDB + Reader에 이미 있는 피드 (정규화 URL)"""
+        known = {normalize_url(d["_id"]) for d in self.feed_repo.list_feeds({}, {"_id": 1})}
+        with self.reader_service.read_reader() as r:
+            known.update(normalize_url(f.url) for f in r.get_feeds())
+        return known
+
+    def discover_many(
+        self,
+        urls: List[str],
+        top_k: int = 3,
+        refresh: bool = False,
+        budget_sec: float = DISCOVER_TIMEOUT_BUDGET,
+        validate: bool = FEED_VALIDATION_ENABLED,
+    ) -> Dict[str, Any]:
+        """여러 타깃 URL 동시 발견 (총 시간 예산, TTL 캐시, 기존 피드 사전 제외)
+
+        - 타깃 자체가 이미 등록된 피드면 네트워크 요청 없이 status=known
+        - 캐시 적중이면 status=cached (후보 없음도 negative TTL 동안 캐시)
+        - budget_sec(캐시·기존 피드 조회 시간 포함) 안에 끝나지 않은 타깃은 status=timeout (캐시하지 않음)
+        - 발견 중 예외가 난 타깃은 status=error, error에 메시지 (캐시하지 않음)
+        - 후보 중 이미 등록된 피드/중복은 Reader에 추가하지 않고 known으로 집계
+        - 새 후보는 한 번에 동시 검증해 실패한 것은 등록하지 않음 (invalid로 집계, 격리 — 시간 예산 초과로
+          확인하지 못한 후보는 등록하고 나중에 재검증)
+        """
+        from backend.utils.discovery import discover_rss_feeds
+
+        started = time.monotonic()
+        known = self._known_feed_urls()
+        bl = self.load_blacklist()
+        results: Dict[str, Dict[str, Any]] = {}
+        found: Dict[str, List[str]] = {}
+        pending: List[str] = []
+        for url in urls:
+            target = normalize_url(url)
+            if target in results:
+                continue
+            if target in known:
+                results[target] = {"source_url": url, "status": "known", "candidates": []}
+            else:
+                results[target] = {"source_url": url, "status": "ok", "candidates": []}
+                pending.append(target)
+
+        if pending and not refresh:
+            for target, cands in self.cache_repo.get_many(pending).items():
+                found[target] = cands
+                results[target]["status"] = "cached"
+            pending = [t for t in pending if t not in found]
+
+        if pending:
+            fresh: Dict[str, List[str]] = {}
+            pool = ThreadPoolExecutor(max_workers=min(DISCOVER_MAX_WORKERS, len(pending)))
+            futures = {pool.submit(discover_rss_feeds, results[t]["source_url"], top_k): t for t in pending}
+            # 캐시/기존 피드 조회에 쓴 시간도 예산에서 뺌
+            done, not_done = wait(futures, timeout=max(0.0, budget_sec - (time.monotonic() - started)))
+            # 예산 초과 타깃은 기다리지 않음 (각 요청은 자체 timeout으로 종료)
+            pool.shutdown(wait=False, cancel_futures=True)
+            for fut in done:
+                t = futures[fut]
+                try:
+                    fresh[t] = fut.result()
+                except Exception as e:
+                    results[t].update(status="error", error=str(e))
+                    logger.warning(f"피드 발견 실패: {results[t]['source_url']} - {str(e)}")
+            for fut in not_done:
+                results[futures[fut]]["status"] = "timeout"
+            if fresh:
+                self.cache_repo.put_many(fresh, DISCOVER_CACHE_TTL, DISCOVER_NEGATIVE_TTL)
+            found.update(fresh)
+
+        # 후보 정규화 + 기존 피드 제외 후 새 후보만 검증
+        for target, res in results.items():
+            res["candidates"] = [normalize_url(urljoin(res["source_url"], c)) for c in found.get(target, [])]
+        checked: Dict[str, Dict[str, Any]] = {}
+        if validate:
+            new_urls = [u for res in results.values() for u in res["candidates"] if u not in known and u not in bl]
+            checked = self.validate_urls(new_urls, source="discover")
+
+        # Reader 등록 (쓰기 락 한 번)
+        totals = {"added": 0, "skipped": 0, "known": 0, "invalid": 0}
+        with self.reader_service.writer() as r:
+            for res in results.values():
+                cands = res["candidates"]
+                added = skipped = dup = invalid = 0
+                for u in cands:
+                    if u in known:
+                        dup += 1
+                        continue
+                    if u in bl:
+                        skipped += 1
+                        continue
+                    if u in checked and checked[u]["ok"] is False:
+                        invalid += 1
+                        continue
+                    try:
+                        r.add_feed(u)
+                        known.add(u)
+                        added += 1
+                    except Exception:
+                        skipped += 1
+                if res["status"] == "ok" and not cands:
+                    res["status"] = "empty"
+                res.update({"added": added, "skipped": skipped, "known": dup, "invalid": invalid})
+                totals["added"] += added
+                totals["skipped"] += skipped
+                totals["known"] += dup
+                totals["invalid"] += invalid
+        if totals["added"]:
+            self._reader_feeds_changed()
+
+        elapsed = round(time.monotonic() - started, 2)
+        logger.info(f"피드 발견 완료: 타깃 {len(results)}개, {totals} ({elapsed}초)")
+        return {"results": list(results.values()), **totals, "elapsed_sec": elapsed}
+
+    def load_blacklist(self) -> BlacklistMatcher:
+        """현재 블랙리스트 (URL 정확 일치 + 도메인 trie, 파일이 바뀌었을 때만 다시 로드)"""
+        return get_blacklist()
 
     def load_feeds_yaml(self) -> tuple[list[dict], list[str]]:
         """feeds.yaml 파일 로드"""
         feeds = []
         urls: list[str] = []
         if FEEDS_PATH.exists():
+            import yaml
             data = yaml.safe_load(FEEDS_PATH.read_text(encoding="utf-8"))
             seen = set()
             for it in data.get("feeds", []):
@@ -139,95 +325,236 @@ class FeedService:
                 urls.append(nu)
         return feeds, urls
 
-    def import_opml(self, path: Path, *, blacklist: Set[str] | None = None) -> dict:
-        """OPML 파일 import"""
-        blacklist = set(map(normalize_url, blacklist or set()))
-        r = self.reader_service.get_reader()
-        added = skipped = 0
-        root = ET.parse(path).getroot()
-        seen = set()
-        for o in root.iter("outline"):
-            url = o.attrib.get("xmlUrl")
-            if not url:
-                continue
-            nu = normalize_url(url)
-            if nu in blacklist or nu in seen:
-                skipped += 1
-                continue
-            seen.add(nu)
-            try:
-                r.add_feed(nu)
-                added += 1
-            except Exception:
+    def import_opml(
+        self,
+        path: Path,
+        *,
+        blacklist: BlacklistMatcher | Set[str] | None = None,
+        validate: bool = FEED_VALIDATION_ENABLED,
+    ) -> dict:
+        """OPML 파일 import (청크 단위 스트리밍, blacklist 미지정 시 현재 블랙리스트)"""
+        with open(path, "rb") as f:
+            return self.import_opml_stream(iter_chunks(f), blacklist=blacklist, validate=validate)
+
+    def import_opml_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        blacklist: BlacklistMatcher | Set[str] | None = None,
+        validate: bool = FEED_VALIDATION_ENABLED,
+    ) -> dict:
+        """OPML 스트리밍 import (Reader에 없는 URL은 등록 전 동시 검증, 실패는 격리)
+
+        청크마다 sanitize → expat 증분 파싱 → 정규화/중복/블랙리스트 필터를 한 번에 처리하므로
+        업로드 전체를 메모리에 올리거나 임시 파일로 다시 파싱하지 않습니다.
+        깨진 XML은 InvalidOPMLError (이 경우 아무것도 등록하지 않음).
+        전체 업데이트는 하지 않고 새로 등록한 URL을 new_feeds로 반환합니다
+        (호출 측에서 CrawlerService.ingest_feeds로 해당 피드만 업데이트/미러링).
+        """
+        skipped = 0
+        with self.reader_service.read_reader() as r:
+            in_reader = {f.url for f in r.get_feeds()}
+        stream = OPMLStream(blacklist if blacklist is not None else self.load_blacklist())
+        urls: List[str] = []
+        for nu in iter_opml_urls(chunks, stream):
+            if nu in in_reader:
                 skipped += 1
-        r.update_feeds()
-        return {"added": added, "skipped": skipped}
+            else:
+                urls.append(nu)
+        skipped += stream.duplicates + stream.blacklisted
+
+        rejected: List[Dict[str, str]] = []
+        deferred = 0
+        if validate:
+            checked = self.validate_urls(urls, source="opml")
+            rejected = [{"url": u, "reason": checked[u]["reason"]} for u in urls if checked[u]["ok"] is False]
+            # 시간 예산 안에 확인하지 못한 URL은 거부하지 않고 등록 (revalidate_deferred로 재검증)
+            deferred = sum(1 for u in urls if checked[u]["ok"] is None)
+            bad = {x["url"] for x in rejected}
+            urls = [u for u in urls if u not in bad]
+
+        new_feeds: List[str] = []
+        with self.reader_service.writer() as r:
+            for nu in urls:
+                try:
+                    r.add_feed(nu)
+                    new_feeds.append(nu)
+                except Exception:
+                    skipped += 1
+        if new_feeds:
+            self._reader_feeds_changed()
+        return {
+            "outlines": stream.outlines,
+            "added": len(new_feeds),
+            "skipped": skipped,
+            "invalid": len(rejected),
+            "deferred": deferred,
+            "rejected": rejected[:_REJECTED_SAMPLE],
+            "new_feeds": new_feeds,
+        }
+
+    def _export_catalog(self) -> List[Tuple[str, Optional[str]]]:
+        """내보낼 (URL, 제목) 목록 — URL은 Reader 기준, 제목은 feeds 컬렉션 우선(없으면 Reader 제목)"""
+        with self.reader_service.read_reader() as r:
+            feeds = {f.url: f.user_title or f.title for f in r.get_feeds()}
+        titles = self.feed_repo.get_titles()
+        catalog = []
+        for url in sorted(feeds):
+            title = titles.get(url)
+            # add_feed는 제목이 없으면 URL을 넣으므로 그 경우 Reader 제목 사용
+            catalog.append((url, title if title and title != url else feeds[url]))
+        return catalog
+
+    def export_opml_file(self) -> Tuple[str, Path]:
+        """OPML 내보내기 (ETag, 파일 경로) — 피드 집합 지문이 같으면 렌더링된 파일 재사용"""
+        catalog = self._export_catalog()
+        h = hashlib.sha256()
+        for url, title in catalog:
+            h.update(f"{url}\t{title or ''}\n".encode("utf-8"))
+        etag = h.hexdigest()[:32]
+
+        export_dir = Path(OPML_EXPORT_DIR)
+        path = export_dir / f"feeds_{etag}.opml"
+        if path.exists():
+            return etag, path
+
+        export_dir.mkdir(parents=True, exist_ok=True)
+        # 점(.)으로 시작하는 고유 임시 파일 — 아래 정리 glob, 동시 렌더링(스레드/프로세스)과 겹치지 않음
+        fd, tmp = tempfile.mkstemp(dir=export_dir, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.writelines(iter_opml(catalog))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        # 이전 지문의 파일(압축본 포함) 정리
+        for old in export_dir.glob("feeds_*.opml*"):
+            if not old.name.startswith(path.name):
+                old.unlink(missing_ok=True)
+        logger.info(f"OPML 내보내기 렌더링: 피드 {len(catalog)}개 → {path.name}")
+        return etag, path
 
     def export_opml(self) -> str:
         """현재 Reader 피드를 OPML로 내보내기"""
-        r = self.reader_service.get_reader()
-        urls = sorted({f.url for f in r.get_feeds()})
-        return generate_opml(urls)
+        _, path = self.export_opml_file()
+        return path.read_text(encoding="utf-8")
+
+    def _unchanged_sync(
+        self, state_id: str, paths: Dict[str, Path], delete_missing: bool, target: int, force: bool
+    ) -> tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """입력 파일 지문을 계산하고, 입력·옵션·대상 버전이 직전 적용과 같으면 생략 결과 반환
+
+        반환: (입력 지문, 생략 시 결과 | None)
+        """
+        prev = None if force else self.state_repo.find_by_id(state_id)
+        inputs, same = fingerprint_files(paths, (prev or {}).get("inputs"))
+        if not (prev and same and prev.get("delete_missing") == delete_missing
+                and prev.get("target_version") == target):
+            return inputs, None
+        if inputs != prev["inputs"]:
+            # 내용은 같고 stat만 바뀜 — 다음 호출이 해시를 다시 계산하지 않도록 갱신
+            self.state_repo.save(state_id, {"inputs": inputs})
+        logger.info(f"동기화 생략({state_id}): 입력과 대상이 직전 적용 이후 그대로")
+        return inputs, {**prev["result"], "unchanged": True, "applied_at": prev.get("applied_at")}
+
+    def _target_after(self, version_id: str, before: int, bumps: int) -> int:
+        """적용 후 저장할 대상 버전 — 이번 적용이 올린 만큼만 늘었으면 현재 값, 그 사이 다른 추가/삭제가
+        있었으면 적용 전 값 (다음 호출이 다시 비교)"""
+        now = self.state_repo.version(version_id)
+        return now if now == before + bumps else before
 
-    def sync_from_yaml(self, delete_missing: bool = False) -> dict:
-        """feeds.yaml과 Reader 동기화"""
-        bl = self.load_blacklist_urls()
+    def _reader_feeds_changed(self) -> None:
+        """Reader 피드를 추가/삭제했을 때 호출 — sync-yaml 생략 판정용 대상 버전 증가"""
+        self.state_repo.bump(READER_FEEDS_VERSION)
+
+    def _save_sync(
+        self, state_id: str, inputs: Dict[str, Any], delete_missing: bool, target: int, noop: Dict[str, Any]
+    ) -> None:
+        """적용 직후 상태 저장 (target: 적용 후 대상 버전, noop: 다음 호출을 생략할 때 돌려줄 결과 — 변경 건수 0)"""
+        self.state_repo.save(state_id, {
+            "inputs": inputs,
+            "delete_missing": delete_missing,
+            "target_version": target,
+            "result": noop,
+            "applied_at": datetime.now(timezone.utc),
+        })
+
+    def sync_from_yaml(self, delete_missing: bool = False, force: bool = False) -> dict:
+        """feeds.yaml과 Reader 동기화 (새로 등록한 URL은 new_feeds로 반환, 업데이트는 호출 측에서)
+
+        feeds.yaml/blacklist.yaml 지문과 Reader 피드 버전이 직전 적용과 같으면 파일이나 Reader 피드를
+        읽지 않고 unchanged=True로 직전 결과를 반환합니다 (force=True면 항상 비교).
+        """
+        paths = {"feeds_yaml": FEEDS_PATH, "blacklist": get_store().path}
+        version = self.state_repo.version(READER_FEEDS_VERSION)
+        inputs, skipped = self._unchanged_sync("yaml_reader", paths, delete_missing, version, force)
+        if skipped is not None:
+            return {**skipped, "new_feeds": []}
+
+        bl = self.load_blacklist()
         _, want_urls = self.load_feeds_yaml()
         want = {u for u in want_urls if u not in bl}
 
-        r = self.reader_service.get_reader()
-        have = {f.url for f in r.get_feeds()}
+        with self.reader_service.writer() as r:
+            have = {f.url for f in r.get_feeds()}
 
-        to_add = sorted(want - have)
-        to_remove = sorted(have - want) if delete_missing else []
+            to_add = sorted(want - have)
+            # 블랙리스트에 오른 피드는 delete_missing과 관계없이 제거 (더 이상 수집하지 않음)
+            to_remove = sorted(have - want) if delete_missing else sorted(u for u in have if u in bl)
+
+            new_feeds: List[str] = []
+            d = 0
+            for u in to_add:
+                try:
+                    r.add_feed(u)
+                    new_feeds.append(u)
+                except:
+                    pass
+            for u in to_remove:
+                try:
+                    r.delete_feed(u)
+                    d += 1
+                except:
+                    pass
+        changed = bool(new_feeds or d)
+        if changed:
+            self._reader_feeds_changed()
+        target = self._target_after(READER_FEEDS_VERSION, version, int(changed))
+        self._save_sync("yaml_reader", inputs, delete_missing, target, {"added": 0, "removed": 0, "kept": len(want)})
+        return {
+            "added": len(new_feeds), "removed": d, "kept": len(want & have), "unchanged": False,
+            "new_feeds": new_feeds,
+        }
+
+    def sync_feeds_to_mongo(self, delete_missing: bool = False, force: bool = False) -> Dict[str, Any]:
+        """feeds.yaml + OPML을 MongoDB와 동기화
+
+        feeds.yaml/my_feeds.opml/blacklist.yaml 지문과 feeds 버전이 직전 적용과 같으면
+        파일을 파싱하거나 _id를 읽지 않고 unchanged=True로 직전 결과를 반환합니다.
+        """
+        paths = {"feeds_yaml": FEEDS_PATH, "opml": OPML_PATH, "blacklist": get_store().path}
+        version = self.state_repo.version(FEEDS_VERSION)
+        inputs, skipped = self._unchanged_sync("sot_mongo", paths, delete_missing, version, force)
+        if skipped is not None:
+            return skipped
+        current = set(self.feed_repo.list_ids())
 
-        a = d = 0
-        for u in to_add:
-            try:
-                r.add_feed(u)
-                a += 1
-            except:
-                pass
-        for u in to_remove:
-            try:
-                r.delete_feed(u)
-                d += 1
-            except:
-                pass
-        r.update_feeds()
-        return {"added": a, "removed": d, "kept": len(want & have)}
-
-    def sync_feeds_to_mongo(self, delete_missing: bool = False) -> Dict[str, Any]:
-        """feeds.yaml + OPML을 MongoDB와 동기화"""
         feeds_yaml, urls_yaml = self.load_feeds_yaml()
         urls_opml = load_opml_urls(OPML_PATH)
-        bl = self.load_blacklist_urls()
+        bl = self.load_blacklist()
         wanted: Set[str] = {normalize_url(u) for u in (urls_yaml + urls_opml) if u}
         wanted = {u for u in wanted if u not in bl}
 
-        current = set(d["_id"] for d in self.feed_repo.collection.find({}, {"_id": 1}))
-
         to_add = sorted(wanted - current)
         to_remove = sorted(current - wanted) if delete_missing else []
 
-        # upsert
-        from pymongo import UpdateOne
-        ops = []
-        for u in to_add:
-            ops.append(UpdateOne({"_id": u}, {"$set": {"title": u, "site_url": u, "enabled": True}}, upsert=True))
-        upserted = modified = 0
-        if ops:
-            res = self.feed_repo.collection.bulk_write(ops, ordered=False)
-            upserted = res.upserted_count
-            modified = res.modified_count
-
-        # delete (옵션)
-        deleted = 0
-        if to_remove:
-            r = self.feed_repo.collection.delete_many({"_id": {"$in": to_remove}})
-            deleted = r.deleted_count
+        # upsert / delete (옵션) — 저장소가 추가/삭제 건수만큼 feeds 버전을 올림
+        res = self.feed_repo.add_urls(to_add)
+        upserted, modified = res["upserted"], res["modified"]
+        deleted = self.feed_repo.delete_ids(to_remove)
 
-        return {
+        result = {
             "source": {
                 "feeds_yaml": len(urls_yaml),
                 "opml_urls": len(urls_opml),
@@ -238,5 +565,9 @@ class FeedService:
             "modified": modified,
             "deleted": deleted,
             "kept": len(wanted & current),
+            "unchanged": False,
         }
-
+        noop = {**result, "added": 0, "modified": 0, "deleted": 0, "kept": len(wanted)}
+        target = self._target_after(FEEDS_VERSION, version, int(upserted > 0) + int(deleted > 0))
+        self._save_sync("sot_mongo", inputs, delete_missing, target, noop)
+        return result
@@ -0,0 +1,265 @@
+# backend/services/index_service.py
+"""인덱스 관리 서비스
+
+각 저장소가 INDEXES로 선언한 인덱스와 MongoDB의 실제 인덱스를 비교해 맞추고(reconcile),
+주요 조회(통계 파이프라인, /entries, /feeds, 실행 이력)를 explain해 어떤 인덱스를 쓰는지,
+컬렉션 전체 스캔(COLLSCAN)이 있는지 보고합니다.
+
+- 없는 인덱스: 생성
+- 이름은 같은데 키/옵션이 다르거나, 키는 같은데 이름이 다른 인덱스: 삭제 후 다시 생성
+- 선언에 없는 인덱스: 지우지 않고 extra로 보고만
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import bson
+from pymongo import IndexModel
+from pymongo.errors import ConnectionFailure, PyMongoError
+
+from backend.repositories import (
+    BaseRepository, FeedRepository, EntryRepository, EntryArchiveRepository, DigestInputRepository,
+    CrawlRunRepository, DiscoveryCacheRepository, FeedValidationRepository, SyncStateRepository,
+)
+from backend.utils.agg_queries import (
+    DATED, since_days, pipeline_recent_count, pipeline_domains_top, pipeline_by_feed, pipeline_weekday_dist,
+)
+from backend.utils.pagination import feed_page_query
+
+logger = logging.getLogger(__name__)
+
+# explain 결과에서 이 단계가 있으면 컬렉션 전체 스캔
+COLLSCAN = "COLLSCAN"
+
+
+def _key(ix: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """인덱스 키 패턴 (IndexModel.document / index_information() 공용)"""
+    key = ix["key"]
+    items = key.items() if hasattr(key, "items") else key
+    return tuple((f, int(d) if isinstance(d, (int, float)) else d) for f, d in items)
+
+
+def _signature(ix: Dict[str, Any]) -> Tuple[Any, ...]:
+    """키 + 동작에 영향을 주는 옵션 (부분 인덱스 조건은 BSON으로 비교 — naive/aware datetime 차이 무시)"""
+    pfe = ix.get("partialFilterExpression")
+    ttl = ix.get("expireAfterSeconds")
+    return (
+        _key(ix),
+        bool(ix.get("unique")),
+        bool(ix.get("sparse")),
+        int(ttl) if ttl is not None else None,
+        bson.encode(dict(pfe)) if pfe else None,
+    )
+
+
+def _plan_summary(explain: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """explain 결과 → (선택된 계획의 단계 목록, 사용 인덱스 목록)
+
+    find/aggregate, 클래식/SBE 엔진의 출력 형태가 달라 트리 전체에서 stage/indexName을 모읍니다.
+    """
+    stages: List[str] = []
+    indexes: List[str] = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if isinstance(node.get("stage"), str):
+                stages.append(node["stage"])
+            if node.get("indexName") and node["indexName"] not in indexes:
+                indexes.append(node["indexName"])
+            for k, v in node.items():
+                if k != "rejectedPlans":
+                    walk(v)
+        elif isinstance(node, list):
+            for v in node:
+                walk(v)
+
+    walk(explain)
+    return stages, indexes
+
+
+def _hot_queries() -> List[Dict[str, Any]]:
+    """explain 대상 조회 — 서비스가 실제로 보내는 것과 같은 형태 (값은 대표값)
+
+    full_scan=True는 컬렉션 전체를 집계하는 조회라 COLLSCAN이 정상인 경우입니다.
+    """
+    days = 7
+    pipe_total, pipe_recent = pipeline_by_feed(days)
+    since = since_days(days)
+    feed_q, feed_sort, _ = feed_page_query(None, "title", "asc", None)
+    enabled_q, enabled_sort, _ = feed_page_query(True, "last_published", "desc", None)
+    sample_feed, sample_domain = "https://example.com/feed.xml", "example.com"
+    return [
+        # /admin/stats, /stats
+        {"name": "stats.recent_count", "collection": "entries", "pipeline": pipeline_recent_count(days)},
+        {"name": "stats.domains_top", "collection": "entries", "pipeline": pipeline_domains_top(days, 10)},
+        {"name": "stats.by_feed_recent", "collection": "entries", "pipeline": pipe_recent},
+        {"name": "stats.by_feed_total", "collection": "entries", "pipeline": pipe_total, "full_scan": True},
+        {"name": "stats.weekday", "collection": "entries", "pipeline": pipeline_weekday_dist()},
+        {"name": "stats.first_published", "collection": "entries", "filter": DATED,
+         "sort": [("published", 1)], "limit": 1},
+        {"name": "stats.last_published", "collection": "entries", "filter": DATED,
+         "sort": [("published", -1)], "limit": 1},
+        # /entries, 요약 입력
+        {"name": "entries.latest", "collection": "entries", "filter": {},
+         "sort": [("published", -1)], "limit": 50},
+        {"name": "entries.by_feed", "collection": "entries", "filter": {"feed_url": sample_feed},
+         "sort": [("published", -1)], "limit": 50},
+        {"name": "entries.by_domain_range", "collection": "entries",
+         "filter": {"domain": sample_domain, "published": {"$gte": since}},
+         "sort": [("published", -1)], "limit": 50},
+        {"name": "entries.range", "collection": "entries", "filter": {"published": {"$gte": since}},
+         "sort": [("published", -1)], "limit": 50},
+        {"name": "entries.mirrored_since", "collection": "entries", "filter": {"mirrored_at": {"$gte": since}},
+         "limit": 50},
+        {"name": "archive.by_feed", "collection": "entries_archive", "filter": {"feed_url": sample_feed},
+         "sort": [("published", -1)], "limit": 50},
+        # /feeds 커서 페이지네이션
+        {"name": "feeds.page_by_title", "collection": "feeds", "filter": feed_q, "sort": feed_sort, "limit": 50},
+        {"name": "feeds.page_enabled_by_last_published", "collection": "feeds", "filter": enabled_q,
+         "sort": enabled_sort, "limit": 50},
+        # /admin/runs
+        {"name": "crawl_runs.latest", "collection": "crawl_runs", "filter": {},
+         "sort": [("started_at", -1)], "limit": 50},
+        {"name": "crawl_runs.by_trigger", "collection": "crawl_runs", "filter": {"trigger": "dag"},
+         "sort": [("started_at", -1)], "limit": 50},
+    ]
+
+
+class IndexService:
+    """선언 인덱스 조정(reconcile) 및 explain 기반 점검"""
+
+    def __init__(self, repositories: Optional[List[BaseRepository]] = None):
+        self.repositories = repositories or [
+            FeedRepository(),
+            EntryRepository(),
+            EntryArchiveRepository(),
+            DigestInputRepository(),
+            CrawlRunRepository(),
+            DiscoveryCacheRepository(),
+            FeedValidationRepository(),
+            SyncStateRepository(),
+        ]
+
+    @staticmethod
+    def _diff(repo: BaseRepository) -> Dict[str, Any]:
+        """선언 vs 실제 인덱스 비교 → missing(IndexModel), changed((기존 이름, IndexModel)), ok, extra"""
+        existing = repo.collection.index_information()
+        by_key = {_key(ix): name for name, ix in existing.items()}
+        missing: List[IndexModel] = []
+        changed: List[Tuple[str, IndexModel]] = []
+        ok: List[str] = []
+        claimed = {"_id_"}
+        for model in repo.INDEXES:
+            doc = model.document
+            name = doc["name"]
+            cur = name if name in existing else by_key.get(_key(doc))
+            if cur is None:
+                missing.append(model)
+            elif cur != name or _signature(existing[cur]) != _signature(doc):
+                changed.append((cur, model))
+            else:
+                ok.append(name)
+            if cur is not None:
+                claimed.add(cur)
+        return {
+            "missing": missing,
+            "changed": changed,
+            "ok": ok,
+            "extra": sorted(n for n in existing if n not in claimed),
+        }
+
+    def reconcile_collection(self, repo: BaseRepository) -> Dict[str, Any]:
+        """한 컬렉션의 인덱스를 선언에 맞춤 (실패 시 예외)"""
+        started = time.monotonic()
+        repo.ensure_collection()
+        diff = self._diff(repo)
+        rebuilt = []
+        for old_name, model in diff["changed"]:
+            # 키/옵션이 다른 같은 이름(또는 같은 키의 다른 이름) 인덱스가 있으면 생성이 거부되므로 먼저 삭제
+            repo.collection.drop_index(old_name)
+            repo.collection.create_indexes([model])
+            rebuilt.append(model.document["name"])
+        created = repo.collection.create_indexes(diff["missing"]) if diff["missing"] else []
+        result = {
+            "collection": repo.collection_name,
+            "created": created,
+            "rebuilt": rebuilt,
+            "ok": diff["ok"],
+            "extra": diff["extra"],
+            "elapsed_sec": round(time.monotonic() - started, 2),
+        }
+        if created or rebuilt:
+            logger.info(f"인덱스 조정: {repo.collection_name} 생성 {created}, 재생성 {rebuilt}")
+        return result
+
+    def reconcile(self) -> List[Dict[str, Any]]:
+        """모든 저장소의 인덱스를 선언에 맞춤 (컬렉션별 실패는 기록하고 계속, 연결 실패면 중단)"""
+        results = []
+        for repo in self.repositories:
+            try:
+                results.append(self.reconcile_collection(repo))
+            except ConnectionFailure as e:
+                logger.warning(f"인덱스 조정 중단 (MongoDB 연결 실패): {str(e)}")
+                results.append({"collection": repo.collection_name, "error": str(e)})
+                break
+            except PyMongoError as e:
+                logger.warning(f"인덱스 조정 실패 ({repo.collection_name}): {str(e)}")
+                results.append({"collection": repo.collection_name, "error": str(e)})
+        return results
+
+    def reconcile_in_background(self) -> threading.Thread:
+        """API 시작 시 조정 — 요청 처리를 막지 않도록 데몬 스레드에서 실행"""
+        t = threading.Thread(target=self.reconcile, name="index-reconcile", daemon=True)
+        t.start()
+        return t
+
+    def _explain(self, q: Dict[str, Any]) -> Dict[str, Any]:
+        """queryPlanner 단계 explain (조회를 실행하지 않음)"""
+        db = self.repositories[0].db
+        if "pipeline" in q:
+            cmd = {"aggregate": q["collection"], "pipeline": q["pipeline"], "cursor": {}}
+        else:
+            cmd = {"find": q["collection"], "filter": q["filter"]}
+            if q.get("sort"):
+                cmd["sort"] = dict(q["sort"])
+            if q.get("limit"):
+                cmd["limit"] = q["limit"]
+        return db.command("explain", cmd, verbosity="queryPlanner")
+
+    def report(self, explain: bool = True) -> Dict[str, Any]:
+        """선언 vs 실제 인덱스 현황 + 주요 조회 explain (COLLSCAN 표시)"""
+        collections = {}
+        for repo in self.repositories:
+            try:
+                diff = self._diff(repo)
+                collections[repo.collection_name] = {
+                    "declared": [m.document["name"] for m in repo.INDEXES],
+                    "missing": [m.document["name"] for m in diff["missing"]],
+                    "changed": [m.document["name"] for _, m in diff["changed"]],
+                    "extra": diff["extra"],
+                }
+            except PyMongoError as e:
+                collections[repo.collection_name] = {"error": str(e)}
+
+        queries = []
+        if explain:
+            for q in _hot_queries():
+                item = {"name": q["name"], "collection": q["collection"], "full_scan": bool(q.get("full_scan"))}
+                try:
+                    stages, indexes = _plan_summary(self._explain(q))
+                    item.update(stages=stages, indexes=indexes, collscan=COLLSCAN in stages)
+                except PyMongoError as e:
+                    item["error"] = str(e)
+                queries.append(item)
+
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "collections": collections,
+            "queries": queries,
+            # 인덱스를 타야 하는데 전체 스캔하는 조회
+            "collscans": [q["name"] for q in queries if q.get("collscan") and not q["full_scan"]],
+            "ok": not any(c.get("missing") or c.get("changed") or c.get("error") for c in collections.values())
+                  and not any(q.get("collscan") and not q["full_scan"] for q in queries),
+        }
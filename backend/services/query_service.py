@@ -0,0 +1,143 @@
+# backend/services/query_service.py
+"""읽기 전용 조회 서비스 (asyncio)
+
+FastAPI 읽기 엔드포인트(/feeds, /admin/stats, /entries)가 스레드풀을 점유하지 않도록
+AsyncFeedRepository/AsyncEntryRepository 위에서 동작합니다.
+CLI와 크롤러는 기존 동기 경로(FeedService/CrawlerService)를 그대로 사용합니다.
+"""
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.repositories import AsyncFeedRepository, AsyncEntryRepository, AsyncEntryArchiveRepository
+from backend.utils.agg_queries import (
+    pipeline_recent_count, pipeline_domains_top,
+    pipeline_by_feed, pipeline_weekday_dist, shape_stats, merge_by_published, DATED
+)
+from backend.utils.pagination import build_feed_page, feed_page_query, feed_projection
+
+ENTRY_LIST_PROJECTION = {"_id": 1, "feed_url": 1, "title": 1, "link": 1, "published": 1, "domain": 1}
+
+class QueryService:
+    """읽기 전용 조회 서비스"""
+
+    def __init__(
+        self,
+        feed_repo: Optional[AsyncFeedRepository] = None,
+        entry_repo: Optional[AsyncEntryRepository] = None,
+        archive_repo: Optional[AsyncEntryArchiveRepository] = None,
+    ):
+        self.feed_repo = feed_repo or AsyncFeedRepository()
+        self.entry_repo = entry_repo or AsyncEntryRepository()
+        self.archive_repo = archive_repo or AsyncEntryArchiveRepository()
+
+    async def get_all_feeds(self, enabled: Optional[bool] = None) -> List[Dict[str, Any]]:
+        """피드 목록 조회 (전체)"""
+        page = await self.get_feeds_page(enabled=enabled)
+        return page["feeds"]
+
+    async def get_feeds_page(
+        self,
+        enabled: Optional[bool] = None,
+        fields: Optional[List[str]] = None,
+        sort: str = "url",
+        order: str = "asc",
+        cursor: Optional[str] = None,
+        limit: int = 0,
+    ) -> Dict[str, Any]:
+        """피드 목록 커서 페이지 조회 (limit=0이면 전체)"""
+        query, sort_spec, field = feed_page_query(enabled, sort, order, cursor)
+        projection, names = feed_projection(fields, field)
+        docs = await self.feed_repo.list_feeds(
+            query, projection, sort=sort_spec, limit=limit + 1 if limit else 0
+        )
+        return build_feed_page(docs, names, field, limit)
+
+    async def get_stats(self, days: int = 7) -> Dict[str, Any]:
+        """통계 조회 (집계 파이프라인 동시 실행, 전체 누적 값은 아카이브 롤업 포함)"""
+        pipe_total, pipe_recent = pipeline_by_feed(days)
+        (feeds, total, recent, domains, by_total, by_recent, weekday, first, last, archived) = await asyncio.gather(
+            self.feed_repo.count(),
+            self.entry_repo.estimated_count(),
+            self.entry_repo.aggregate(pipeline_recent_count(days)),
+            self.entry_repo.aggregate(pipeline_domains_top(days, 10)),
+            self.entry_repo.aggregate(pipe_total),
+            self.entry_repo.aggregate(pipe_recent),
+            self.entry_repo.aggregate(pipeline_weekday_dist()),
+            self.entry_repo.find_one(DATED, sort=[("published", 1)]),
+            self.entry_repo.find_one(DATED, sort=[("published", -1)]),
+            self.archive_repo.get_rollup(),
+        )
+        return shape_stats(
+            days=days, feeds=feeds, total=total, recent=recent, domains=domains,
+            by_feed_total=by_total, by_feed_recent=by_recent, weekday=weekday,
+            first_entry=first, last_entry=last, archived=archived,
+        )
+
+    async def list_entries(
+        self,
+        feed_url: Optional[str] = None,
+        domain: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """엔트리 목록 조회 (feed_url/domain + published 인덱스 사용, 최신순)
+
+        요청 기간이 아카이브 경계(archived_before) 이전을 포함할 때만 entries_archive도 읽어 합칩니다.
+        """
+        query: Dict[str, Any] = {}
+        if feed_url:
+            query["feed_url"] = feed_url
+        if domain:
+            query["domain"] = domain
+        if start or end:
+            rng: Dict[str, Any] = {}
+            if start:
+                rng["$gte"] = start
+            if end:
+                rng["$lt"] = end
+            query["published"] = rng
+
+        archived_before, archived_total = await self.archive_repo.boundary()
+        if archived_before is None or (start is not None and start >= archived_before):
+            docs, total = await asyncio.gather(
+                self.entry_repo.find(query, ENTRY_LIST_PROJECTION, sort=[("published", -1)], skip=skip, limit=limit),
+                self.entry_repo.count(query),
+            )
+        else:
+            # 조건 없는 목록은 아카이브 전체 건수를 롤업에서 (count_documents 전체 스캔 생략)
+            docs, total = await self._list_with_archive(query, skip, limit, None if query else archived_total)
+        return {
+            "entries": [{**{k: v for k, v in d.items() if k != "_id"}, "id": d["_id"]} for d in docs],
+            "total": total,
+        }
+
+    async def _list_with_archive(
+        self, query: Dict[str, Any], skip: int, limit: int, arc_total: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """hot + 아카이브 합친 페이지 (각각 skip+limit건을 읽어 published 순으로 병합)
+
+        arc_total을 주면(롤업 건수) 아카이브 count를 실행하지 않습니다.
+        """
+        want = skip + limit
+        sort = [("published", -1)]
+        reads = [self.entry_repo.find(query, ENTRY_LIST_PROJECTION, sort=sort, limit=want), self.entry_repo.count(query)]
+        if arc_total is None:
+            reads.append(self.archive_repo.count(query))
+        hot, hot_total, *counted = await asyncio.gather(*reads)
+        if counted:
+            arc_total = counted[0]
+        # hot만으로 페이지가 차면(아카이브는 모두 더 오래됨) 아카이브 문서는 읽지 않음
+        if arc_total and (len(hot) < want or hot[-1].get("published") is None):
+            archived = await self.archive_repo.find(query, ENTRY_LIST_PROJECTION, sort=sort, limit=want)
+            hot = merge_by_published(hot, archived, limit=want)
+        return hot[skip:want], hot_total + arc_total
+
+    async def get_entry(self, entry_id: str) -> Optional[Dict[str, Any]]:
+        """엔트리 단건 조회 (compact 모드로 분리 저장된 summary/authors 포함, 없으면 아카이브에서)"""
+        doc = await self.entry_repo.get_with_body(entry_id) or await self.archive_repo.get_with_body(entry_id)
+        if doc is None:
+            return None
+        return {**{k: v for k, v in doc.items() if k not in ("_id", "has_body")}, "id": doc["_id"]}
@@ -0,0 +1,230 @@
+# backend/services/reader_maintenance_service.py
+"""Reader SQLite 정리 서비스
+
+MongoDB가 엔트리 이력의 원본(entries/entries_archive)이므로 Reader DB에는 미러링에 필요한
+최근 엔트리만 있으면 됩니다. 정리 순서:
+
+1. 정리 전 측정 — 파일 크기(DB + WAL), 페이지/빈 페이지 수, 대표 Reader 조회 시간
+2. 오래된 엔트리 선택 — 날짜(published → updated → added)와 Reader 추가 시각(added)이 모두
+   READER_PRUNE_DAYS일보다 오래되고, 같은 _id가 MongoDB에 있는(미러링된) 엔트리만
+3. 배치 삭제 — 엔트리 태그 등은 외래 키로 함께 삭제, 검색 인덱스는 reader 트리거가 처리
+4. incremental vacuum(처음 한 번은 auto_vacuum=INCREMENTAL 전환을 위해 전체 VACUUM) + ANALYZE
+   + WAL 체크포인트(TRUNCATE)
+5. 정리 후 측정
+
+아카이브 경계 이전 엔트리는 미러링이 건너뛰므로(entries_archive에 이미 있음) Reader에서 지우는
+방법은 이 정리뿐입니다.
+
+added 조건은 피드 XML에 아직 남은 오래된 엔트리가 Reader에 다시 추가됐을 때
+매번 삭제/추가를 반복하지 않도록 합니다 (다시 추가된 엔트리는 N일 뒤에 정리).
+"""
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.core.config import RSS_DB_PATH, READER_PRUNE_DAYS, READER_PRUNE_BATCH
+from backend.repositories import EntryRepository, EntryArchiveRepository
+from backend.services.crawler_service import entry_key
+from backend.services.reader_service import ReaderService, apply_pragmas, connection_pragmas
+
+logger = logging.getLogger(__name__)
+
+# PRAGMA auto_vacuum 값
+AUTO_VACUUM_INCREMENTAL = 2
+# 조회 시간은 여러 번 재서 가장 빠른 값 사용 (캐시 워밍 차이 제거)
+_QUERY_REPEAT = 3
+# 엔트리 조회 한 번에 가져올 개수 (/feeds/reader, 미러링 페이지 크기와 비슷하게)
+_SAMPLE_LIMIT = 100
+# 정리 대상 선택 — Reader 엔트리의 added는 first_updated 컬럼 (본문 컬럼은 읽지 않음)
+_CANDIDATES_SQL = (
+    "SELECT feed, id, link, title, published FROM entries "
+    "WHERE coalesce(published, updated, first_updated) < ? AND first_updated < ?"
+)
+_FETCH_SIZE = 1000
+
+
+def _sqlite_ts(dt: datetime) -> str:
+    """Reader가 저장하는 시각 형식 (naive UTC ISO, 날짜와 시간 사이 공백) — 문자열 비교로 대소 판정"""
+    return dt.astimezone(timezone.utc).replace(tzinfo=None).isoformat(" ")
+
+
+def _row_key(feed: str, id: str, link: Optional[str], title: Optional[str], published: Optional[str]) -> str:
+    """entries 행 → MongoDB _id (entry_key와 같은 규칙)"""
+    pub = datetime.fromisoformat(published).replace(tzinfo=timezone.utc) if published else None
+    return entry_key(SimpleNamespace(id=id, link=link, title=title, published=pub, feed=SimpleNamespace(url=feed)))
+
+
+def _ms(fn: Callable[[], Any]) -> float:
+    best = None
+    for _ in range(_QUERY_REPEAT):
+        t0 = time.perf_counter()
+        fn()
+        sec = time.perf_counter() - t0
+        best = sec if best is None else min(best, sec)
+    return round(best * 1000, 2)
+
+
+class ReaderMaintenanceService:
+    """Reader SQLite 연결 설정, 오래된 엔트리 정리, vacuum/analyze"""
+
+    def __init__(
+        self,
+        entry_repo: Optional[EntryRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+        reader_service: type = ReaderService,
+        db_path: str = RSS_DB_PATH,
+    ):
+        self.entry_repo = entry_repo or EntryRepository()
+        self.archive_repo = archive_repo or EntryArchiveRepository()
+        self.reader_service = reader_service
+        self.db_path = db_path
+
+    def _connect(self) -> sqlite3.Connection:
+        """정리용 연결 (autocommit — VACUUM은 트랜잭션 밖에서만 실행됨)"""
+        db = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        db.execute("PRAGMA foreign_keys = ON")
+        apply_pragmas(db)
+        return db
+
+    def _query_times(self) -> Dict[str, float]:
+        """대표 Reader 조회 시간(ms) — 읽기 풀 Reader로 측정"""
+        with self.reader_service.read_reader() as r:
+            feed = next(iter(r.get_feeds(limit=1)), None)
+            times = {
+                "entries_recent": _ms(lambda: list(r.get_entries(limit=_SAMPLE_LIMIT))),
+                "entry_counts": _ms(lambda: r.get_entry_counts()),
+                "feeds": _ms(lambda: list(r.get_feeds())),
+            }
+            if feed is not None:
+                times["entries_by_feed"] = _ms(lambda: list(r.get_entries(feed=feed, limit=_SAMPLE_LIMIT)))
+        return times
+
+    def _measure(self, db: sqlite3.Connection) -> Dict[str, Any]:
+        """파일 크기, 페이지 현황, 엔트리 수, 조회 시간"""
+        wal = f"{self.db_path}-wal"
+        db_bytes = os.path.getsize(self.db_path)
+        wal_bytes = os.path.getsize(wal) if os.path.exists(wal) else 0
+        return {
+            "db_bytes": db_bytes,
+            "wal_bytes": wal_bytes,
+            "total_bytes": db_bytes + wal_bytes,
+            "page_size": db.execute("PRAGMA page_size").fetchone()[0],
+            "page_count": db.execute("PRAGMA page_count").fetchone()[0],
+            "freelist_count": db.execute("PRAGMA freelist_count").fetchone()[0],
+            "entries": db.execute("SELECT count(*) FROM entries").fetchone()[0],
+            "query_ms": self._query_times(),
+        }
+
+    def _candidates(self, db: sqlite3.Connection, cutoff: datetime) -> List[Tuple[str, str, str]]:
+        """오래된 엔트리 (feed_url, entry_id, MongoDB _id) 목록 — 정리용 연결에서 키 컬럼만 SQL로 선택"""
+        ts = _sqlite_ts(cutoff)
+        cur = db.execute(_CANDIDATES_SQL, (ts, ts))
+        old = []
+        while True:
+            rows = cur.fetchmany(_FETCH_SIZE)
+            if not rows:
+                break
+            old.extend((feed, id, _row_key(feed, id, link, title, published))
+                       for feed, id, link, title, published in rows)
+        return old
+
+    def _mirrored(self, keys: List[str]) -> set:
+        """MongoDB(entries, 없으면 entries_archive)에 있는 _id 집합"""
+        found = self.entry_repo.existing_ids(keys)
+        rest = [k for k in keys if k not in found]
+        return found | self.archive_repo.existing_ids(rest)
+
+    def _vacuum(self, db: sqlite3.Connection) -> Dict[str, Any]:
+        """빈 페이지 반환 + 통계 갱신 + WAL 체크포인트"""
+        free_before = db.execute("PRAGMA freelist_count").fetchone()[0]
+        if db.execute("PRAGMA auto_vacuum").fetchone()[0] != AUTO_VACUUM_INCREMENTAL:
+            # auto_vacuum 모드 전환은 전체 VACUUM으로 파일을 다시 써야 적용됨 (최초 1회)
+            logger.info("Reader DB auto_vacuum=INCREMENTAL 전환 (전체 VACUUM)")
+            db.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            db.execute("VACUUM")
+            mode = "full"
+        else:
+            db.execute("PRAGMA incremental_vacuum").fetchall()
+            mode = "incremental"
+        db.execute("ANALYZE")
+        busy, _, _ = db.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+        return {
+            "mode": mode,
+            "freed_pages": free_before - db.execute("PRAGMA freelist_count").fetchone()[0],
+            # 읽기 중인 연결이 있어 WAL을 다 비우지 못한 경우
+            "checkpoint_busy": bool(busy),
+        }
+
+    def maintain(
+        self, days: Optional[int] = None, dry_run: bool = False, batch_size: int = READER_PRUNE_BATCH
+    ) -> Dict[str, Any]:
+        """미러링된 오래된 엔트리 정리 + vacuum/analyze, 전후 크기/조회 시간 보고
+
+        dry_run이면 측정과 삭제 대상 집계만 하고 DB는 바꾸지 않습니다.
+        """
+        started = time.monotonic()
+        days = days or READER_PRUNE_DAYS
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+        # 이 프로세스의 Reader가 DB를 만들고 연결 설정을 적용한 뒤에 측정
+        self.reader_service.get_reader()
+
+        db = self._connect()
+        try:
+            before = self._measure(db)
+            scanned, old = before["entries"], self._candidates(db, cutoff)
+
+            pruned = not_mirrored = 0
+            deletable: List[Tuple[str, str]] = []
+            for i in range(0, len(old), batch_size):
+                batch = old[i:i + batch_size]
+                mirrored = self._mirrored([k for _, _, k in batch])
+                keep = [(f, eid) for f, eid, k in batch if k in mirrored]
+                not_mirrored += len(batch) - len(keep)
+                deletable.extend(keep)
+
+            vacuum = None
+            if not dry_run:
+                # 프로세스 내 Reader 쓰기(업데이트/미러링)와 겹치지 않게 writer 락 아래에서 실행
+                with self.reader_service.writer():
+                    for i in range(0, len(deletable), batch_size):
+                        db.execute("BEGIN IMMEDIATE")
+                        try:
+                            cur = db.executemany(
+                                "DELETE FROM entries WHERE feed = ? AND id = ?", deletable[i:i + batch_size]
+                            )
+                            db.execute("COMMIT")
+                        except BaseException:
+                            db.execute("ROLLBACK")
+                            raise
+                        pruned += cur.rowcount
+                    logger.info(f"Reader 엔트리 정리: {pruned}개 삭제 (기준 {cutoff.date()})")
+                    vacuum = self._vacuum(db)
+
+            after = self._measure(db) if not dry_run else before
+        finally:
+            db.close()
+
+        elapsed = round(time.monotonic() - started, 2)
+        logger.info(
+            f"Reader 정리 완료: {before['total_bytes']} → {after['total_bytes']} 바이트, "
+            f"삭제 {pruned}개 ({elapsed}초)"
+        )
+        return {
+            "days": days,
+            "cutoff": cutoff.isoformat(),
+            "dry_run": dry_run,
+            "pragmas": connection_pragmas(),
+            "scanned": scanned,
+            "candidates": len(deletable),
+            "not_mirrored": not_mirrored,
+            "pruned": pruned,
+            "vacuum": vacuum,
+            "before": before,
+            "after": after,
+            "saved_bytes": before["total_bytes"] - after["total_bytes"],
+            "elapsed_sec": elapsed,
+        }
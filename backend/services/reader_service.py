@@ -1,17 +1,136 @@
 # backend/services/reader_service.py
-"""Reader 라이브러리 래퍼 서비스"""
-from reader import make_reader
-from backend.core.config import RSS_DB_PATH
+"""Reader 라이브러리 래퍼 서비스
+
+- 쓰기: 단일 Reader 인스턴스 + 재진입 락(writer)으로 프로세스 내 쓰기를 직렬화
+- 읽기: read-only Reader 풀(read_reader)로 API 조회가 크롤링 쓰기 뒤에 줄 서지 않도록 분리
+SQLite는 WAL 모드이므로 read-only 연결은 진행 중인 쓰기 트랜잭션과 동시에 읽을 수 있습니다.
+- 연결 설정: Reader가 스레드마다 여는 SQLite 연결에 synchronous/mmap_size/journal_size_limit 적용
+"""
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from backend.core.config import (
+    RSS_DB_PATH, READER_POOL_SIZE, READER_POOL_TIMEOUT, ensure_data_dir,
+    READER_SQLITE_TUNING, READER_SQLITE_SYNCHRONOUS, READER_SQLITE_MMAP_SIZE, READER_SQLITE_JOURNAL_SIZE_LIMIT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def connection_pragmas() -> Dict[str, Any]:
+    """연결마다 적용할 PRAGMA (저장되지 않는 연결 단위 설정)"""
+    return {
+        "synchronous": READER_SQLITE_SYNCHRONOUS,
+        "mmap_size": READER_SQLITE_MMAP_SIZE,
+        "journal_size_limit": READER_SQLITE_JOURNAL_SIZE_LIMIT,
+    }
+
+
+def apply_pragmas(db) -> None:
+    """sqlite3 연결에 connection_pragmas() 적용"""
+    for name, value in connection_pragmas().items():
+        db.execute(f"PRAGMA {name} = {value}")
+
+
+def _tune(r):
+    """Reader의 연결 팩토리에 PRAGMA 적용을 끼워 넣음
+
+    reader는 연결 설정 훅을 공개하지 않으므로 내부 팩토리(_storage.factory.setup_db)를 감쌉니다.
+    이미 열린 생성 스레드 연결에도 바로 적용하고, 내부 구조가 다르면 기본 설정으로 둡니다.
+    """
+    if not READER_SQLITE_TUNING:
+        return r
+    factory = getattr(getattr(r, "_storage", None), "factory", None)
+    if factory is None or not hasattr(factory, "setup_db"):
+        logger.debug("Reader 연결 팩토리를 찾지 못해 SQLite 연결 설정을 건너뜀")
+        return r
+    setup_db = factory.setup_db
+
+    def tuned_setup_db(db):
+        setup_db(db)
+        apply_pragmas(db)
+
+    factory.setup_db = tuned_setup_db
+    apply_pragmas(factory())
+    return r
 
 
 class ReaderService:
     """Reader 인스턴스 관리"""
     _instance = None
+    _init_lock = threading.Lock()
+    _write_lock = threading.RLock()
+    _read_pool: "queue.LifoQueue" = queue.LifoQueue()
+    _read_created = 0
 
     @classmethod
     def get_reader(cls):
-        """Reader 인스턴스 반환 (싱글톤)"""
+        """쓰기용 Reader 인스턴스 반환 (싱글톤). 쓰기는 writer()로 감싸서 사용"""
         if cls._instance is None:
-            cls._instance = make_reader(RSS_DB_PATH)
+            with cls._init_lock:
+                if cls._instance is None:
+                    # reader는 무거운 의존성(feedparser/requests 등)을 끌고 오므로 첫 사용 시 import
+                    from reader import make_reader
+                    ensure_data_dir()
+                    cls._instance = _tune(make_reader(RSS_DB_PATH))
         return cls._instance
 
+    @classmethod
+    @contextmanager
+    def writer(cls) -> Iterator:
+        """쓰기 Reader 획득 (프로세스 내 단일 writer, 재진입 가능)"""
+        with cls._write_lock:
+            yield cls.get_reader()
+
+    @classmethod
+    def _acquire_read_reader(cls):
+        try:
+            return cls._read_pool.get_nowait()
+        except queue.Empty:
+            pass
+        with cls._init_lock:
+            if cls._read_created < READER_POOL_SIZE:
+                cls._read_created += 1
+                create = True
+            else:
+                create = False
+        if create:
+            cls.get_reader()  # DB 생성/마이그레이션은 writer가 먼저 수행
+            from reader import make_reader
+            try:
+                return _tune(make_reader(RSS_DB_PATH, read_only=True))
+            except Exception:
+                with cls._init_lock:
+                    cls._read_created -= 1
+                raise
+        return cls._read_pool.get(timeout=READER_POOL_TIMEOUT)
+
+    @classmethod
+    @contextmanager
+    def read_reader(cls) -> Iterator:
+        """읽기 전용 Reader 대여 (풀 크기 READER_POOL_SIZE, 사용 후 자동 반납)"""
+        r = cls._acquire_read_reader()
+        try:
+            yield r
+        finally:
+            cls._read_pool.put(r)
+
+    @classmethod
+    def close(cls):
+        """모든 Reader 인스턴스 종료"""
+        with cls._init_lock:
+            while True:
+                try:
+                    cls._read_pool.get_nowait().close()
+                except queue.Empty:
+                    break
+                except Exception as e:
+                    logger.debug(f"read-only Reader 종료 실패: {e}")
+            cls._read_created = 0
+            if cls._instance is not None:
+                with cls._write_lock:
+                    cls._instance.close()
+                    cls._instance = None
@@ -0,0 +1,75 @@
+# backend/services/retention_service.py
+"""엔트리 보관(retention) 서비스
+
+조회 대부분이 최근 7~90일에 몰리므로 published가 보관 기간(ENTRY_RETENTION_DAYS)보다
+오래된 엔트리를 entries → entries_archive로 배치 이동해 hot 컬렉션과 인덱스를 작게 유지합니다.
+이동이 끝나면 아카이브 전체 롤업(피드별/요일별 건수, 최초 발행 시각)을 다시 계산해
+통계의 전체 누적 값이 줄어들지 않게 합니다.
+"""
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from backend.core.config import ENTRY_RETENTION_DAYS, ENTRY_ARCHIVE_BATCH, STATS_MAX_DAYS
+from backend.repositories import EntryRepository, EntryArchiveRepository
+
+logger = logging.getLogger(__name__)
+
+
+class RetentionService:
+    """entries → entries_archive 이동 및 롤업 관리"""
+
+    def __init__(
+        self,
+        entry_repo: Optional[EntryRepository] = None,
+        archive_repo: Optional[EntryArchiveRepository] = None,
+    ):
+        self.entry_repo = entry_repo or EntryRepository()
+        self.archive_repo = archive_repo or EntryArchiveRepository()
+
+    def archive_entries(self, days: Optional[int] = None, batch_size: int = ENTRY_ARCHIVE_BATCH) -> Dict[str, Any]:
+        """days(기본 ENTRY_RETENTION_DAYS)일보다 오래된 엔트리를 아카이브로 이동
+
+        배치마다 아카이브에 먼저 쓰고(_id 기준 교체) entries에서 지우므로 중간에 멈춰도
+        다음 실행이 이어서 처리합니다. /admin/stats 최근 값이 hot만 보도록 STATS_MAX_DAYS 미만은 올림.
+        """
+        started = time.monotonic()
+        horizon = max(days or ENTRY_RETENTION_DAYS, STATS_MAX_DAYS)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=horizon)
+        q = {"published": {"$lt": cutoff}}
+
+        moved = batches = 0
+        while True:
+            batch = self.entry_repo.find(q, sort=[("published", 1)], limit=batch_size)
+            if not batch:
+                break
+            self.archive_repo.upsert_many(batch)
+            # 아카이브에 쓰지 못한 문서는 entries에 남김
+            failed = set(self.archive_repo.last_bulk["failed_index"])
+            moved += self.entry_repo.delete_ids([d["_id"] for k, d in enumerate(batch) if k not in failed])
+            batches += 1
+            logger.info(f"엔트리 아카이브 중: {moved}개 이동")
+            if failed:
+                # 같은 문서를 다시 찾아 반복하지 않도록 이번 실행은 여기서 중단
+                logger.warning(f"엔트리 아카이브 중단: {len(failed)}개 쓰기 실패 ({self.archive_repo.last_bulk['errors']})")
+                break
+
+        if moved or self.archive_repo.get_rollup() is None:
+            rollup = self.archive_repo.refresh_rollup(cutoff)
+            archived_total = rollup["total"]
+        else:
+            self.archive_repo.advance_boundary(cutoff)
+            archived_total = self.archive_repo.get_rollup().get("total", 0)
+
+        elapsed = round(time.monotonic() - started, 2)
+        logger.info(f"엔트리 아카이브 완료: {moved}개 이동 (기준 {cutoff.date()}, {elapsed}초)")
+        return {
+            "horizon_days": horizon,
+            "cutoff": cutoff.isoformat(),
+            "moved": moved,
+            "batches": batches,
+            "archived_total": archived_total,
+            "hot_total": self.entry_repo.estimated_count(),
+            "elapsed_sec": elapsed,
+        }
@@ -1,5 +1,13 @@
 # backend/utils/agg_queries.py
 from datetime import datetime, timedelta, timezone
+from heapq import merge
+from typing import Any, Dict, List, Optional
+
+
+# published가 날짜인(null이 아닌) 엔트리 필터 — 부분 인덱스(EntryRepository.INDEXES)의 조건과 같아야
+# 플래너가 부분 인덱스를 고릅니다. 1970년 이전 발행 시각은 사실상 없으므로 하한으로 사용
+PUBLISHED_FLOOR = datetime(1970, 1, 1, tzinfo=timezone.utc)
+DATED = {"published": {"$gte": PUBLISHED_FLOOR}}
 
 
 def since_days(days: int):
@@ -42,8 +50,121 @@ def pipeline_by_feed(days: int):
 def pipeline_weekday_dist():
     # 1=Sunday in $dayOfWeek; 0=Mon로 맞추려면 프론트에서 변환하거나 여기서 가공
     return [
-        {"$match": {"published": {"$ne": None}}},
+        {"$match": DATED},
         {"$group": {"_id": {"$dayOfWeek": "$published"}, "count": {"$sum": 1}}},
         {"$sort": {"_id": 1}}
     ]
 
+
+def pipeline_period_marker(match: Dict[str, Any]):
+    # 요약 입력 캐시 키 — 기간 내 엔트리 수와 마지막 미러링 시각 (건수가 같아도 갱신되면 바뀜)
+    return [
+        {"$match": match},
+        {"$group": {"_id": None, "count": {"$sum": 1}, "last_mirrored": {"$max": "$mirrored_at"}}},
+    ]
+
+
+
+def merge_by_published(*lists: List[Dict[str, Any]], limit: int = 0) -> List[Dict[str, Any]]:
+    """published 내림차순으로 정렬된 목록(hot/archive)을 합쳐 limit건 반환 (_id 중복 제거, null은 마지막)"""
+    def key(d):
+        p = d.get("published")
+        return (p is not None, p.replace(tzinfo=None) if p else datetime.min)
+
+    out, seen = [], set()
+    for d in merge(*lists, key=key, reverse=True):
+        if d["_id"] in seen:
+            continue
+        seen.add(d["_id"])
+        out.append(d)
+        if limit and len(out) >= limit:
+            break
+    return out
+
+
+def _merge_archived(
+    total: int,
+    by_feed_total: List[Dict[str, Any]],
+    weekday: List[Dict[str, Any]],
+    first_entry: Optional[Dict[str, Any]],
+    archived: Dict[str, Any],
+):
+    """hot 집계 결과에 entries_archive 롤업(전체 누적 값)을 더함"""
+    feeds = {d["_id"]: dict(d) for d in by_feed_total}
+    for d in archived.get("by_feed", []):
+        cur = feeds.setdefault(d["_id"], {"_id": d["_id"], "total": 0, "feed_title": d.get("feed_title", d["_id"])})
+        cur["total"] += d["total"]
+    days = {d["_id"]: d["count"] for d in weekday}
+    for d in archived.get("weekday", []):
+        days[d["_id"]] = days.get(d["_id"], 0) + d["count"]
+    first = archived.get("first_published")
+    if first is not None and (first_entry is None or first_entry.get("published") is None
+                              or first < first_entry["published"]):
+        first_entry = {"published": first}
+    return (
+        total + archived.get("total", 0),
+        list(feeds.values()),
+        [{"_id": k, "count": v} for k, v in sorted(days.items())],
+        first_entry,
+    )
+
+
+def shape_stats(
+    days: int,
+    feeds: int,
+    total: int,
+    recent: List[Dict[str, Any]],
+    domains: List[Dict[str, Any]],
+    by_feed_total: List[Dict[str, Any]],
+    by_feed_recent: List[Dict[str, Any]],
+    weekday: List[Dict[str, Any]],
+    first_entry: Optional[Dict[str, Any]],
+    last_entry: Optional[Dict[str, Any]],
+    archived: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """통계 파이프라인 결과 → StatsResponse 형태 (sync/async 경로 공용)
+
+    archived(entries_archive 롤업)가 있으면 전체 누적 값(entries_total, by_feed.total, weekday_dist,
+    date_range.start_date)에 더합니다. 최근 N일 값은 hot 보관 기간 안이라 entries만 봅니다.
+    """
+    if archived:
+        total, by_feed_total, weekday, first_entry = _merge_archived(
+            total, by_feed_total, weekday, first_entry, archived
+        )
+    recent_cnt = recent[0]["recent"] if recent else 0
+    domains_out = [{"domain": d["_id"] or "(none)", "count": d["count"]} for d in domains]
+
+    total_by_feed = {d["_id"]: {"total": d["total"], "title": d.get("feed_title", d["_id"])}
+                     for d in by_feed_total}
+    for d in by_feed_recent:
+        total_by_feed.setdefault(d["_id"], {"total": 0, "title": d["_id"]})
+        total_by_feed[d["_id"]]["recent"] = d["recent"]
+
+    weekday_dist = {str(item["_id"]): item["count"] for item in weekday}  # 1..7(Sun..Sat)
+
+    recent_key = f"recent_{days}d"
+    out_by_feed = []
+    for feed_url, v in total_by_feed.items():
+        out_by_feed.append({
+            "feed_url": feed_url,
+            "feed_title": v.get("title", feed_url),
+            "total": v.get("total", 0),
+            recent_key: v.get("recent", 0),
+        })
+
+    date_range = {
+        "start_date": first_entry["published"].isoformat() if first_entry and first_entry.get("published") else None,
+        "end_date": last_entry["published"].isoformat() if last_entry and last_entry.get("published") else None,
+    }
+
+    return {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "days": days,
+        "feeds": feeds,
+        "entries_total": total,
+        "entries_recent": recent_cnt,
+        "domains_top10": domains_out,
+        "weekday_dist": weekday_dist,
+        "by_feed": sorted(out_by_feed, key=lambda x: x[recent_key], reverse=True),
+        "date_range": date_range,
+    }
@@ -0,0 +1,246 @@
+# backend/utils/blacklist.py
+"""블랙리스트 엔진 (파일 영속화 + mtime 기반 hot reload)
+
+BLACKLIST_PATH(yaml) 하나를 원본으로 사용합니다.
+
+    items:                       # 피드 URL 정확 일치 (정규화 후 비교)
+      - url: https://example.com/broken/feed.xml
+        final_url: ...           # (선택) 리다이렉트 최종 URL도 함께 차단
+        reason: ...
+    domains:                     # 도메인 + 모든 하위 도메인 차단
+      - spam.example.com
+
+- URL: 정규화 URL 해시 집합 → O(1)
+- 도메인: 라벨 역순 trie → O(라벨 수), 등록 도메인 수와 무관
+
+get_blacklist()는 호출마다 파일 mtime만 확인하고, 바뀐 경우에만 다시 파싱합니다.
+API 프로세스에서 수정하면 CLI/Airflow 프로세스도 다음 호출 때 반영됩니다.
+"""
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from backend.core.config import BLACKLIST_PATH
+from backend.utils.url_norm import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# trie 노드에서 "이 도메인 자체가 차단됨" 표시 키 (라벨에는 '.'이 없으므로 충돌 없음)
+_END = "."
+
+
+def normalize_domain(domain: str) -> str:
+    """도메인 정규화 (스킴/경로가 붙어 오면 호스트만, 소문자, 앞뒤 '.' 제거)"""
+    d = domain.strip().lower()
+    if "://" in d:
+        d = urlparse(d).hostname or ""
+    return d.strip(".")
+
+
+def _item_url(item: Any) -> str:
+    """items 항목(dict 또는 문자열)의 정규화 URL"""
+    u = item.get("url") if isinstance(item, dict) else item
+    return normalize_url((u or "").strip())
+
+
+class DomainTrie:
+    """도메인 접미사 trie — 'example.com'을 넣으면 'a.b.example.com'도 매칭"""
+
+    def __init__(self, domains: Optional[List[str]] = None):
+        self.root: Dict[str, Any] = {}
+        for d in domains or []:
+            self.add(d)
+
+    def add(self, domain: str) -> None:
+        node = self.root
+        for label in reversed(normalize_domain(domain).split(".")):
+            node = node.setdefault(label, {})
+        node[_END] = True
+
+    def matches(self, host: Optional[str]) -> bool:
+        if not host:
+            return False
+        node = self.root
+        for label in reversed(host.lower().rstrip(".").split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
+
+
+class BlacklistMatcher:
+    """불변 블랙리스트 스냅샷 (로드 시 한 번 컴파일)"""
+
+    def __init__(self, urls: FrozenSet[str], domains: Tuple[str, ...]):
+        self.urls = urls
+        self.domains = domains
+        self._trie = DomainTrie(list(domains))
+
+    def __len__(self) -> int:
+        return len(self.urls) + len(self.domains)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __contains__(self, url: str) -> bool:
+        return self.is_blocked(url)
+
+    def host_blocked(self, host: Optional[str]) -> bool:
+        """호스트가 차단 도메인(또는 그 하위 도메인)인지"""
+        return bool(self.domains) and self._trie.matches(host)
+
+    def is_blocked(self, url: str) -> bool:
+        """피드/엔트리 URL 차단 여부 (정확 일치 또는 도메인 매칭)"""
+        if not url or not self:
+            return False
+        if self.urls and (url in self.urls or normalize_url(url) in self.urls):
+            return True
+        try:
+            host = urlparse(url).hostname
+        except ValueError:
+            return False
+        return self.host_blocked(host)
+
+
+_EMPTY = BlacklistMatcher(frozenset(), ())
+
+
+class BlacklistStore:
+    """블랙리스트 파일 로드/저장 (프로세스 내 스냅샷 캐시)"""
+
+    def __init__(self, path: str = BLACKLIST_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._mtime: Optional[int] = None
+        self._matcher = _EMPTY
+
+    def _read(self) -> Dict[str, Any]:
+        import yaml
+        data = yaml.safe_load(self.path.read_text(encoding="utf-8")) if self.path.exists() else None
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _compile(data: Dict[str, Any]) -> BlacklistMatcher:
+        urls = set()
+        for it in data.get("items") or []:
+            if isinstance(it, str):
+                it = {"url": it}
+            for key in ("url", "final_url"):
+                u = (it.get(key) or "").strip()
+                if u:
+                    urls.add(normalize_url(u))
+        domains = sorted({normalize_domain(d) for d in data.get("domains") or [] if d and normalize_domain(d)})
+        return BlacklistMatcher(frozenset(urls), tuple(domains))
+
+    def get(self) -> BlacklistMatcher:
+        """현재 블랙리스트 (파일 mtime이 바뀌었을 때만 다시 파싱)"""
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self._mtime:
+            return self._matcher
+        with self._lock:
+            if mtime != self._mtime:
+                # 깨진 파일이어도 mtime은 기록 — 다음 수정 전까지 매 호출 재파싱하지 않음
+                self._mtime = mtime
+                try:
+                    self._matcher = self._compile(self._read()) if mtime is not None else _EMPTY
+                    logger.info(f"블랙리스트 로드: URL {len(self._matcher.urls)}개, 도메인 {len(self._matcher.domains)}개")
+                except Exception as e:
+                    # 편집 중 깨진 파일은 무시하고 직전 스냅샷 유지
+                    logger.warning(f"블랙리스트 로드 실패, 이전 목록 유지: {str(e)}")
+        return self._matcher
+
+    def _write(self, data: Dict[str, Any]) -> None:
+        """임시 파일에 쓴 뒤 교체 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)"""
+        import yaml
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(yaml.safe_dump(data, allow_unicode=True, sort_keys=False), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _modify(self, fn) -> BlacklistMatcher:
+        with self._lock:
+            data = self._read()
+            changed = fn(data)
+            if changed:
+                self._write(data)
+        return self.get()
+
+    def add_url(self, url: str, reason: Optional[str] = None) -> BlacklistMatcher:
+        """피드 URL 차단 추가"""
+        nu = normalize_url(url)
+
+        def fn(data):
+            items = data.get("items") or []
+            if any(_item_url(it) == nu for it in items):
+                return False
+            item = {"url": nu, "added_at": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+            if reason:
+                item["reason"] = reason
+            data["items"] = items + [item]
+            return True
+
+        return self._modify(fn)
+
+    def remove_url(self, url: str) -> BlacklistMatcher:
+        """피드 URL 차단 해제"""
+        nu = normalize_url(url)
+
+        def fn(data):
+            items = data.get("items") or []
+            kept = [it for it in items if _item_url(it) != nu]
+            data["items"] = kept
+            return len(kept) != len(items)
+
+        return self._modify(fn)
+
+    def add_domain(self, domain: str) -> BlacklistMatcher:
+        """도메인 차단 추가 (하위 도메인 포함)"""
+        d = normalize_domain(domain)
+        if not d:
+            raise ValueError(f"잘못된 도메인: {domain}")
+
+        def fn(data):
+            domains = data.get("domains") or []
+            if d in {normalize_domain(x) for x in domains}:
+                return False
+            data["domains"] = domains + [d]
+            return True
+
+        return self._modify(fn)
+
+    def remove_domain(self, domain: str) -> BlacklistMatcher:
+        """도메인 차단 해제"""
+        d = normalize_domain(domain)
+
+        def fn(data):
+            domains = data.get("domains") or []
+            kept = [x for x in domains if normalize_domain(x) != d]
+            data["domains"] = kept
+            return len(kept) != len(domains)
+
+        return self._modify(fn)
+
+
+_store: Optional[BlacklistStore] = None
+
+
+def get_store() -> BlacklistStore:
+    """프로세스 전역 BlacklistStore"""
+    global _store
+    if _store is None:
+        _store = BlacklistStore()
+    return _store
+
+
+def get_blacklist() -> BlacklistMatcher:
+    """현재 블랙리스트 스냅샷 (작업 단위로 한 번 받아서 사용)"""
+    return get_store().get()
@@ -6,14 +6,126 @@ RSS 피드 발견 유틸리티
 단일 책임 원칙(SRP)에 따라 FeedService와 분리되었습니다.
 """
 import logging
-from typing import List
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from feedsearch import search as fs_search
+from requests.adapters import HTTPAdapter
+
+from backend.core.config import (
+    DISCOVER_MAX_WORKERS, DISCOVER_HTTP_TIMEOUT, DISCOVER_HEAD_MAX_BYTES, DISCOVER_CONDITIONAL_CACHE_SIZE
+)
 
 logger = logging.getLogger(__name__)
 
+USER_AGENT = "RedFinRSS/1.0 (+feed discovery)"
+_HEAD_END = b"</head>"
+# </head> 이후 남은 본문이 이 크기 이하면 끝까지 읽어 연결을 풀로 반환 (초과 시 연결 종료)
+_DRAIN_LIMIT = 64 * 1024
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+# url → (ETag, Last-Modified, 발견한 링크) — 304 Not Modified면 본문 없이 재사용
+_conditional: "OrderedDict[str, Tuple[Optional[str], Optional[str], List[str]]]" = OrderedDict()
+_conditional_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """keep-alive 연결 풀을 공유하는 HTTP 세션 (동시 발견 워커 수만큼 호스트별 연결 유지)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(pool_connections=DISCOVER_MAX_WORKERS, pool_maxsize=DISCOVER_MAX_WORKERS)
+                s.mount("http://", adapter)
+                s.mount("https://", adapter)
+                s.headers.update({"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"})
+                _session = s
+    return _session
+
+
+def _read_head(resp: requests.Response) -> Tuple[bytes, bool]:
+    """응답 본문을 스트리밍으로 읽다가 </head>를 만나면(또는 상한 도달 시) 중단
+
+    Returns:
+        (읽은 <head> 조각, 본문 끝까지 읽었는지) — 끝까지 읽었으면 다시 iter_content를 부를 수 없음
+    """
+    buf = bytearray()
+    for chunk in resp.iter_content(chunk_size=8192):
+        if not chunk:
+            continue
+        # 청크 경계에 걸친 </head>도 찾도록 직전 6바이트부터 검색
+        start = max(0, len(buf) - len(_HEAD_END) + 1)
+        buf.extend(chunk)
+        idx = bytes(buf[start:]).lower().find(_HEAD_END)
+        if idx >= 0:
+            del buf[start + idx + len(_HEAD_END):]
+            return bytes(buf), False
+        if len(buf) >= DISCOVER_HEAD_MAX_BYTES:
+            return bytes(buf), False
+    return bytes(buf), True
+
+
+def _drain(resp: requests.Response) -> None:
+    """남은 본문이 작으면 소비해 keep-alive 연결 재사용 (다 읽지 않은 응답은 close 시 연결이 끊김)"""
+    drained = 0
+    for chunk in resp.iter_content(chunk_size=8192):
+        drained += len(chunk)
+        if drained > _DRAIN_LIMIT:
+            return
+
+
+def _parse_feed_links(head: bytes, base_url: str, encoding: Optional[str]) -> List[str]:
+    """<head> 조각에서 RSS/Atom <link> href 추출 (link 태그만 파싱)"""
+    html = head.decode(encoding or "utf-8", errors="replace")
+    soup = BeautifulSoup(html, "lxml", parse_only=SoupStrainer("link"))
+    links = []
+    for link in soup.find_all("link"):
+        link_type = (link.get("type") or "").lower()
+        if "rss" in link_type or "atom" in link_type or "xml" in link_type:
+            href = link.get("href")
+            if href:
+                links.append(urljoin(base_url, href))
+    return links
+
+
+def find_head_feed_links(url: str) -> List[str]:
+    """페이지 <head>의 피드 링크 (공유 세션 + 조건부 요청 + 헤드만 스트리밍 파싱)"""
+    with _conditional_lock:
+        cached = _conditional.get(url)
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    with get_session().get(url, headers=headers, timeout=DISCOVER_HTTP_TIMEOUT, stream=True) as resp:
+        if resp.status_code == 304 and cached:
+            logger.debug(f"304 Not Modified, 캐시된 링크 사용: {url}")
+            _drain(resp)
+            return list(cached[2])
+        resp.raise_for_status()
+        head, eof = _read_head(resp)
+        links = _parse_feed_links(head, resp.url, resp.encoding)
+        etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        if not eof:
+            _drain(resp)
+
+    if etag or last_modified:
+        with _conditional_lock:
+            _conditional[url] = (etag, last_modified, links)
+            _conditional.move_to_end(url)
+            while len(_conditional) > DISCOVER_CONDITIONAL_CACHE_SIZE:
+                _conditional.popitem(last=False)
+    return links
+
 
 def discover_rss_feeds(url: str, top_k: int = 3) -> List[str]:
     """
@@ -30,7 +142,7 @@ def discover_rss_feeds(url: str, top_k: int = 3) -> List[str]:
     
     # 1. feedsearch 라이브러리 사용 (가장 신뢰성 높음)
     try:
-        res = fs_search(url, max_urls=20, timeout=10)
+        res = fs_search(url, max_urls=20, timeout=DISCOVER_HTTP_TIMEOUT)
         candidates = [x.url for x in res][:top_k]
         if candidates:
             logger.debug(f"feedsearch로 {len(candidates)}개 피드 발견: {url}")
@@ -38,18 +150,9 @@ def discover_rss_feeds(url: str, top_k: int = 3) -> List[str]:
     except Exception as e:
         logger.debug(f"feedsearch 실패 ({url}): {str(e)}")
     
-    # 2. HTML <link> 태그에서 RSS 링크 찾기 (fallback)
+    # 2. HTML <head>의 <link> 태그에서 RSS 링크 찾기 (fallback)
     try:
-        html = requests.get(url, timeout=10).text
-        soup = BeautifulSoup(html, "lxml")
-        links = []
-        for link in soup.find_all("link"):
-            link_type = (link.get("type") or "").lower()
-            if "rss" in link_type or "atom" in link_type or "xml" in link_type:
-                href = link.get("href")
-                if href:
-                    links.append(href)
-        candidates = links[:top_k]
+        candidates = find_head_feed_links(url)[:top_k]
         if candidates:
             logger.debug(f"HTML 파싱으로 {len(candidates)}개 피드 발견: {url}")
             return candidates
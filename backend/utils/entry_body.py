@@ -0,0 +1,87 @@
+# backend/utils/entry_body.py
+"""엔트리 본문(summary/authors) 변환 — compact 저장 모드용
+
+compact 모드의 entries 문서는 목록/통계/요약 후보 조회에 필요한 필드와 평문 미리보기만
+가집니다. ENTRY_SUMMARY_INLINE_MAX를 넘는 summary와 authors 목록은 entry_bodies 컬렉션에
+{_id: 엔트리 ID, summary_z: zlib(UTF-8), authors, size} 형태로 저장하고 entries에는 has_body만 남깁니다.
+"""
+import html
+import re
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import Binary
+
+from backend.core.config import ENTRY_SUMMARY_INLINE_MAX, ENTRY_PREVIEW_CHARS, ENTRY_BODY_ZLIB_LEVEL
+
+_tag_re = re.compile(r"<[^>]+>")
+_ws_re = re.compile(r"\s+")
+
+
+def plain_text(summary: Optional[str], limit: int) -> str:
+    """summary HTML → 공백 정리된 평문 (limit 글자로 자르기)"""
+    if not summary:
+        return ""
+    txt = _ws_re.sub(" ", html.unescape(_tag_re.sub(" ", summary))).strip()
+    return txt[:limit]
+
+
+def author_docs(authors: Any) -> List[Dict[str, str]]:
+    """Reader Author 객체 목록 → BSON으로 저장 가능한 dict 목록 (None 필드 제외)"""
+    docs = []
+    for a in authors or ():
+        if isinstance(a, dict):
+            d = {k: v for k, v in a.items() if v}
+        elif isinstance(a, str):
+            d = {"name": a}
+        else:
+            d = {k: v for k in ("name", "href", "email") if (v := getattr(a, k, None))}
+        if d:
+            docs.append(d)
+    return docs
+
+
+def split_entry(doc: Dict[str, Any]) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]], List[str]]:
+    """전체 엔트리 문서 → (entries용 문서, entry_bodies용 문서 | None, entries에서 지울 필드)"""
+    hot = {k: v for k, v in doc.items() if k not in ("summary", "authors")}
+    summary = doc.get("summary")
+    authors = doc.get("authors") or []
+    body: Dict[str, Any] = {}
+    unset = ["authors"]
+
+    if summary:
+        hot["preview"] = plain_text(summary, ENTRY_PREVIEW_CHARS)
+        raw = summary.encode("utf-8")
+        if len(raw) <= ENTRY_SUMMARY_INLINE_MAX:
+            hot["summary"] = summary
+        else:
+            body["summary_z"] = Binary(zlib.compress(raw, ENTRY_BODY_ZLIB_LEVEL))
+            body["size"] = len(raw)
+            unset.append("summary")
+    else:
+        unset += ["summary", "preview"]
+    if authors:
+        body["authors"] = authors
+        # 목록 표시용 첫 저자 이름만 entries에 유지
+        if authors[0].get("name"):
+            hot["author"] = authors[0]["name"]
+    if "author" not in hot:
+        unset.append("author")
+
+    hot["has_body"] = bool(body)
+    if body:
+        body["_id"] = doc["_id"]
+        return hot, body, unset
+    return hot, None, unset
+
+
+def unpack_body(body: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """entry_bodies 문서 → {"summary", "authors"} (압축 해제)"""
+    if not body:
+        return {}
+    out: Dict[str, Any] = {}
+    if body.get("summary_z") is not None:
+        out["summary"] = zlib.decompress(bytes(body["summary_z"])).decode("utf-8")
+    if body.get("authors"):
+        out["authors"] = body["authors"]
+    return out
@@ -0,0 +1,120 @@
+# backend/utils/feed_validation.py
+"""피드 등록 전 검증 (동시 프로브)
+
+add_feed / import_opml / discover로 들어온 URL을 Reader/feeds 컬렉션에 넣기 전에
+실제로 받아 RSS/Atom으로 파싱되는지 확인합니다. HTML 페이지, 4xx/5xx, 리다이렉트로
+끝난 죽은 링크가 등록되면 이후 모든 update_feeds에서 매번 실패 요청을 만들기 때문입니다.
+
+결과 항목: url, ok, reason, status, content_type, final_url, entries, elapsed_ms
+ok는 True(통과) / False(거부) / None(총 시간 예산 안에 확인하지 못함, reason=deferred)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from backend.core.config import (
+    FEED_VALIDATION_MAX_WORKERS, FEED_VALIDATION_TIMEOUT, FEED_VALIDATION_MAX_BYTES
+)
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "RedFinRSS/1.0 (+feed validation)"
+ACCEPT = "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.5"
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """검증 워커 수만큼 keep-alive 연결을 유지하는 공유 세션"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                s = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=FEED_VALIDATION_MAX_WORKERS, pool_maxsize=FEED_VALIDATION_MAX_WORKERS
+                )
+                s.mount("http://", adapter)
+                s.mount("https://", adapter)
+                s.headers.update({"User-Agent": USER_AGENT, "Accept": ACCEPT})
+                _session = s
+    return _session
+
+
+def _result(url: str, ok: Optional[bool], reason: str, **fields: Any) -> Dict[str, Any]:
+    base = {"url": url, "ok": ok, "reason": reason, "status": None,
+            "content_type": None, "final_url": None, "entries": 0}
+    base.update(fields)
+    return base
+
+
+def probe_feed(url: str) -> Dict[str, Any]:
+    """URL 하나를 받아 피드 여부 판정 (본문은 FEED_VALIDATION_MAX_BYTES까지만 읽음)"""
+    import feedparser
+
+    started = time.monotonic()
+    try:
+        with get_session().get(url, timeout=FEED_VALIDATION_TIMEOUT, stream=True) as resp:
+            meta = {
+                "status": resp.status_code,
+                "content_type": (resp.headers.get("Content-Type") or "").split(";")[0].strip() or None,
+                "final_url": resp.url,
+            }
+            if resp.status_code >= 400:
+                return _result(url, False, f"http_{resp.status_code}", **meta,
+                               elapsed_ms=round((time.monotonic() - started) * 1000))
+            buf = bytearray()
+            for chunk in resp.iter_content(chunk_size=16384):
+                buf.extend(chunk)
+                if len(buf) >= FEED_VALIDATION_MAX_BYTES:
+                    break
+    except requests.RequestException as e:
+        return _result(url, False, f"error: {type(e).__name__}",
+                       elapsed_ms=round((time.monotonic() - started) * 1000))
+
+    parsed = feedparser.parse(bytes(buf), response_headers={"content-type": meta["content_type"] or ""})
+    meta["entries"] = len(parsed.entries)
+    meta["elapsed_ms"] = round((time.monotonic() - started) * 1000)
+    # version이 비어 있으면 RSS/Atom/RDF로 인식되지 않은 문서 (HTML 페이지 등)
+    if not parsed.get("version"):
+        return _result(url, False, "not_a_feed", **meta)
+    return _result(url, True, "ok", **meta)
+
+
+def validate_feeds(
+    urls: Iterable[str],
+    max_workers: int = FEED_VALIDATION_MAX_WORKERS,
+    budget_sec: Optional[float] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """여러 URL 동시 검증 {url: 결과}
+
+    budget_sec 안에 끝나지 않은 URL은 ok=None, reason=deferred — 피드가 나빠서가 아니라
+    예산이 모자라 확인하지 못한 것이므로 거부하지 않고 나중에 다시 검증합니다.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    pool = ThreadPoolExecutor(max_workers=min(max_workers, len(urls)))
+    futures = {pool.submit(probe_feed, u): u for u in urls}
+    done, not_done = wait(futures, timeout=budget_sec)
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for fut in done:
+        u = futures[fut]
+        try:
+            results[u] = fut.result()
+        except Exception as e:
+            logger.warning(f"피드 검증 실패: {u} - {str(e)}")
+            results[u] = _result(u, False, f"error: {type(e).__name__}")
+    for fut in not_done:
+        results[futures[fut]] = _result(futures[fut], None, "deferred")
+    bad = sum(1 for r in results.values() if r["ok"] is False)
+    logger.info(f"피드 검증 완료: {len(results)}개 중 {bad}개 거부, {len(not_done)}개 보류 (시간 예산 초과)")
+    return results
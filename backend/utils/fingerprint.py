@@ -0,0 +1,46 @@
+# backend/utils/fingerprint.py
+"""동기화 입력 파일 지문
+
+파일마다 [mtime_ns, size, sha256]을 기록합니다. stat이 직전과 같으면 내용을 다시 읽지 않고
+(O(1)), stat만 바뀐 경우(touch, 같은 내용으로 다시 저장)에는 내용 해시로 비교합니다.
+없는 파일은 None.
+"""
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+_CHUNK = 64 * 1024
+
+
+def file_digest(path: Path) -> str:
+    """파일 내용 sha256 (청크 단위로 읽음)"""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def fingerprint_files(
+    paths: Mapping[str, Path], prev: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], bool]:
+    """입력 파일 지문 {이름: [mtime_ns, size, sha256] | None}과 prev와 내용이 같은지 여부"""
+    prev = prev or {}
+    prints: Dict[str, Any] = {}
+    same = set(prev) == set(paths)
+    for name, path in paths.items():
+        try:
+            st = Path(path).stat()
+        except FileNotFoundError:
+            prints[name] = None
+            same = same and prev.get(name) is None
+            continue
+        old = prev.get(name)
+        if old and old[0] == st.st_mtime_ns and old[1] == st.st_size:
+            prints[name] = old
+            continue
+        digest = file_digest(Path(path))
+        prints[name] = [st.st_mtime_ns, st.st_size, digest]
+        same = same and bool(old) and old[2] == digest
+    return prints, same
+
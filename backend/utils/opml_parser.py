@@ -1,61 +1,133 @@
 # backend/utils/opml_parser.py
 from __future__ import annotations
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Set
-from backend.utils.url_norm import normalize_url, sanitize_opml_bytes
+from typing import BinaryIO, Iterable, Iterator, List, Set, Tuple
+from xml.parsers import expat
+from xml.sax.saxutils import escape
+from backend.core.exceptions import InvalidOPMLError
+from backend.utils.blacklist import BlacklistMatcher
+from backend.utils.url_norm import normalize_url, OPMLSanitizer
+
+# 스트리밍 import 시 한 번에 읽는 크기
+OPML_CHUNK_SIZE = 64 * 1024
+# 내보내기 시 한 조각에 담는 outline 수
+OPML_EXPORT_BATCH = 500
+
+
+def iter_chunks(f: BinaryIO, size: int = OPML_CHUNK_SIZE) -> Iterator[bytes]:
+    """파일 객체를 size 바이트씩 읽는 이터레이터"""
+    return iter(lambda: f.read(size), b"")
+
+
+class OPMLStream:
+    """OPML 스트리밍 파서 (청크 sanitize + expat 증분 파싱, 트리를 만들지 않음)
+
+    outline의 xmlUrl을 나오는 즉시 정규화/중복 제거/블랙리스트 필터링하므로 메모리는
+    청크 크기 + 고유 URL 집합에 비례합니다. 깨진 XML은 InvalidOPMLError.
+
+    사용:
+        stream = OPMLStream(blacklist)
+        for chunk in chunks:
+            urls = stream.feed(chunk)
+        urls = stream.close()
+    """
+
+    def __init__(self, blacklist: BlacklistMatcher | Set[str] | None = None):
+        # BlacklistMatcher는 URL 정확 일치 + 도메인 매칭, 집합이면 정규화 URL 정확 일치만
+        if isinstance(blacklist, BlacklistMatcher):
+            self.blacklist = blacklist
+        else:
+            self.blacklist = set(map(normalize_url, blacklist or set()))
+        self.seen: Set[str] = set()
+        self.outlines = 0
+        self.duplicates = 0
+        self.blacklisted = 0
+        self._pending: List[str] = []
+        self._sanitizer = OPMLSanitizer()
+        self._parser = expat.ParserCreate()
+        self._parser.StartElementHandler = self._start
+
+    def _start(self, name: str, attrs: dict) -> None:
+        if name != "outline":
+            return
+        url = attrs.get("xmlUrl")
+        if not url:
+            return
+        self.outlines += 1
+        nu = normalize_url(url)
+        if nu in self.blacklist:
+            self.blacklisted += 1
+        elif nu in self.seen:
+            self.duplicates += 1
+        else:
+            self.seen.add(nu)
+            self._pending.append(nu)
+
+    def _parse(self, text: str, final: bool) -> List[str]:
+        try:
+            self._parser.Parse(text, final)
+        except expat.ExpatError as e:
+            raise InvalidOPMLError(f"Invalid OPML: {e}") from e
+        urls, self._pending = self._pending, []
+        return urls
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """청크를 파싱하고 이번 청크에서 새로 나온 URL 반환"""
+        return self._parse(self._sanitizer.feed(chunk), final=False)
+
+    def close(self) -> List[str]:
+        """남은 입력을 마무리하고 마지막 URL 반환 (문서가 완결되지 않았으면 InvalidOPMLError)"""
+        return self._parse(self._sanitizer.close(), final=True)
+
+
+def iter_opml_urls(chunks: Iterable[bytes], stream: OPMLStream) -> Iterator[str]:
+    """청크 이터러블에서 필터링된 URL을 순서대로 생성"""
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+    yield from stream.close()
 
 
 def load_opml_urls(path: Path) -> list[str]:
     """OPML 파일에서 URL 목록 추출"""
     if not path.exists():
         return []
-    raw = path.read_bytes()
-    # 깨진 & 교정
-    raw = sanitize_opml_bytes(raw)
-    root = ET.fromstring(raw)
-    urls: list[str] = []
-    seen = set()
-    for o in root.iter("outline"):
-        url = o.attrib.get("xmlUrl")
-        if not url:
-            continue
-        nu = normalize_url(url)
-        if nu in seen:
-            continue
-        seen.add(nu)
-        urls.append(nu)
-    return urls
+    with open(path, "rb") as f:
+        return list(iter_opml_urls(iter_chunks(f), OPMLStream()))
 
 
 def parse_opml_file(path: Path, *, blacklist: Set[str] | None = None) -> dict:
     """OPML 파일 파싱 및 피드 URL 추출"""
-    blacklist = set(map(normalize_url, blacklist or set()))
-    root = ET.parse(path).getroot()
-    seen = set()
-    urls = []
-    for o in root.iter("outline"):
-        url = o.attrib.get("xmlUrl")
-        if not url:
-            continue
-        nu = normalize_url(url)
-        if nu in blacklist or nu in seen:
-            continue
-        seen.add(nu)
-        urls.append(nu)
+    with open(path, "rb") as f:
+        urls = list(iter_opml_urls(iter_chunks(f), OPMLStream(blacklist)))
     return {"urls": urls, "count": len(urls)}
 
 
+def _attr(value: str) -> str:
+    """XML 속성값 이스케이프 (&, <, >, ")"""
+    return escape(value, {'"': "&quot;"})
+
+
+def iter_opml(feeds: Iterable[Tuple[str, str | None]], batch: int = OPML_EXPORT_BATCH) -> Iterator[str]:
+    """(URL, 제목) 목록으로 OPML XML을 조각 단위로 생성 (문서 전체를 한 문자열로 만들지 않음)"""
+    yield (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<opml version="2.0"><head>\n'
+        '<title>Feeds Export</title>\n'
+        '</head><body>\n'
+    )
+    lines: List[str] = []
+    for url, title in feeds:
+        u = _attr(url)
+        t = _attr(title) if title else u
+        lines.append(f'<outline type="rss" text="{t}" title="{t}" xmlUrl="{u}" />\n')
+        if len(lines) >= batch:
+            yield "".join(lines)
+            lines = []
+    if lines:
+        yield "".join(lines)
+    yield "</body></opml>\n"
+
+
 def generate_opml(feed_urls: list[str]) -> str:
     """피드 URL 목록으로 OPML XML 생성"""
-    urls = sorted(set(feed_urls))
-    head = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<opml version="2.0"><head>',
-        '<title>Feeds Export</title>',
-        '</head><body>'
-    ]
-    body = [f'<outline type="rss" text="{u}" title="{u}" xmlUrl="{u}" />' for u in urls]
-    tail = ['</body></opml>']
-    return "\n".join(head + body + tail)
-
+    return "".join(iter_opml((u, None) for u in sorted(set(feed_urls))))
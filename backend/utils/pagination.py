@@ -0,0 +1,142 @@
+# backend/utils/pagination.py
+"""피드 목록 커서(keyset) 페이지네이션 헬퍼
+
+정렬 필드 + _id 를 커서로 사용하여 skip 없이 다음 페이지를 인덱스 범위로 조회합니다.
+sync(FeedService)와 async(QueryService) 경로가 함께 사용합니다.
+"""
+from __future__ import annotations
+import base64
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+
+# API 정렬 키 → Mongo 필드 (FeedRepository.INDEXES의 인덱스와 짝을 이룸)
+FEED_SORT_FIELDS = {
+    "url": "_id",
+    "title": "title",
+    "last_published": "last_published",
+    "enabled": "enabled",
+}
+
+# API 필드 → Mongo 필드
+FEED_FIELDS = {
+    "url": "_id",
+    "title": "title",
+    "site_url": "site_url",
+    "enabled": "enabled",
+    "last_published": "last_published",
+}
+DEFAULT_FEED_FIELDS = ("url", "title", "site_url", "enabled")
+
+
+def encode_cursor(value: Any, last_id: str) -> str:
+    """(정렬값, _id) → URL-safe 커서 문자열"""
+    raw = json_util.dumps([value, last_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, str]:
+    """커서 문자열 → (정렬값, _id). 형식이 잘못되면 ValueError"""
+    try:
+        pad = "=" * (-len(cursor) % 4)
+        value, last_id = json_util.loads(base64.urlsafe_b64decode(cursor + pad).decode("utf-8"))
+    except Exception as e:
+        raise ValueError(f"잘못된 커서: {cursor}") from e
+    return value, last_id
+
+
+def keyset_filter(field: str, value: Any, last_id: str, descending: bool) -> Dict[str, Any]:
+    """(field, _id) 순서에서 커서 다음 위치부터의 조건
+
+    Mongo 정렬에서 null/누락 값은 가장 작으므로 오름차순이면 맨 앞, 내림차순이면 맨 뒤에 옵니다.
+    """
+    if field == "_id":
+        return {"_id": {"$lt" if descending else "$gt": last_id}}
+    if value is None:
+        if descending:
+            return {field: None, "_id": {"$lt": last_id}}
+        return {"$or": [{field: None, "_id": {"$gt": last_id}}, {field: {"$ne": None}}]}
+    if descending:
+        return {"$or": [
+            {field: {"$lt": value}},
+            {field: value, "_id": {"$lt": last_id}},
+            {field: None},
+        ]}
+    return {"$or": [
+        {field: {"$gt": value}},
+        {field: value, "_id": {"$gt": last_id}},
+    ]}
+
+
+def feed_page_query(
+    enabled: Optional[bool],
+    sort: str,
+    order: str,
+    cursor: Optional[str],
+) -> Tuple[Dict[str, Any], List[Tuple[str, int]], str]:
+    """(filter, sort spec, 정렬 Mongo 필드) 생성"""
+    if sort not in FEED_SORT_FIELDS:
+        raise ValueError(f"지원하지 않는 정렬 키: {sort} (가능: {', '.join(FEED_SORT_FIELDS)})")
+    if order not in ("asc", "desc"):
+        raise ValueError(f"지원하지 않는 정렬 방향: {order}")
+    field = FEED_SORT_FIELDS[sort]
+    descending = order == "desc"
+    direction = -1 if descending else 1
+
+    query: Dict[str, Any] = {}
+    if enabled is not None:
+        query["enabled"] = enabled
+    if cursor:
+        value, last_id = decode_cursor(cursor)
+        query.update(keyset_filter(field, value, last_id, descending))
+
+    sort_spec = [("_id", direction)] if field == "_id" else [(field, direction), ("_id", direction)]
+    return query, sort_spec, field
+
+
+def feed_projection(fields: Optional[List[str]], sort_field: str) -> Tuple[Dict[str, int], List[str]]:
+    """요청 필드 → (Mongo projection, 응답 필드 목록). 커서용 정렬 필드는 항상 포함"""
+    names = list(fields) if fields else list(DEFAULT_FEED_FIELDS)
+    unknown = [f for f in names if f not in FEED_FIELDS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 필드: {', '.join(unknown)} (가능: {', '.join(FEED_FIELDS)})")
+    if "url" not in names:
+        names.insert(0, "url")
+    projection = {FEED_FIELDS[f]: 1 for f in names}
+    projection[sort_field] = 1
+    return projection, names
+
+
+def to_feed_item(doc: Dict[str, Any], names: List[str]) -> Dict[str, Any]:
+    """feeds 문서 → API 응답 dict (요청 필드만)"""
+    item: Dict[str, Any] = {}
+    for f in names:
+        if f == "enabled":
+            item[f] = doc.get("enabled", True)
+        else:
+            item[f] = doc.get(FEED_FIELDS[f])
+    return item
+
+
+def build_feed_page(
+    docs: List[Dict[str, Any]],
+    names: List[str],
+    sort_field: str,
+    limit: int,
+) -> Dict[str, Any]:
+    """limit+1건 조회 결과 → {"feeds", "total", "next_cursor"}
+
+    limit=0(전체 조회)일 때만 total을 채웁니다. 페이지 조회에서는 전체 카운트를 하지 않습니다.
+    """
+    has_more = bool(limit) and len(docs) > limit
+    if has_more:
+        docs = docs[:limit]
+    next_cursor = None
+    if has_more and docs:
+        last = docs[-1]
+        next_cursor = encode_cursor(last.get(sort_field), last["_id"])
+    return {
+        "feeds": [to_feed_item(d, names) for d in docs],
+        "total": None if limit else len(docs),
+        "next_cursor": next_cursor,
+    }
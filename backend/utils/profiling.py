@@ -0,0 +1,140 @@
+# backend/utils/profiling.py
+"""크롤러 실행 단계별 프로파일링 (opt-in)
+
+update_all의 단계(sync_feeds_to_reader / update_feeds / mirror_entries_to_mongo)마다
+- cpu: cProfile 통계 (<phase>.prof — pstats/snakeviz로 열기, <phase>.txt — 누적 시간 상위 함수)
+- mem: tracemalloc 스냅샷 (<phase>.snapshot — tracemalloc.Snapshot.load로 열기,
+  <phase>.txt — 할당 상위 위치와 이전 단계 대비 증가분)
+을 PROFILE_DIR/<run_id>/ 아래 아티팩트로 저장합니다.
+"""
+import cProfile
+import io
+import logging
+import pstats
+import re
+import threading
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from backend.core.config import PROFILE_DIR, PROFILE_TOP_N
+
+logger = logging.getLogger(__name__)
+
+PROFILE_MODES = ("cpu", "mem")
+
+_run_id_re = re.compile(r"^[0-9A-Za-z_-]+$")
+# cProfile/tracemalloc은 프로세스 전역 — 동시에 하나의 실행만 프로파일링
+_active = threading.Lock()
+
+
+def new_run_id() -> str:
+    """시간순 정렬 가능한 실행 ID (예: 20250902T124536Z-1a2b3c)"""
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:6]}"
+
+
+def run_dir(run_id: str) -> Path:
+    """실행 ID의 아티팩트 디렉토리 (경로 조작 방지)"""
+    if not _run_id_re.match(run_id):
+        raise ValueError(f"잘못된 run_id: {run_id}")
+    return Path(PROFILE_DIR) / run_id
+
+
+def list_artifacts(run_id: str) -> List[Dict[str, Any]]:
+    """실행의 프로파일 아티팩트 목록"""
+    d = run_dir(run_id)
+    if not d.is_dir():
+        return []
+    return [{"name": p.name, "bytes": p.stat().st_size} for p in sorted(d.iterdir()) if p.is_file()]
+
+
+def artifact_path(run_id: str, name: str) -> Optional[Path]:
+    """아티팩트 파일 경로 (실행 디렉토리 밖 경로는 허용하지 않음)"""
+    d = run_dir(run_id)
+    p = d / name
+    if p.parent != d or not p.is_file():
+        return None
+    return p
+
+
+class RunProfiler:
+    """단계별 프로파일러 — mode가 None이면 아무것도 하지 않음"""
+
+    def __init__(self, mode: Optional[str], run_id: str):
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(f"지원하지 않는 profile 모드: {mode} (가능: {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.run_id = run_id
+        self.artifacts: List[str] = []
+        self._owns_lock = False
+        self._started_tracemalloc = False
+        self._prev_snapshot = None
+        if mode is None:
+            return
+        if not _active.acquire(blocking=False):
+            logger.warning(f"다른 실행이 프로파일링 중이라 건너뜀 (run_id={run_id})")
+            self.mode = None
+            return
+        self._owns_lock = True
+        self.dir = run_dir(run_id)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        if mode == "mem" and not tracemalloc.is_tracing():
+            tracemalloc.start(25)
+            self._started_tracemalloc = True
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """단계 구간 프로파일링"""
+        if self.mode == "cpu":
+            prof = cProfile.Profile()
+            prof.enable()
+            try:
+                yield
+            finally:
+                prof.disable()
+                self._save_cpu(name, prof)
+        elif self.mode == "mem":
+            try:
+                yield
+            finally:
+                self._save_mem(name, tracemalloc.take_snapshot())
+        else:
+            yield
+
+    def _save_cpu(self, name: str, prof: cProfile.Profile) -> None:
+        prof.dump_stats(str(self.dir / f"{name}.prof"))
+        buf = io.StringIO()
+        pstats.Stats(prof, stream=buf).sort_stats("cumulative").print_stats(PROFILE_TOP_N)
+        (self.dir / f"{name}.txt").write_text(buf.getvalue(), encoding="utf-8")
+        self.artifacts += [f"{name}.prof", f"{name}.txt"]
+
+    def _save_mem(self, name: str, snap: "tracemalloc.Snapshot") -> None:
+        snap.dump(str(self.dir / f"{name}.snapshot"))
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"# {name}: current={current / 1e6:.1f}MB peak={peak / 1e6:.1f}MB", "", "## top allocations"]
+        lines += [str(s) for s in snap.statistics("lineno")[:PROFILE_TOP_N]]
+        if self._prev_snapshot is not None:
+            lines += ["", "## diff vs previous phase"]
+            lines += [str(s) for s in snap.compare_to(self._prev_snapshot, "lineno")[:PROFILE_TOP_N]]
+        (self.dir / f"{name}.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        self._prev_snapshot = snap
+        self.artifacts += [f"{name}.snapshot", f"{name}.txt"]
+
+    def close(self) -> None:
+        """tracemalloc 정지 및 전역 락 해제"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._prev_snapshot = None
+        if self._owns_lock:
+            _active.release()
+            self._owns_lock = False
+
+    def summary(self) -> Optional[Dict[str, Any]]:
+        """결과 요약 (프로파일링하지 않았으면 None)"""
+        if self.mode is None:
+            return None
+        return {"mode": self.mode, "run_id": self.run_id, "artifacts": self.artifacts}
@@ -1,6 +1,7 @@
 # backend/utils/url_norm.py
 from __future__ import annotations
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+import codecs
 import re
 import html
 
@@ -31,18 +32,48 @@ def normalize_url(u: str) -> str:
 
 
 # OPML 업로드 시 잘못된 '&'를 고쳐주는 최소 sanitizer
-_amp_re = re.compile(r'&(?!amp;|#\d+;|#x[0-9A-Fa-f]+;)')
-def sanitize_opml_bytes(raw: bytes) -> bytes:
-    try:
-        txt = raw.decode("utf-8")
-    except UnicodeDecodeError:
-        txt = raw.decode("latin-1")
-    # xmlUrl="...": 속성값 안의 맨홀(&)만 우선 교정
-    def _fix_attr(m):
-        val = m.group(1)
-        return f'xmlUrl="{_amp_re.sub("&amp;", val)}"'
-    txt = re.sub(r'xmlUrl="([^"]+)"', _fix_attr, txt)
-    # <title>…</title> 등 본문에 남은 맨홀도 최소 교정
-    txt = re.sub(r'>([^<]*&[^<]*)<', lambda m: ">" + _amp_re.sub("&amp;", m.group(1)) + "<", txt)
-    return txt.encode("utf-8")
+# XML 사전 정의 엔티티/문자 참조가 아닌 '&'는 모두 '&amp;'로 교정 (속성값·본문 공통)
+_amp_re = re.compile(r'&(?!(?:amp|lt|gt|quot|apos|#\d+|#x[0-9A-Fa-f]+);)')
+# 가장 긴 참조('&#x10FFFF;')보다 짧게 청크 끝에 걸친 '&'는 다음 청크와 합쳐 판단
+_AMP_HOLD = 12
+
+
+def _latin1_fallback(err: UnicodeDecodeError):
+    """UTF-8로 해석되지 않는 바이트는 latin-1로 해석 (기존 전체 latin-1 fallback의 스트리밍 버전)"""
+    return err.object[err.start:err.end].decode("latin-1"), err.end
+
+
+codecs.register_error("opml_latin1", _latin1_fallback)
+
+
+class OPMLSanitizer:
+    """청크 단위 OPML sanitizer — feed()로 받은 바이트를 교정된 문자열로 반환
 
+    멀티바이트 문자와 '&' 참조가 청크 경계에 걸쳐도 결과가 전체를 한 번에 처리한 것과 같도록
+    경계의 미완성 부분은 다음 청크까지 보류합니다.
+    """
+
+    def __init__(self):
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="opml_latin1")
+        self._carry = ""
+
+    def _fix(self, txt: str, final: bool) -> str:
+        txt = self._carry + txt
+        self._carry = ""
+        if not final:
+            pos = txt.rfind("&")
+            if pos >= 0 and len(txt) - pos < _AMP_HOLD:
+                txt, self._carry = txt[:pos], txt[pos:]
+        return _amp_re.sub("&amp;", txt)
+
+    def feed(self, chunk: bytes) -> str:
+        return self._fix(self._decoder.decode(chunk), final=False)
+
+    def close(self) -> str:
+        return self._fix(self._decoder.decode(b"", final=True), final=True)
+
+
+def sanitize_opml_bytes(raw: bytes) -> bytes:
+    """OPML 전체 바이트 교정 (UTF-8로 반환)"""
+    s = OPMLSanitizer()
+    return (s.feed(raw) + s.close()).encode("utf-8")
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+API 부하 벤치마크 — 통계/피드 엔드포인트의 처리량과 지연시간 분포
+
+로컬 MongoDB(--mongo-uri 임시 DB 또는 mongomock)에 피드 --feeds개, 엔트리 --entries개를 넣고
+(Reader DB에도 같은 피드 등록) 앱을 uvicorn으로 띄운 뒤 엔드포인트마다 --concurrency개의
+keep-alive 연결로 --requests번 호출해 처리량(req/s)과 p50/p95/p99 지연시간을 보고합니다.
+
+--baseline 파일과 엔드포인트별로 비교해 p95가 --tolerance(기본 20%)보다 느려지면 exit 1 (파일이 없어도 exit 1),
+--save-baseline이면 이번 결과를 그 파일에 저장합니다. 데이터 규모/동시성/Mongo 방식이 다른
+기준과는 비교하지 않습니다. 데이터를 늘려 가며 실행하면 지연시간이 꺾이는 지점을 찾을 수 있습니다.
+
+사용법:
+    python -m benchmarks.bench_api --feeds 500 --entries 50000 --concurrency 8 --requests 200
+    python -m benchmarks.bench_api --baseline data/bench-api.json --save-baseline   # 기준 저장
+    python -m benchmarks.bench_api --baseline data/bench-api.json                   # 기준과 비교
+"""
+import argparse
+import http.client
+import json
+import logging
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+ENDPOINTS = {
+    "admin_stats": "/api/v1/admin/stats?days=7",
+    "stats": "/stats?days=7",
+    "feeds": "/api/v1/feeds",
+    "feeds_reader": "/api/v1/feeds/reader",
+}
+# 기준과 비교할 때 같아야 하는 설정
+_COMPARABLE = ("feeds", "entries", "concurrency", "mongo")
+# 시드 엔트리 published 분포 기간(일)과 배치 크기
+_SPAN_DAYS = 365
+_SEED_BATCH = 5000
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    s = sorted(samples)
+    idx = min(len(s) - 1, max(0, int(round(q * (len(s) - 1)))))
+    return s[idx]
+
+
+def seed(n_feeds: int, n_entries: int) -> None:
+    """MongoDB feeds/entries + Reader 피드 등록 (엔트리는 mirror_entries_to_mongo와 같은 문서 형태)"""
+    from backend.core.container import Container
+    from backend.services.reader_service import ReaderService
+
+    rnd = random.Random(42)
+    now = datetime.now(timezone.utc)
+    urls = [f"https://site{i}.example/feed.xml" for i in range(n_feeds)]
+    Container.get_feed_repository().upsert_many([
+        {"_id": u, "url": u, "title": f"Bench Feed {i}", "site_url": f"https://site{i}.example/",
+         "enabled": i % 10 != 0, "last_published": now - timedelta(hours=i % 48)}
+        for i, u in enumerate(urls)
+    ])
+    entry_repo = Container.get_entry_repository()
+    for start in range(0, n_entries, _SEED_BATCH):
+        batch = []
+        for k in range(start, min(start + _SEED_BATCH, n_entries)):
+            i = rnd.randrange(n_feeds)
+            published = now - timedelta(seconds=rnd.randrange(_SPAN_DAYS * 86400))
+            batch.append({
+                "_id": f"urn:bench:{k}",
+                "feed_url": urls[i],
+                "title": f"Bench entry {k}",
+                "link": f"https://site{i}.example/posts/{k}",
+                "published": published,
+                "updated": published,
+                "authors": [{"name": f"Author {i}"}],
+                "summary": f"<p>entry {k} " + "lorem ipsum " * 40 + "</p>",
+                "domain": f"site{i}.example",
+                "mirrored_at": now,
+            })
+        entry_repo.upsert_many(batch)
+    with ReaderService.writer() as r:
+        for u in urls:
+            r.add_feed(u, exist_ok=True)
+
+
+class _Server:
+    """백그라운드 스레드의 uvicorn (lifespan 포함)"""
+
+    def __init__(self, app):
+        import uvicorn
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=0, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self) -> int:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.05)
+        return self.server.servers[0].sockets[0].getsockname()[1]
+
+    def __exit__(self, *args) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def drive(port: int, path: str, n: int, concurrency: int) -> Dict[str, Any]:
+    """concurrency개 연결로 path를 n번 호출 → 처리량, 지연시간 분위수, 오류 수"""
+    samples: List[float] = []
+    errors: List[str] = []
+    lock = threading.Lock()
+    remaining = [n]
+
+    def worker():
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        local: List[float] = []
+        try:
+            conn.request("GET", path)  # 워밍업 (연결 수립 포함, 측정 제외)
+            conn.getresponse().read()
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+            with lock:
+                errors.append(f"warmup: {e}")
+        while True:
+            with lock:
+                if remaining[0] <= 0:
+                    break
+                remaining[0] -= 1
+            t0 = time.perf_counter()
+            try:
+                conn.request("GET", path, headers={"Accept-Encoding": "identity"})
+                resp = conn.getresponse()
+                resp.read()
+                status = resp.status
+            except (OSError, http.client.HTTPException) as e:
+                conn.close()
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+                status = str(e)
+            local.append((time.perf_counter() - t0) * 1000)
+            if status != 200:
+                with lock:
+                    errors.append(str(status))
+        conn.close()
+        with lock:
+            samples.extend(local)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wall = time.perf_counter() - started
+    report = {
+        "requests": len(samples),
+        "errors": len(errors),
+        "rps": round(len(samples) / wall, 1) if wall > 0 else 0.0,
+    }
+    if not samples:
+        # --requests 0 — 분위수 없음 (compare는 None을 건너뜀)
+        return {**report, "p50_ms": None, "p95_ms": None, "p99_ms": None, "max_ms": None}
+    return {
+        **report,
+        "p50_ms": round(statistics.median(samples), 2),
+        "p95_ms": round(_percentile(samples, 0.95), 2),
+        "p99_ms": round(_percentile(samples, 0.99), 2),
+        "max_ms": round(max(samples), 2),
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> Optional[Dict[str, Any]]:
+    """기준 대비 변화율 (비교 불가능한 설정이면 None). p95가 tolerance보다 느려지면 regressed"""
+    if any(report["config"].get(k) != baseline.get("config", {}).get(k) for k in _COMPARABLE):
+        return None
+    out = {}
+    for name, cur in report["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base:
+            continue
+        change = {
+            k: round((cur[k] - base[k]) / base[k], 3) if base.get(k) and cur.get(k) is not None else None
+            for k in ("rps", "p50_ms", "p95_ms", "p99_ms")
+        }
+        change["regressed"] = change["p95_ms"] is not None and change["p95_ms"] > tolerance
+        out[name] = change
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--feeds", type=int, default=500, help="시드 피드 수")
+    ap.add_argument("--entries", type=int, default=20000, help="시드 엔트리 수")
+    ap.add_argument("--concurrency", type=int, default=8, help="동시 연결 수")
+    ap.add_argument("--requests", type=int, default=200, help="엔드포인트별 요청 수")
+    ap.add_argument("--endpoints", default=",".join(ENDPOINTS), help=f"대상 (쉼표 구분: {', '.join(ENDPOINTS)})")
+    ap.add_argument("--mongo-uri", default=None, help="로컬 mongod URI (없으면 mongomock)")
+    ap.add_argument("--baseline", default=None, help="기준 결과 JSON 경로")
+    ap.add_argument("--save-baseline", action="store_true", help="이번 결과를 --baseline 경로에 저장")
+    ap.add_argument("--tolerance", type=float, default=0.2, help="허용 p95 증가율 (0.2 = 20%%)")
+    ap.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    names = [n.strip() for n in args.endpoints.split(",") if n.strip()]
+    unknown = [n for n in names if n not in ENDPOINTS]
+    if unknown:
+        ap.error(f"알 수 없는 엔드포인트: {', '.join(unknown)}")
+
+    logging.basicConfig(level=logging.WARNING)
+    # 설정은 import 시점에 읽히므로 backend import 전에 임시 경로 지정
+    workdir = tempfile.mkdtemp(prefix="redfin-bench-api-")
+    os.environ["RSS_DB_PATH"] = os.path.join(workdir, "rss.sqlite")
+    os.environ["BLACKLIST_PATH"] = os.path.join(workdir, "blacklist.yaml")
+    # 인덱스는 시드 전에 직접 맞춤 (시작 시 백그라운드 조정이 측정과 겹치지 않게)
+    os.environ["INDEX_RECONCILE_ON_STARTUP"] = "false"
+
+    from backend.core.container import Container
+    from backend.main import app
+    from backend.services.reader_service import ReaderService
+    from benchmarks.local_mongo import local_mongo
+
+    results = {}
+    try:
+        with local_mongo(args.mongo_uri) as mongo:
+            if mongo == "mongod":
+                # mongomock은 인덱스로 조회 계획을 세우지 않고 컬렉션 옵션(블록 압축)도 지원하지 않음
+                Container.get_index_service().reconcile()
+            t0 = time.perf_counter()
+            seed(args.feeds, args.entries)
+            seed_sec = round(time.perf_counter() - t0, 2)
+            print(f"seed: {args.feeds} feeds, {args.entries} entries ({seed_sec}s, {mongo})", file=sys.stderr)
+            with _Server(app) as port:
+                for name in names:
+                    results[name] = drive(port, ENDPOINTS[name], args.requests, args.concurrency)
+                    r = results[name]
+                    print(
+                        f"{name}: {r['rps']} req/s, p50 {r['p50_ms']}ms, p95 {r['p95_ms']}ms, "
+                        f"p99 {r['p99_ms']}ms, errors {r['errors']}",
+                        file=sys.stderr,
+                    )
+    finally:
+        ReaderService.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "config": {"feeds": args.feeds, "entries": args.entries, "concurrency": args.concurrency,
+                   "requests": args.requests, "mongo": mongo},
+        "seed_sec": seed_sec,
+        "results": results,
+    }
+    ok = not any(r["errors"] for r in results.values())
+    if args.baseline and not args.save_baseline and not os.path.exists(args.baseline):
+        # 비교를 요청했는데 기준이 없으면 회귀 검사가 조용히 빠지지 않도록 실패 처리
+        print(f"기준 파일 없음: {args.baseline} (--save-baseline으로 먼저 저장)", file=sys.stderr)
+        ok = False
+    elif args.baseline and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            report["comparison"] = compare(report, json.load(f), args.tolerance)
+        if report["comparison"] is None:
+            print(f"기준과 설정이 달라 비교 생략 ({', '.join(_COMPARABLE)})", file=sys.stderr)
+        else:
+            ok = ok and not any(c["regressed"] for c in report["comparison"].values())
+    report["ok"] = ok
+
+    print(json.dumps(report, indent=2))
+    paths = [args.out] if args.out else []
+    if args.baseline and args.save_baseline:
+        paths.append(args.baseline)
+    for path in paths:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
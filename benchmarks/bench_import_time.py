@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+import 시간 예산 벤치마크 — CLI(backend.cli.main)와 API(backend.main:app) 콜드 스타트
+
+`python -X importtime`을 새 프로세스에서 실행해 모듈별 누적 import 시간을 측정하고,
+예산(ms)을 넘거나 무거운 의존성(reader, feedsearch, bs4 등)이 import 시점에
+로드되면 실패(exit 1)합니다. Airflow가 명령마다 CLI를 새로 띄우므로 CI에서 회귀 감시용으로 사용합니다.
+
+사용법:
+    python -m benchmarks.bench_import_time --runs 5 --cli-budget-ms 250 --api-budget-ms 1200
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# import 시점에 로드되면 안 되는 모듈 (명령/엔드포인트 실행 시점에만 필요)
+HEAVY_MODULES = ("reader", "feedsearch", "bs4", "lxml", "requests", "yaml")
+
+TARGETS = {
+    "cli": "backend.cli.main",
+    "api": "backend.main",
+}
+
+
+def measure(module: str) -> Dict[str, float]:
+    """새 인터프리터에서 module을 import 하고 (누적 시간 ms, 무거운 모듈 로드 여부) 반환"""
+    code = (
+        f"import sys, json, {module}; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, "PYTHONPATH": str(PROJECT_ROOT)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # 형식: "import time: self [us] | cumulative | imported package"
+    cumulative_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            cumulative_us = int(parts[1].strip())
+    loaded = json.loads(proc.stdout.strip().splitlines()[-1])
+    return {"ms": cumulative_us / 1000, "heavy": loaded}
+
+
+def run(name: str, module: str, runs: int, budget_ms: float) -> Dict[str, object]:
+    """runs회 측정 후 중앙값을 예산과 비교"""
+    samples: List[float] = []
+    heavy: List[str] = []
+    for _ in range(runs):
+        m = measure(module)
+        samples.append(m["ms"])
+        heavy = m["heavy"]
+    median = statistics.median(samples)
+    return {
+        "target": name,
+        "module": module,
+        "median_ms": round(median, 1),
+        "min_ms": round(min(samples), 1),
+        "budget_ms": budget_ms,
+        "heavy_loaded": heavy,
+        "ok": median <= budget_ms and not heavy,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=5, help="대상별 측정 횟수 (중앙값 사용)")
+    ap.add_argument("--cli-budget-ms", type=float, default=250.0, help="backend.cli.main 누적 import 예산")
+    ap.add_argument("--api-budget-ms", type=float, default=1200.0, help="backend.main 누적 import 예산")
+    ap.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    budgets = {"cli": args.cli_budget_ms, "api": args.api_budget_ms}
+    results = [run(name, module, args.runs, budgets[name]) for name, module in TARGETS.items()]
+
+    print(f"{'target':<6} {'module':<18} {'median':>9} {'min':>9} {'budget':>9}  heavy")
+    for r in results:
+        mark = "OK  " if r["ok"] else "FAIL"
+        heavy = ", ".join(r["heavy_loaded"]) or "-"
+        print(
+            f"{r['target']:<6} {r['module']:<18} {r['median_ms']:>7.1f}ms {r['min_ms']:>7.1f}ms "
+            f"{r['budget_ms']:>7.0f}ms  {heavy}  {mark}"
+        )
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    if not all(r["ok"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
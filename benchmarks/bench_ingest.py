@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+수집(ingestion) 종단 벤치마크 — 로컬 합성 피드 서버 + 로컬 MongoDB
+
+합성 피드 서버(benchmarks.feed_server)를 띄우고 feeds 컬렉션에 피드를 넣은 뒤
+CrawlerService.update_all(동기화 → Reader 업데이트 → MongoDB 미러링)을 rounds번 실행해
+라운드별 피드/초, 엔트리/초, 단계별 시간(sync/fetch/mirror), 최대 RSS, 서버가 받은 요청(200/304)을 보고합니다.
+Reader DB는 임시 디렉터리에 만들고, MongoDB는 --mongo-uri(로컬 mongod 임시 DB) 또는 mongomock을 사용하므로
+네트워크 없이 실행됩니다. 첫 라운드 피드/초가 --min-feeds-per-sec에 못 미치면 exit 1 (회귀 감시용).
+
+사용법:
+    python -m benchmarks.bench_ingest --feeds 200 --items 50 --latency-ms 20 --rounds 2 --etag static
+    python -m benchmarks.bench_ingest --etag changing --rounds 3 --mongo-uri mongodb://localhost:27017 --out data/bench-ingest.json
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import shutil
+import sys
+import tempfile
+from typing import Any, Dict
+
+from benchmarks.feed_server import ETAG_MODES, FeedServer
+
+
+def _peak_rss_mb() -> float:
+    """프로세스 시작 이후 최대 RSS(MB, Linux ru_maxrss는 KB)"""
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def run_round(service, server: FeedServer, days: int) -> Dict[str, Any]:
+    """update_all 한 번 실행 후 처리량/단계 시간 정리"""
+    before = server.counters()
+    res = service.update_all(days=days, trigger="cli")
+    after = server.counters()
+    sec = res["update_sec"] or 1e-9
+    fetch, mirrored = res["fetch"], res["mongo_entries"].get("entries_processed", 0)
+    return {
+        "update_sec": res["update_sec"],
+        "phases": res["phases"],
+        "feeds_attempted": fetch["feeds_attempted"],
+        "feeds_failed": fetch["feeds_failed"],
+        "entries_new": fetch["entries_new"],
+        "entries_updated": fetch["entries_updated"],
+        "entries_mirrored": mirrored,
+        "feeds_per_sec": round(fetch["feeds_attempted"] / sec, 1),
+        "entries_per_sec": round(mirrored / sec, 1),
+        "http": {k: after[k] - before[k] for k in after},
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--feeds", type=int, default=200, help="합성 피드 수")
+    ap.add_argument("--items", type=int, default=50, help="피드당 항목 수")
+    ap.add_argument("--summary-bytes", type=int, default=1000, help="항목 본문 크기")
+    ap.add_argument("--latency-ms", type=float, default=0, help="피드 응답 지연(ms)")
+    ap.add_argument("--etag", choices=ETAG_MODES, default="static", help="검증자 동작 (static: 2라운드부터 304)")
+    ap.add_argument("--new-items", type=int, default=5, help="changing 모드에서 라운드마다 추가되는 피드당 항목 수")
+    ap.add_argument("--rounds", type=int, default=2, help="update_all 반복 횟수 (1라운드: 첫 수집)")
+    ap.add_argument("--days", type=int, default=1, help="미러링 기간(일) — update-feeds --days와 같음")
+    ap.add_argument("--mongo-uri", default=None, help="로컬 mongod URI (없으면 mongomock)")
+    ap.add_argument("--min-feeds-per-sec", type=float, default=0, help="첫 라운드 피드/초 하한 (미달 시 exit 1)")
+    ap.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    ap.add_argument("--verbose", action="store_true", help="서비스 로그 출력")
+    args = ap.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    if not args.verbose:
+        # reader가 로컬 HTTP 응답마다 남기는 bozo 경고(피드 파싱은 정상) 생략
+        logging.getLogger("reader").setLevel(logging.ERROR)
+    # 설정은 import 시점에 읽히므로 backend import 전에 임시 경로 지정
+    workdir = tempfile.mkdtemp(prefix="redfin-bench-ingest-")
+    os.environ["RSS_DB_PATH"] = os.path.join(workdir, "rss.sqlite")
+    os.environ["BLACKLIST_PATH"] = os.path.join(workdir, "blacklist.yaml")
+    os.environ["PROFILE_DIR"] = os.path.join(workdir, "profiles")
+
+    from backend.core.container import Container
+    from backend.services.reader_service import ReaderService
+    from benchmarks.local_mongo import local_mongo
+
+    server = FeedServer(
+        args.feeds, args.items, args.summary_bytes, args.latency_ms, args.etag, new_items=args.new_items,
+    )
+    rounds = []
+    try:
+        with server, local_mongo(args.mongo_uri) as mongo:
+            Container.get_feed_repository().upsert_many(
+                [{"_id": u, "url": u, "title": f"Bench Feed {i}", "enabled": True}
+                 for i, u in enumerate(server.urls())]
+            )
+            service = Container.get_crawler_service()
+            # 2라운드부터는 reader 업데이트 주기(기본 1시간)가 지나지 않아도 모든 피드를 다시 가져오도록
+            # (reader CLI가 쓰는 것과 같은 내부 설정)
+            ReaderService.get_reader()._scheduled_override = False
+            for n in range(args.rounds):
+                if n:
+                    server.next_round()
+                rounds.append({"round": n + 1, **run_round(service, server, args.days)})
+                r = rounds[-1]
+                print(
+                    f"round {r['round']}: {r['update_sec']}s, {r['feeds_per_sec']} feeds/s, "
+                    f"{r['entries_per_sec']} entries/s, http 200={r['http']['ok']} 304={r['http']['not_modified']}",
+                    file=sys.stderr,
+                )
+    finally:
+        ReaderService.close()
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "config": {k: v for k, v in vars(args).items() if k not in ("out", "verbose", "mongo_uri")},
+        "mongo": mongo,
+        "rounds": rounds,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+    ok = not args.min_feeds_per_sec or rounds[0]["feeds_per_sec"] >= args.min_feeds_per_sec
+    report["ok"] = ok
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
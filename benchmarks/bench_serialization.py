@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+응답 직렬화 벤치마크 — 기본 경로(response_model 검증) vs fast path(orjson)
+
+MongoDB 없이 QueryService를 합성 데이터로 대체하여 /feeds, /admin/stats의
+엔드포인트 지연시간(p50/p99)을 비교합니다.
+
+사용법:
+    python -m benchmarks.bench_serialization --feeds 5000 --requests 200
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+
+from fastapi.testclient import TestClient
+
+from backend.api.deps import get_query_service
+from backend.main import app
+
+
+class SyntheticQueryService:
+    """합성 데이터를 반환하는 QueryService 대체물"""
+
+    def __init__(self, n_feeds: int):
+        self.feeds = [
+            {
+                "url": f"https://example{i}.com/feed.xml",
+                "title": f"Example Feed {i}",
+                "site_url": f"https://example{i}.com/",
+                "enabled": i % 7 != 0,
+            }
+            for i in range(n_feeds)
+        ]
+        self.stats = {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "days": 7,
+            "feeds": n_feeds,
+            "entries_total": n_feeds * 120,
+            "entries_recent": n_feeds * 9,
+            "domains_top10": [{"domain": f"example{i}.com", "count": 100 - i} for i in range(10)],
+            "weekday_dist": {str(d): 1000 + d for d in range(1, 8)},
+            "by_feed": [
+                {"feed_url": f["url"], "feed_title": f["title"], "total": 120, "recent_7d": 9}
+                for f in self.feeds
+            ],
+            "date_range": {"start_date": "2024-01-01T00:00:00", "end_date": "2025-09-01T00:00:00"},
+        }
+
+    async def get_feeds_page(self, enabled=None, **kwargs) -> Dict[str, Any]:
+        feeds = self.feeds if enabled is None else [f for f in self.feeds if f["enabled"] == enabled]
+        return {"feeds": feeds, "total": len(feeds), "next_cursor": None}
+
+    async def get_stats(self, days: int = 7) -> Dict[str, Any]:
+        return self.stats
+
+
+def _percentile(samples: List[float], q: float) -> float:
+    s = sorted(samples)
+    idx = min(len(s) - 1, max(0, int(round(q * (len(s) - 1)))))
+    return s[idx]
+
+
+def run(client: TestClient, path: str, n: int, headers: Dict[str, str]) -> Dict[str, float]:
+    client.get(path, headers=headers)  # 워밍업
+    samples = []
+    size = 0
+    for _ in range(n):
+        t0 = time.perf_counter()
+        r = client.get(path, headers=headers)
+        samples.append((time.perf_counter() - t0) * 1000)
+        r.raise_for_status()
+        size = int(r.headers.get("content-length", len(r.content)))
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(_percentile(samples, 0.99), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "bytes": size,
+    }
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--feeds", type=int, default=5000, help="합성 피드 수")
+    ap.add_argument("--requests", type=int, default=100, help="경로별 요청 수")
+    ap.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = ap.parse_args()
+
+    fake = SyntheticQueryService(args.feeds)
+    app.dependency_overrides[get_query_service] = lambda: fake
+    client = TestClient(app)
+
+    results = {}
+    for name, path in (("feeds", "/api/v1/feeds"), ("admin_stats", "/api/v1/admin/stats")):
+        results[name] = {
+            "default": run(client, f"{path}?fast=false", args.requests, {"Accept-Encoding": "identity"}),
+            "fast": run(client, f"{path}?fast=true", args.requests, {"Accept-Encoding": "identity"}),
+            "fast_gzip": run(client, f"{path}?fast=true", args.requests, {"Accept-Encoding": "gzip"}),
+        }
+        # brotli 미설치 시 압축되지 않으므로 결과에서 제외
+        br = run(client, f"{path}?fast=true", args.requests, {"Accept-Encoding": "br"})
+        if br["bytes"] != results[name]["fast"]["bytes"]:
+            results[name]["fast_br"] = br
+    app.dependency_overrides.clear()
+
+    report = {"feeds": args.feeds, "requests": args.requests, "results": results}
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+합성 RSS/Atom 피드 서버 — 로컬 HTTP, 네트워크 불필요
+
+GET /feed/<i>.xml 로 N개 피드를 제공합니다 (atom_ratio 비율만큼 Atom, 나머지는 RSS 2.0).
+- items / summary_bytes: 피드당 항목 수, 항목 본문 크기
+- latency_ms: 응답 전 지연 (원격 서버 왕복 흉내)
+- etag: none     검증자 없음 — 매 요청 전체 본문
+        static   고정 ETag/Last-Modified — 조건부 재요청에 304
+        changing 라운드(next_round)마다 피드별 new_items개 새 항목 + 새 ETag
+
+크롤러 측 CPU/메모리 측정에 섞이지 않도록 별도 프로세스에서 실행합니다.
+
+사용법 (단독 실행, Ctrl+C로 종료):
+    python -m benchmarks.feed_server --feeds 100 --items 50 --port 8099
+"""
+import argparse
+import html
+import multiprocessing as mp
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+
+ETAG_MODES = ("none", "static", "changing")
+# 항목 링크 도메인 수 (통계의 domain 분포용)
+_DOMAINS = 50
+_LOREM = (
+    "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor "
+    "incididunt ut labore et dolore magna aliqua "
+)
+_path_re = re.compile(r"^/feed/(\d+)\.xml$")
+# counters 위치
+_REQUESTS, _OK, _NOT_MODIFIED = 0, 1, 2
+
+
+def _summary(n: int, k: int) -> str:
+    text = (f"item {k} " + _LOREM * (n // len(_LOREM) + 1))[:n]
+    return f"<p>{text}</p>"
+
+
+def _items(cfg: Dict[str, Any], feed: int, generation: int, base: datetime) -> List[Dict[str, Any]]:
+    """최신순 항목 목록 (changing이면 라운드마다 new_items개씩 앞으로 밀림)"""
+    first = generation * cfg["new_items"] if cfg["etag"] == "changing" else 0
+    return [
+        {
+            "id": f"urn:bench:{feed}:{k}",
+            "title": f"Bench feed {feed} item {k}",
+            "link": f"https://site{feed % _DOMAINS}.example/posts/{feed}/{k}",
+            "published": base + timedelta(minutes=k),
+            "summary": _summary(cfg["summary_bytes"], k),
+        }
+        for k in range(first + cfg["items"] - 1, first - 1, -1)
+    ]
+
+
+def render(cfg: Dict[str, Any], feed: int, generation: int, base: datetime) -> bytes:
+    """피드 본문 (RSS 2.0 또는 Atom)"""
+    items = _items(cfg, feed, generation, base)
+    updated = items[0]["published"] if items else base
+    atom = feed < cfg["feeds"] * cfg["atom_ratio"]
+    if atom:
+        entries = "".join(
+            f'<entry><title>{it["title"]}</title><id>{it["id"]}</id><link href="{it["link"]}"/>'
+            f'<published>{it["published"].isoformat()}</published><updated>{it["published"].isoformat()}</updated>'
+            f'<author><name>Author {feed}</name></author>'
+            f'<summary type="html">{html.escape(it["summary"])}</summary></entry>'
+            for it in items
+        )
+        body = (
+            f'<?xml version="1.0" encoding="utf-8"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            f'<title>Bench Feed {feed}</title><id>urn:bench:{feed}</id><updated>{updated.isoformat()}</updated>'
+            f'<link href="https://site{feed % _DOMAINS}.example/"/>{entries}</feed>'
+        )
+    else:
+        entries = "".join(
+            f'<item><title>{it["title"]}</title><link>{it["link"]}</link>'
+            f'<guid isPermaLink="false">{it["id"]}</guid><pubDate>{format_datetime(it["published"])}</pubDate>'
+            f'<description>{html.escape(it["summary"])}</description></item>'
+            for it in items
+        )
+        body = (
+            f'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            f'<title>Bench Feed {feed}</title><link>https://site{feed % _DOMAINS}.example/</link>'
+            f'<description>synthetic</description>{entries}</channel></rss>'
+        )
+    return body.encode("utf-8")
+
+
+def _serve(cfg: Dict[str, Any], port_q, generation, counters) -> None:
+    base = datetime.now(timezone.utc).replace(microsecond=0) - timedelta(hours=cfg["age_hours"])
+    cache: Dict[Any, bytes] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def _count(self, idx: int) -> None:
+            with counters.get_lock():
+                counters[idx] += 1
+
+        def do_GET(self):
+            self._count(_REQUESTS)
+            if cfg["latency_ms"]:
+                time.sleep(cfg["latency_ms"] / 1000)
+            m = _path_re.match(self.path)
+            if not m or int(m.group(1)) >= cfg["feeds"]:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            feed, gen = int(m.group(1)), generation.value
+            headers = {"Content-Type": "application/atom+xml" if feed < cfg["feeds"] * cfg["atom_ratio"]
+                       else "application/rss+xml"}
+            if cfg["etag"] != "none":
+                version = gen if cfg["etag"] == "changing" else 0
+                etag = f'"{feed}-{version}"'
+                headers["ETag"] = etag
+                headers["Last-Modified"] = format_datetime(base + timedelta(minutes=version), usegmt=True)
+                if self.headers.get("If-None-Match") == etag:
+                    self._count(_NOT_MODIFIED)
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+            key = (feed, gen if cfg["etag"] == "changing" else 0)
+            body = cache.get(key)
+            if body is None:
+                body = cache[key] = render(cfg, feed, key[1], base)
+            self._count(_OK)
+            self.send_response(200)
+            for k, v in headers.items():
+                self.send_header(k, v)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", cfg["port"]), Handler)
+    server.daemon_threads = True
+    port_q.put(server.server_address[1])
+    server.serve_forever()
+
+
+class FeedServer:
+    """별도 프로세스의 합성 피드 서버"""
+
+    def __init__(
+        self,
+        feeds: int = 100,
+        items: int = 50,
+        summary_bytes: int = 1000,
+        latency_ms: float = 0,
+        etag: str = "static",
+        new_items: int = 5,
+        atom_ratio: float = 0.5,
+        age_hours: float = 12,
+        port: int = 0,
+    ):
+        if etag not in ETAG_MODES:
+            raise ValueError(f"지원하지 않는 etag 모드: {etag} (가능: {', '.join(ETAG_MODES)})")
+        self.cfg = {
+            "feeds": feeds, "items": items, "summary_bytes": summary_bytes, "latency_ms": latency_ms,
+            "etag": etag, "new_items": new_items, "atom_ratio": atom_ratio, "age_hours": age_hours, "port": port,
+        }
+        self._generation = mp.Value("i", 0)
+        self._counters = mp.Array("q", 3)
+        self._proc = None
+        self.port = None
+
+    def start(self) -> "FeedServer":
+        port_q = mp.Queue()
+        self._proc = mp.Process(
+            target=_serve, args=(self.cfg, port_q, self._generation, self._counters), daemon=True
+        )
+        self._proc.start()
+        self.port = port_q.get(timeout=30)
+        return self
+
+    def stop(self) -> None:
+        if self._proc is not None:
+            self._proc.terminate()
+            self._proc.join(timeout=5)
+            self._proc = None
+
+    def __enter__(self) -> "FeedServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def urls(self) -> List[str]:
+        return [f"http://127.0.0.1:{self.port}/feed/{i}.xml" for i in range(self.cfg["feeds"])]
+
+    def next_round(self) -> None:
+        """changing 모드: 모든 피드에 새 항목 추가 + ETag 변경"""
+        with self._generation.get_lock():
+            self._generation.value += 1
+
+    def counters(self) -> Dict[str, int]:
+        with self._counters.get_lock():
+            c = list(self._counters)
+        return {"requests": c[_REQUESTS], "ok": c[_OK], "not_modified": c[_NOT_MODIFIED]}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--feeds", type=int, default=100, help="피드 수")
+    ap.add_argument("--items", type=int, default=50, help="피드당 항목 수")
+    ap.add_argument("--summary-bytes", type=int, default=1000, help="항목 본문 크기")
+    ap.add_argument("--latency-ms", type=float, default=0, help="응답 지연(ms)")
+    ap.add_argument("--etag", choices=ETAG_MODES, default="static", help="검증자(ETag) 동작")
+    ap.add_argument("--port", type=int, default=8099, help="포트 (0이면 임의)")
+    args = ap.parse_args()
+
+    with FeedServer(args.feeds, args.items, args.summary_bytes, args.latency_ms, args.etag, port=args.port) as s:
+        print(f"http://127.0.0.1:{s.port}/feed/0.xml ~ /feed/{args.feeds - 1}.xml (Ctrl+C로 종료)")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# benchmarks/local_mongo.py
+"""벤치마크용 로컬 MongoDB
+
+- uri를 주면 로컬 mongod에 임시 DB(redfin_bench_<pid>)를 만들어 쓰고 끝나면 삭제
+- 없으면 mongomock(인메모리, 선택 의존성)으로 대체 — 서버/네트워크 없이 실행되지만
+  절대 시간은 실제 서버와 다르므로 같은 방식으로 잰 결과끼리만 비교
+
+MongoManager(동기)와 AsyncMongoManager(API 읽기 경로)의 클라이언트/DB를 바꿔 끼우므로
+저장소/서비스 코드는 그대로 사용합니다. mongomock은 async API가 없어 얇은 어댑터로 감싸며,
+호출이 이벤트 루프 안에서 동기로 실행되므로 동시 요청 결과는 실제 서버보다 보수적입니다.
+"""
+import inspect
+import os
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+
+def _mongomock_client():
+    """mongomock 클라이언트 (pymongo 4.11+가 bulk 작업에 넘기는 sort 인자를 무시하도록 보정)"""
+    try:
+        import mongomock
+        from mongomock import collection as mc
+    except ImportError:
+        raise SystemExit("mongomock이 필요합니다: pip install mongomock (또는 --mongo-uri로 로컬 mongod 사용)")
+    for name in ("add_update", "add_replace"):
+        orig = getattr(mc.BulkOperationBuilder, name)
+        if "sort" not in inspect.signature(orig).parameters:
+            def patched(self, *args, sort=None, _orig=orig, **kwargs):
+                return _orig(self, *args, **kwargs)
+            setattr(mc.BulkOperationBuilder, name, patched)
+    return mongomock.MongoClient()
+
+
+class _AsyncCursor:
+    """mongomock 커서 → pymongo AsyncCursor 형태 (sort/skip/limit/to_list/async for)"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def sort(self, *args, **kwargs):
+        self._cursor = self._cursor.sort(*args, **kwargs)
+        return self
+
+    def skip(self, n):
+        self._cursor = self._cursor.skip(n)
+        return self
+
+    def limit(self, n):
+        self._cursor = self._cursor.limit(n)
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._cursor)
+
+    def __aiter__(self):
+        self._it = iter(self._cursor)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._it)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _AsyncCollection:
+    """mongomock 컬렉션 → AsyncCollection 형태 (find는 커서, 나머지는 코루틴)"""
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def find(self, *args, **kwargs):
+        return _AsyncCursor(self._collection.find(*args, **kwargs))
+
+    async def aggregate(self, pipeline, **kwargs):
+        return _AsyncCursor(self._collection.aggregate(pipeline))
+
+    def __getattr__(self, name):
+        method = getattr(self._collection, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+
+class _AsyncDatabase:
+    def __init__(self, db):
+        self._db = db
+
+    def __getitem__(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+@contextmanager
+def local_mongo(uri: Optional[str] = None) -> Iterator[str]:
+    """벤치마크 동안 MongoManager를 로컬 DB로 교체. 사용한 방식("mongod" | "mongomock") 반환"""
+    from backend.core.database import AsyncMongoManager, MongoManager, client_options
+
+    if uri:
+        from pymongo import AsyncMongoClient, MongoClient
+        client = MongoClient(uri, **client_options())
+        name, kind = f"redfin_bench_{os.getpid()}", "mongod"
+        # 첫 사용 시점의 이벤트 루프에 바인딩됨 (API 서버 루프)
+        AsyncMongoManager._client = AsyncMongoClient(uri, connect=False, **client_options())
+        AsyncMongoManager._db = AsyncMongoManager._client[name]
+    else:
+        client = _mongomock_client()
+        name, kind = "redfin_bench", "mongomock"
+        AsyncMongoManager._db = _AsyncDatabase(client[name])
+    MongoManager._client, MongoManager._db = client, client[name]
+    try:
+        yield kind
+    finally:
+        if uri:
+            client.drop_database(name)
+        client.close()
+        MongoManager._client = MongoManager._db = None
+        AsyncMongoManager._client = AsyncMongoManager._db = None
@@ -25,7 +25,7 @@ with DAG(
     update = SimpleHttpOperator(
         task_id="update",
         http_conn_id="rss_api",
-        endpoint="/update",
+        endpoint="/update?trigger=dag",  # crawl_runs에 DAG 실행으로 기록
         method="POST",
     )
 
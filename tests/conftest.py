@@ -0,0 +1,13 @@
+# tests/conftest.py
+"""공용 픽스처"""
+import pytest
+
+
+@pytest.fixture
+def mongo():
+    """mongomock(선택 의존성)으로 MongoManager/AsyncMongoManager 교체"""
+    pytest.importorskip("mongomock")
+    from benchmarks.local_mongo import local_mongo
+
+    with local_mongo() as kind:
+        yield kind
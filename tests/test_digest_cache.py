@@ -0,0 +1,35 @@
+# tests/test_digest_cache.py
+"""요약 입력 캐시 — 기간 내 건수가 같아도 엔트리가 갱신되면 다시 생성"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from backend.services.digest_service import DigestService
+
+DAY = date(2026, 10, 1)
+
+
+@pytest.fixture
+def service(mongo):
+    svc = DigestService()
+    start, _ = svc.period_window("day", DAY)
+    mirrored = datetime(2026, 10, 2, tzinfo=timezone.utc)
+    svc.entry_repo.collection.insert_many([
+        {"_id": f"e{i}", "title": f"title {i}", "summary": "body", "domain": "a.example",
+         "feed_url": "https://a.example/feed", "published": start + timedelta(hours=i), "mirrored_at": mirrored}
+        for i in range(3)
+    ])
+    return svc
+
+
+def test_same_count_update_rebuilds(service):
+    scope = service.make_scope()
+    assert service.build_input(scope, "day", DAY)["cached"] is False
+    assert service.build_input(scope, "day", DAY)["cached"] is True
+
+    service.entry_repo.collection.update_one(
+        {"_id": "e1"}, {"$set": {"title": "edited", "mirrored_at": datetime(2026, 10, 3, tzinfo=timezone.utc)}})
+    batch = service.build_input(scope, "day", DAY)
+    assert batch["cached"] is False and batch["entry_count"] == 3
+    assert "edited" in [it["title"] for it in batch["items"]]
+    assert service.build_input(scope, "day", DAY)["cached"] is True
@@ -0,0 +1,80 @@
+# tests/test_discovery.py
+"""find_head_feed_links — 로컬 HTTP 서버로 <head> 스트리밍 파싱 확인"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from backend.utils.discovery import find_head_feed_links
+
+_LINK = b'<link rel="alternate" type="application/rss+xml" href="/feed.xml">'
+PAGES = {
+    "/withhead": b"<html><head>" + _LINK + b"</head><body>" + b"x" * 1000 + b"</body></html>",
+    # </head> 없이 본문 끝까지 읽히는 작은 페이지
+    "/nohead": b"<html>" + _LINK + b"<body>hello</body></html>",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        body = PAGES.get(self.path)
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body or b"")))
+        self.end_headers()
+        self.wfile.write(body or b"")
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("path", ["/withhead", "/nohead"])
+def test_find_head_feed_links(base_url, path):
+    assert find_head_feed_links(base_url + path) == [f"{base_url}/feed.xml"]
+
+
+@pytest.fixture
+def service(mongo, tmp_path, monkeypatch):
+    from backend.services import reader_service
+    from backend.services.feed_service import FeedService
+
+    monkeypatch.setattr(reader_service, "RSS_DB_PATH", str(tmp_path / "rss.sqlite"))
+    reader_service.ReaderService.close()
+    yield FeedService()
+    reader_service.ReaderService.close()
+
+
+def test_discover_many_error_and_budget(service, monkeypatch):
+    import time
+
+    from backend.utils import discovery
+
+    def fake(url, top_k):
+        if "broken" in url:
+            raise ValueError("boom")
+        time.sleep(0.5)
+        return []
+
+    monkeypatch.setattr(discovery, "discover_rss_feeds", fake)
+    # 캐시 조회가 예산의 대부분을 씀 → 남은 예산 안에 느린 타깃은 끝나지 않음
+    get_many = service.cache_repo.get_many
+    monkeypatch.setattr(service.cache_repo, "get_many", lambda urls: (time.sleep(0.3), get_many(urls))[1])
+
+    res = service.discover_many(["https://broken.example/", "https://slow.example/"], validate=False, budget_sec=0.4)
+    by_url = {r["source_url"]: r for r in res["results"]}
+    assert by_url["https://broken.example/"]["status"] == "error"
+    assert by_url["https://broken.example/"]["error"] == "boom"
+    assert by_url["https://slow.example/"]["status"] == "timeout"
+    assert res["elapsed_sec"] < 0.5
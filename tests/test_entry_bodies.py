@@ -0,0 +1,67 @@
+# tests/test_entry_bodies.py
+"""compact 저장 — 본문 쓰기 실패와 작아진 엔트리의 본문 정리"""
+import pytest
+
+from backend.core.config import ENTRY_SUMMARY_INLINE_MAX
+from backend.repositories import entry_repo as entry_repo_module
+from backend.repositories.bulk import AdaptiveBulkWriter
+from backend.repositories.entry_repo import ENTRY_BODIES_COLLECTION, EntryRepository
+
+LONG = "<p>" + "x" * (ENTRY_SUMMARY_INLINE_MAX + 100) + "</p>"
+
+
+@pytest.fixture
+def repo(mongo, monkeypatch):
+    monkeypatch.setattr(entry_repo_module, "ENTRY_STORAGE_MODE", "compact")
+    return EntryRepository()
+
+
+def _entry(id, summary, authors=None):
+    return {"_id": id, "title": id, "feed_url": "https://a.example/feed", "summary": summary, "authors": authors or []}
+
+
+def test_shrunk_entry_drops_stale_body(repo):
+    repo.upsert_many([_entry("e1", LONG), _entry("e2", LONG)])
+    assert repo.bodies.count_documents({}) == 2
+
+    repo.upsert_many([_entry("e1", "short"), _entry("e2", LONG)])
+    doc = repo.find_by_id("e1")
+    assert doc["has_body"] is False and doc["summary"] == "short"
+    assert [b["_id"] for b in repo.bodies.find({})] == ["e2"]
+    assert repo.last_bulk["bodies_deleted"] == 1
+
+
+def test_body_failure_skips_entry(repo, monkeypatch):
+    repo.upsert_many([_entry("e1", "short")])
+    write = AdaptiveBulkWriter.write
+
+    def failing(self, ops, sizes):
+        report = write(self, ops, sizes)
+        if self.name == ENTRY_BODIES_COLLECTION:
+            report.update(failed=1, failed_index=[0], errors=["boom"])
+        return report
+
+    monkeypatch.setattr(AdaptiveBulkWriter, "write", failing)
+    repo.upsert_many([_entry("e1", LONG), _entry("e2", "short"), _entry("e3", LONG)])
+
+    bulk = repo.last_bulk
+    assert (bulk["failed"], bulk["failed_index"], bulk["errors"]) == (1, [0], ["boom"])
+    assert bulk["bodies"]["failed"] == 1
+    # 본문 쓰기에 실패한 e1은 이전 상태 그대로
+    assert repo.find_by_id("e1")["summary"] == "short"
+    assert repo.find_by_id("e2") is not None and repo.find_by_id("e3")["has_body"] is True
+
+
+def test_compact_existing_counts_failures(repo, monkeypatch):
+    repo.collection.insert_many([_entry("e1", LONG), _entry("e2", "short")])
+    write = AdaptiveBulkWriter.write
+
+    def failing(self, ops, sizes):
+        report = write(self, ops, sizes)
+        if self.name == ENTRY_BODIES_COLLECTION:
+            report.update(failed=1, failed_index=[0])
+        return report
+
+    monkeypatch.setattr(AdaptiveBulkWriter, "write", failing)
+    assert repo.compact_existing() == {"converted": 1, "bodies": 0, "failed": 1}
+    assert "preview" not in repo.find_by_id("e1")
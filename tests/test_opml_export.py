@@ -0,0 +1,47 @@
+# tests/test_opml_export.py
+"""OPML 내보내기 캐시 파일 — 동시 첫 렌더링과 스트리밍 중 정리"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.api import responses
+from backend.api.responses import cached_file_response
+from backend.services import feed_service as fs_module
+from backend.services.feed_service import FeedService
+
+
+def test_concurrent_first_render(tmp_path, monkeypatch):
+    monkeypatch.setattr(fs_module, "OPML_EXPORT_DIR", str(tmp_path))
+    catalog = [(f"https://f{i}.example/feed", f"feed {i}") for i in range(20000)]
+    service = FeedService.__new__(FeedService)  # 저장소 없이 렌더링 경로만 사용
+    barrier = threading.Barrier(4)
+
+    def render(_):
+        barrier.wait()
+        return service.export_opml_file()
+
+    monkeypatch.setattr(FeedService, "_export_catalog", lambda self: catalog)
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(render, range(4)))
+
+    assert len({etag for etag, _ in results}) == 1
+    path = results[0][1]
+    assert path.read_text(encoding="utf-8").rstrip().endswith("</opml>")
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]  # 임시 파일이 남지 않음
+
+
+def _consume(response) -> bytes:
+    async def run():
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return asyncio.run(run())
+
+
+def test_stream_survives_unlink(tmp_path, monkeypatch):
+    monkeypatch.setattr(responses, "FILE_CHUNK_SIZE", 16)
+    path = tmp_path / "feeds_x.opml"
+    body = b"<opml>" + b"x" * 1000 + b"</opml>"
+    path.write_bytes(body)
+
+    response = cached_file_response(None, path, "text/x-opml", "x")
+    path.unlink()  # 다른 요청의 이전 지문 정리
+    assert _consume(response) == body
@@ -0,0 +1,43 @@
+# tests/test_query_archive.py
+"""/entries 아카이브 병합 — 조건 없는 목록은 롤업 건수 사용"""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from backend.repositories.archive_repo import EntryArchiveRepository
+from backend.repositories.entry_repo import EntryRepository
+from backend.services.query_service import QueryService
+
+NOW = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def _docs(prefix, start, n, feed="https://a.example/feed"):
+    return [{"_id": f"{prefix}{i}", "feed_url": feed, "title": f"{prefix}{i}",
+             "published": start - timedelta(hours=i)} for i in range(n)]
+
+
+@pytest.fixture
+def service(mongo):
+    EntryRepository().collection.insert_many(_docs("hot", NOW, 3))
+    archive = EntryArchiveRepository()
+    archive.collection.insert_many(_docs("old", NOW - timedelta(days=60), 4)
+                                   + _docs("other", NOW - timedelta(days=60), 2, feed="https://b.example/feed"))
+    archive.refresh_rollup(NOW - timedelta(days=30))
+    return QueryService()
+
+
+def test_unfiltered_list_uses_rollup_total(service, monkeypatch):
+    async def no_count(query):
+        raise AssertionError("archive count_documents 실행됨")
+
+    monkeypatch.setattr(service.archive_repo, "count", no_count)
+    res = asyncio.run(service.list_entries(limit=5))
+    assert res["total"] == 9
+    assert [e["id"] for e in res["entries"]] == ["hot0", "hot1", "hot2", "old0", "other0"]
+
+
+def test_filtered_list_counts_archive(service):
+    res = asyncio.run(service.list_entries(feed_url="https://b.example/feed", limit=5))
+    assert res["total"] == 2
+    assert [e["id"] for e in res["entries"]] == ["other0", "other1"]
@@ -0,0 +1,64 @@
+# tests/test_sync_state.py
+"""동기화 생략 판정 — 입력 파일 지문과 대상 피드 버전"""
+import os
+
+import pytest
+
+from backend.services import feed_service as fs_module
+from backend.services.feed_service import FeedService
+from backend.utils.fingerprint import fingerprint_files
+
+
+def _write_yaml(path, urls):
+    path.write_text("feeds:\n" + "".join(f"  - url: {u}\n" for u in urls), encoding="utf-8")
+
+
+def test_fingerprint_touch_only(tmp_path):
+    f = tmp_path / "feeds.yaml"
+    f.write_text("a", encoding="utf-8")
+    first, _ = fingerprint_files({"feeds_yaml": f})
+    os.utime(f, ns=(first["feeds_yaml"][0] + 10**9,) * 2)
+    second, same = fingerprint_files({"feeds_yaml": f}, first)
+    assert same and second["feeds_yaml"][2] == first["feeds_yaml"][2]
+    assert second["feeds_yaml"][0] != first["feeds_yaml"][0]
+
+    f.write_text("b", encoding="utf-8")  # 크기는 같고 내용만 바뀜
+    _, same = fingerprint_files({"feeds_yaml": f}, second)
+    assert not same
+
+
+def test_fingerprint_missing_file(tmp_path):
+    prints, same = fingerprint_files({"opml": tmp_path / "none.opml"}, {"opml": None})
+    assert prints == {"opml": None} and same
+
+
+@pytest.fixture
+def service(mongo, tmp_path, monkeypatch):
+    monkeypatch.setattr(fs_module, "FEEDS_PATH", tmp_path / "feeds.yaml")
+    monkeypatch.setattr(fs_module, "OPML_PATH", tmp_path / "none.opml")
+    _write_yaml(tmp_path / "feeds.yaml", ["https://a.example/feed", "https://b.example/feed"])
+    return FeedService()
+
+
+def test_sync_skips_when_unchanged(service, tmp_path):
+    assert service.sync_feeds_to_mongo(delete_missing=True)["added"] == 2
+    assert service.sync_feeds_to_mongo(delete_missing=True)["unchanged"]
+
+    # 내용은 그대로, mtime만 바뀜 → 여전히 생략
+    st = (tmp_path / "feeds.yaml").stat()
+    os.utime(tmp_path / "feeds.yaml", ns=(st.st_mtime_ns + 10**9,) * 2)
+    assert service.sync_feeds_to_mongo(delete_missing=True)["unchanged"]
+
+
+def test_sync_detects_same_count_add_and_remove(service):
+    service.sync_feeds_to_mongo(delete_missing=True)
+    service.remove_feed("https://a.example/feed")
+    service.add_feed("https://z.example/feed", validate=False)
+    assert service.feed_repo.count() == 2
+
+    res = service.sync_feeds_to_mongo(delete_missing=True)
+    assert not res["unchanged"]
+    assert (res["added"], res["deleted"]) == (1, 1)
+    assert sorted(service.feed_repo.list_ids()) == ["https://a.example/feed", "https://b.example/feed"]
+    # 이번 적용이 올린 버전이 저장돼 다음 호출은 생략
+    assert service.sync_feeds_to_mongo(delete_missing=True)["unchanged"]